@@ -271,6 +271,14 @@ class Developer(Employee):
         self.__seniority_level = seniority_level
         super().__init__(id, name, department, base_salary, skip_validation)
 
+    @property
+    def tech_stack(self):
+        return self.__tech_stack
+
+    @property
+    def seniority_level(self):
+        return self.__seniority_level
+
     def calculate_salary(self):
         if self.__seniority_level == "junior":
             return self.base_salary
@@ -316,6 +324,15 @@ class Saleperson(Employee):
         self.__commission_rate = commission_rate
         self.__sales_volume = sales_volume
         super().__init__(id, name, department, base_salary, skip_validation)
+
+    @property
+    def commission_rate(self):
+        return self.__commission_rate
+
+    @property
+    def sales_volume(self):
+        return self.__sales_volume
+
     def calculate_salary(self):
         return self.base_salary + (self.__commission_rate * self.__sales_volume)
 
@@ -685,6 +702,22 @@ class Project:
         self.status = status
         self.__team = team
         self.__valid_statuses = ["planning", "active", "completed", "cancelled"]
+
+    @property
+    def deadline(self):
+        return self.__deadline
+
+    @deadline.setter
+    def deadline(self, deadline):
+        """Дедлайн хранится строкой и заранее разобранным порядковым днем"""
+        Validator.validate_date(deadline)
+        self.__deadline = deadline
+        self.__deadline_ordinal = datetime.strptime(deadline, "%Y-%m-%d").toordinal()
+
+    @property
+    def deadline_ordinal(self) -> int:
+        """Дедлайн как порядковый номер дня (date.toordinal)"""
+        return self.__deadline_ordinal
         
     def add_team_member(self, employee: AbstractEmployee) -> None:
         #if any(emp.id == employee.id for emp in self.__team):
@@ -954,18 +987,24 @@ class Company:
         
         return stats
     
-    def get_project_budget_analysis(self) -> Dict[str, Dict]:
-        """Анализ бюджетов и эффективности проектов"""
+    def get_project_budget_analysis(self, as_of=None) -> Dict[str, Dict]:
+        """Анализ бюджетов и эффективности проектов
+
+        Args:
+            as_of: Момент расчета сроков (datetime, date или YYYY-MM-DD);
+                по умолчанию текущее время, снятое один раз на весь отчет
+        """
         analysis = {}
+        days_left = self._days_until_deadlines(self.__projects, as_of)
         
-        for project in self.__projects:
+        for project, days_until_deadline in zip(self.__projects, days_left):
             project_analysis = {
                 'name': project.name,
                 'status': project.status,
                 'team_size': project.get_team_size(),
                 'total_salary_cost': project.calculate_total_salary(),
                 'deadline': project.deadline,
-                'days_until_deadline': self._days_until_date(project.deadline),
+                'days_until_deadline': days_until_deadline,
                 'team_composition': {},
                 'cost_per_member': 0,
                 'efficiency_score': 0
@@ -1013,15 +1052,34 @@ class Company:
         
         return analysis
     
-    def _days_until_date(self, date_str: str) -> int:
-        """Рассчитывает количество дней до указанной даты"""
-        try:
-            target_date = datetime.strptime(date_str, "%Y-%m-%d")
-            current_date = datetime.now()
-            return (target_date - current_date).days
-        except ValueError:
-            return 9999  # Большое число для некорректных дат
-    
+    @staticmethod
+    def _as_of_moment(as_of=None) -> datetime:
+        """Момент отчета: datetime, date (полночь), YYYY-MM-DD или None (сейчас)"""
+        if as_of is None:
+            return datetime.now()
+        if isinstance(as_of, str):
+            Validator.validate_date(as_of)
+            return datetime.strptime(as_of, "%Y-%m-%d")
+        if not isinstance(as_of, datetime):
+            return datetime.combine(as_of, datetime.min.time())
+        return as_of
+
+    @classmethod
+    def _reference_ordinal(cls, as_of=None) -> int:
+        """Порядковый день, от которого отсчитываются сроки
+
+        Разница (дедлайн - момент).days округляется вниз, поэтому если
+        момент позже полуночи, до любого дедлайна остается на день меньше.
+        """
+        as_of = cls._as_of_moment(as_of)
+        past_midnight = as_of.time() != datetime.min.time()
+        return as_of.toordinal() + (1 if past_midnight else 0)
+
+    def _days_until_deadlines(self, projects, as_of=None) -> List[int]:
+        """Дней до дедлайна для всех проектов при одном снимке времени"""
+        reference = self._reference_ordinal(as_of)
+        return [project.deadline_ordinal - reference for project in projects]
+
     def find_overloaded_employees(self, max_projects: int = 2) -> List[AbstractEmployee]:
         """Находит сотрудников, участвующих в слишком многих проектах"""
         employee_project_count = {}
@@ -1394,6 +1452,32 @@ class Company:
             print(f"Ошибка при загрузке компании из файла '{filename}': {e}")
             return cls("Новая компания")
     
+    CSV_BATCH_SIZE = 10000
+
+    def _employee_project_names(self) -> Dict[int, List[str]]:
+        """Названия проектов каждого сотрудника за один проход по командам"""
+        project_names = {}
+        for project in self.__projects:
+            for employee_id in {emp.id for emp in project._Project__team}:
+                project_names.setdefault(employee_id, []).append(project.name)
+        return project_names
+
+    @staticmethod
+    def _details_formatter(employee_class):
+        """Функция форматирования дополнительных параметров для типа сотрудника"""
+        if issubclass(employee_class, Manager):
+            return lambda employee: f"Бонус: {employee.bonus}"
+        if issubclass(employee_class, Developer):
+            return lambda employee: (
+                f"Уровень: {employee.seniority_level}, "
+                f"Технологии: {', '.join(employee.tech_stack)}"
+            )
+        if issubclass(employee_class, Saleperson):
+            return lambda employee: (
+                f"Комиссия: {employee.commission_rate}, Продажи: {employee.sales_volume}"
+            )
+        return lambda employee: ""
+
     def export_employees_csv(self, filename: str) -> None:
         """Экспортирует данные о сотрудниках в CSV файл"""
         try:
@@ -1406,33 +1490,32 @@ class Company:
                     'Дополнительные параметры', 'Итоговая зарплата', 'Участвует в проектах'
                 ])
                 
-                # Данные
+                # Участие в проектах и форматтеры типов готовятся один раз
+                project_names = self._employee_project_names()
+                formatters = {}
+                rows = []
                 for department in self.__departments:
                     for employee in department.get_employees():
-                        # Определяем дополнительные параметры в зависимости от типа
-                        additional_info = ""
-                        if isinstance(employee, Manager):
-                            additional_info = f"Бонус: {employee.bonus}"
-                        elif isinstance(employee, Developer):
-                            tech_stack = ', '.join(employee._Developer__tech_stack)
-                            additional_info = f"Уровень: {employee._Developer__seniority_level}, Технологии: {tech_stack}"
-                        elif isinstance(employee, Saleperson):
-                            additional_info = f"Комиссия: {employee._Saleperson__commission_rate}, Продажи: {employee._Saleperson__sales_volume}"
+                        employee_class = employee.__class__
+                        formatter = formatters.get(employee_class)
+                        if formatter is None:
+                            formatter = formatters[employee_class] = self._details_formatter(employee_class)
+                        names = project_names.get(employee.id)
                         
-                        # Определяем участие в проектах
-                        project_names = self.get_employee_projects(employee.id)
-                        projects_info = ', '.join(project_names) if project_names else "Нет"
-                        
-                        writer.writerow([
+                        rows.append([
                             employee.id,
                             employee.name,
                             employee.department,
-                            employee.__class__.__name__,
+                            employee_class.__name__,
                             f"{employee.base_salary:.2f}",
-                            additional_info,
+                            formatter(employee),
                             f"{employee.calculate_salary():.2f}",
-                            projects_info
+                            ', '.join(names) if names else "Нет"
                         ])
+                        if len(rows) >= self.CSV_BATCH_SIZE:
+                            writer.writerows(rows)
+                            rows.clear()
+                writer.writerows(rows)
             
             print(f"Данные о сотрудниках экспортированы в '{filename}'")
             print(f"Экспортировано {sum(len(dept) for dept in self.__departments)} сотрудников")
@@ -1440,8 +1523,12 @@ class Company:
         except Exception as e:
             print(f"Ошибка при экспорте сотрудников в CSV '{filename}': {e}")
     
-    def export_projects_csv(self, filename: str) -> None:
-        """Экспортирует данные о проектах в CSV файл"""
+    def export_projects_csv(self, filename: str, as_of=None) -> None:
+        """Экспортирует данные о проектах в CSV файл
+
+        Сроки всех проектов считаются от одного момента as_of
+        (по умолчанию текущее время на начало экспорта).
+        """
         try:
             with open(filename, 'w', newline='', encoding='utf-8') as file:
                 writer = csv.writer(file)
@@ -1453,9 +1540,9 @@ class Company:
                 ])
                 
                 # Данные
-                for project in self.__projects:
+                days_left = self._days_until_deadlines(self.__projects, as_of)
+                for project, days_until_deadline in zip(self.__projects, days_left):
                     team_members = ", ".join([emp.name for emp in project._Project__team])
-                    days_until_deadline = self._days_until_date(project.deadline)
                     
                     writer.writerow([
                         project.project_id,
@@ -1475,14 +1562,20 @@ class Company:
         except Exception as e:
             print(f"Ошибка при экспорте проектов в CSV '{filename}': {e}")
     
-    def generate_financial_report(self, filename: str) -> None:
-        """Генерирует текстовый финансовый отчет компании"""
+    def generate_financial_report(self, filename: str, as_of=None) -> None:
+        """Генерирует текстовый финансовый отчет компании
+
+        Args:
+            as_of: Момент отчета (datetime, date или YYYY-MM-DD);
+                по умолчанию текущее время
+        """
+        as_of = self._as_of_moment(as_of)
         try:
             with open(filename, 'w', encoding='utf-8') as file:
                 file.write(f"ФИНАНСОВЫЙ ОТЧЕТ КОМПАНИИ '{self.name}'\n")
                 file.write("=" * 60 + "\n\n")
                 
-                file.write(f"Дата формирования: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+                file.write(f"Дата формирования: {as_of.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
                 
                 # Общая статистика
                 total_employees = sum(len(dept) for dept in self.__departments)
@@ -1519,11 +1612,10 @@ class Company:
                 file.write("\nСТАТИСТИКА ПО ПРОЕКТАМ:\n")
                 file.write("-" * 40 + "\n")
                 
-                project_analysis = self.get_project_budget_analysis()
-                active_cost = sum(p['total_salary_cost'] for p in project_analysis.values() 
-                                if not p.get('project_id', '').startswith('_') and p['status'] == 'active')
-                planning_cost = sum(p['total_salary_cost'] for p in project_analysis.values() 
-                                  if not p.get('project_id', '').startswith('_') and p['status'] == 'planning')
+                project_analysis = self.get_project_budget_analysis(as_of)
+                project_stats = [p for key, p in project_analysis.items() if not key.startswith('_')]
+                active_cost = sum(p['total_salary_cost'] for p in project_stats if p['status'] == 'active')
+                planning_cost = sum(p['total_salary_cost'] for p in project_stats if p['status'] == 'planning')
                 
                 file.write(f"\nАктивные проекты: {len([p for p in self.__projects if p.status == 'active'])}\n")
                 file.write(f"Проекты в планировании: {len([p for p in self.__projects if p.status == 'planning'])}\n")
@@ -1571,7 +1663,8 @@ class Company:
     def export_all_reports(self, base_filename: str) -> None:
         """Экспортирует все отчеты компании"""
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            as_of = datetime.now()
+            timestamp = as_of.strftime("%Y%m%d_%H%M%S")
             
             # Сохраняем полные данные компании
             company_file = f"{base_filename}_company_{timestamp}.json"
@@ -1581,11 +1674,11 @@ class Company:
             employees_file = f"{base_filename}_employees_{timestamp}.csv"
             projects_file = f"{base_filename}_projects_{timestamp}.csv"
             self.export_employees_csv(employees_file)
-            self.export_projects_csv(projects_file)
+            self.export_projects_csv(projects_file, as_of)
             
             # Генерируем финансовый отчет
             financial_file = f"{base_filename}_financial_report_{timestamp}.txt"
-            self.generate_financial_report(financial_file)
+            self.generate_financial_report(financial_file, as_of)
             
             # Генерируем отчет по планированию
             planning_file = f"{base_filename}_planning_report_{timestamp}.txt"
@@ -60,11 +60,82 @@ try:
 except ImportError:
     DepartmentNotEmpty = None
 
+try:
+    from source_code.part4 import ChangeEvent
+except ImportError:
+    ChangeEvent = None
+
+try:
+    from source_code.analytics import IncrementalAnalytics
+except ImportError:
+    IncrementalAnalytics = None
+
+try:
+    from source_code.payroll_history import PayrollHistoryStore
+except ImportError:
+    PayrollHistoryStore = None
+
+try:
+    from source_code.sketches import KLLSketch, SalarySketches
+except ImportError:
+    KLLSketch = None
+    SalarySketches = None
+
+try:
+    from source_code.collaboration import CollaborationGraph
+except ImportError:
+    CollaborationGraph = None
+
+try:
+    from source_code.json_stream import StreamingCompanyLoader, load_company_json
+except ImportError:
+    StreamingCompanyLoader = None
+    load_company_json = None
+
+try:
+    from source_code.snapshot import SnapshotFile, save_snapshot, load_snapshot
+except ImportError:
+    SnapshotFile = None
+    save_snapshot = None
+    load_snapshot = None
+
+try:
+    from source_code.lazy_company import LazyCompany
+except ImportError:
+    LazyCompany = None
+
+try:
+    from source_code.archive import CompanyArchive, save_archive
+except ImportError:
+    CompanyArchive = None
+    save_archive = None
+
+try:
+    from source_code.journal import CompanyJournal
+except ImportError:
+    CompanyJournal = None
+
+try:
+    from source_code.shard_store import ShardedCompanyStore
+except ImportError:
+    ShardedCompanyStore = None
+
+try:
+    from source_code.parallel_loader import ParallelCompanyLoader, load_company_files
+except ImportError:
+    ParallelCompanyLoader = None
+    load_company_files = None
+
 try:
     from source_code.sourcecode import DatabaseConnection
 except ImportError:
     DatabaseConnection = None
 
+try:
+    from source_code.sourcecode import ConnectionPool
+except ImportError:
+    ConnectionPool = None
+
 try:
     from source_code.sourcecode import EmployeeBuilder
 except ImportError:
@@ -85,6 +156,39 @@ try:
 except ImportError:
     EmployeeRepository = None
 
+try:
+    from source_code.sourcecode import SqliteEmployeeRepository
+except ImportError:
+    SqliteEmployeeRepository = None
+
+try:
+    from source_code.sourcecode import (
+        EmployeeBatchLoader,
+        EmployeeProxy,
+        LazyDepartment,
+        SqliteProjectRepository,
+    )
+except ImportError:
+    EmployeeBatchLoader = None
+    EmployeeProxy = None
+    LazyDepartment = None
+    SqliteProjectRepository = None
+
+try:
+    from source_code.sourcecode import AsyncEmployeeRepository
+except ImportError:
+    AsyncEmployeeRepository = None
+
+try:
+    from source_code.sourcecode import CachingEmployeeRepository
+except ImportError:
+    CachingEmployeeRepository = None
+
+try:
+    from source_code.sourcecode import CompanySearchIndex
+except ImportError:
+    CompanySearchIndex = None
+
 try:
     from source_code.sourcecode import EmployeeSpecification
 except ImportError:
@@ -104,11 +208,38 @@ __all__ = [
         "Company",
         "InvalidStatusError",
         "DepartmentNotEmpty",
+        "ChangeEvent",
+        "IncrementalAnalytics",
+        "PayrollHistoryStore",
+        "KLLSketch",
+        "SalarySketches",
+        "CollaborationGraph",
+        "StreamingCompanyLoader",
+        "load_company_json",
+        "SnapshotFile",
+        "save_snapshot",
+        "load_snapshot",
+        "LazyCompany",
+        "CompanyArchive",
+        "save_archive",
+        "CompanyJournal",
+        "ShardedCompanyStore",
+        "ParallelCompanyLoader",
+        "load_company_files",
         "DatabaseConnection",
+        "ConnectionPool",
         "EmployeeBuilder",
         "SalaryAdapter",
         "BonusDecorator",
         "EmployeeRepository",
+        "SqliteEmployeeRepository",
+        "SqliteProjectRepository",
+        "EmployeeProxy",
+        "EmployeeBatchLoader",
+        "LazyDepartment",
+        "AsyncEmployeeRepository",
+        "CachingEmployeeRepository",
+        "CompanySearchIndex",
         "EmployeeSpecification",
     ]
     if globals().get(name) is not None
@@ -0,0 +1,295 @@
+"""Инкрементальная аналитика компании по потоку событий ChangeEvent"""
+
+from typing import Dict, Any, Set, Tuple
+
+from source_code.part4 import ChangeEvent, Company, Department, Project, as_of_ordinal
+
+
+class _DepartmentAggregate:
+    """Агрегаты одного отдела"""
+
+    __slots__ = ("name", "employee_count", "total_salary", "employee_types")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.employee_count = 0
+        self.total_salary = 0.0
+        self.employee_types: Dict[str, int] = {}
+
+
+class _ProjectAggregate:
+    """Агрегаты одного проекта"""
+
+    __slots__ = ("status", "deadline", "team_size", "total_salary")
+
+    def __init__(self, status: str, deadline: int):
+        self.status = status
+        self.deadline = deadline
+        self.team_size = 0
+        self.total_salary = 0.0
+
+
+class IncrementalAnalytics:
+    """Аналитика компании, обновляемая по событиям изменений
+
+    При создании один раз строит агрегаты по всей компании и подписывается
+    на её события. Каждое событие правит только агрегаты затронутого отдела
+    или проекта, поэтому стоимость обновления пропорциональна числу
+    изменений, а не размеру компании.
+    """
+
+    def __init__(self, company: Company):
+        self._company = company
+        self._departments: Dict[str, _DepartmentAggregate] = {}
+        self._projects: Dict[int, _ProjectAggregate] = {}
+        # Индексы для применения изменений зарплат
+        self._salaries: Dict[int, float] = {}
+        self._employee_department: Dict[int, str] = {}
+        self._employee_projects: Dict[int, Set[int]] = {}
+        self._status_counts: Dict[str, int] = {}
+        self._total_budget = 0.0
+        self._total_team_size = 0
+        self._changed_departments: Set[str] = set()
+        self._changed_projects: Set[int] = set()
+        self.events_applied = 0
+
+        self._handlers = {
+            ChangeEvent.EMPLOYEE_ADDED: self._on_employee_added,
+            ChangeEvent.EMPLOYEE_REMOVED: self._on_employee_removed,
+            ChangeEvent.TEAM_MEMBER_ADDED: self._on_team_member_added,
+            ChangeEvent.TEAM_MEMBER_REMOVED: self._on_team_member_removed,
+            ChangeEvent.STATUS_CHANGED: self._on_status_changed,
+            ChangeEvent.SALARY_CHANGED: self._on_salary_changed,
+            ChangeEvent.DEPARTMENT_ADDED: self._on_department_added,
+            ChangeEvent.DEPARTMENT_REMOVED: self._on_department_removed,
+            ChangeEvent.PROJECT_ADDED: self._on_project_added,
+            ChangeEvent.PROJECT_REMOVED: self._on_project_removed,
+        }
+
+        for dept in company.get_departments():
+            self._add_department(dept)
+        for proj in company.get_projects():
+            self._add_project(proj)
+        company.add_observer(self)
+
+    def close(self) -> None:
+        """Отписаться от событий компании"""
+        self._company.remove_observer(self)
+
+    # Приём событий
+    def update(self, subject, event: ChangeEvent) -> None:
+        """Применить событие к агрегатам (интерфейс наблюдателя)"""
+        handler = self._handlers.get(event.kind)
+        if handler is not None:
+            handler(event.payload)
+            self.events_applied += 1
+
+    def _on_employee_added(self, payload: dict) -> None:
+        dept = payload["department"]
+        self._add_employee(dept.code, payload["employee"])
+
+    def _on_employee_removed(self, payload: dict) -> None:
+        dept = payload["department"]
+        employee = payload["employee"]
+        aggregate = self._departments.get(dept.code)
+        if aggregate is None:
+            return
+        salary = self._salaries.pop(employee.id, 0.0)
+        self._employee_department.pop(employee.id, None)
+        emp_type = employee.__class__.__name__
+        aggregate.employee_count -= 1
+        aggregate.total_salary -= salary
+        aggregate.employee_types[emp_type] -= 1
+        if aggregate.employee_types[emp_type] == 0:
+            del aggregate.employee_types[emp_type]
+        self._changed_departments.add(dept.code)
+
+    def _on_team_member_added(self, payload: dict) -> None:
+        project = payload["project"]
+        employee = payload["employee"]
+        aggregate = self._projects.get(project.project_id)
+        if aggregate is None:
+            return
+        salary = self._salaries.get(employee.id)
+        if salary is None:
+            salary = employee.calculate_salary()
+        aggregate.team_size += 1
+        aggregate.total_salary += salary
+        self._total_team_size += 1
+        self._total_budget += salary
+        self._employee_projects.setdefault(employee.id, set()).add(project.project_id)
+        self._changed_projects.add(project.project_id)
+
+    def _on_team_member_removed(self, payload: dict) -> None:
+        project = payload["project"]
+        employee = payload["employee"]
+        aggregate = self._projects.get(project.project_id)
+        if aggregate is None:
+            return
+        salary = self._salaries.get(employee.id)
+        if salary is None:
+            salary = employee.calculate_salary()
+        aggregate.team_size -= 1
+        aggregate.total_salary -= salary
+        self._total_team_size -= 1
+        self._total_budget -= salary
+        projects = self._employee_projects.get(employee.id)
+        if projects is not None:
+            projects.discard(project.project_id)
+            if not projects:
+                del self._employee_projects[employee.id]
+        self._changed_projects.add(project.project_id)
+
+    def _on_status_changed(self, payload: dict) -> None:
+        project = payload["project"]
+        aggregate = self._projects.get(project.project_id)
+        if aggregate is None:
+            return
+        self._count_status(payload["old_status"], -1)
+        self._count_status(payload["new_status"], 1)
+        aggregate.status = payload["new_status"]
+        self._changed_projects.add(project.project_id)
+
+    def _on_salary_changed(self, payload: dict) -> None:
+        employee = payload["employee"]
+        new_salary = payload["new_salary"]
+        old_salary = self._salaries.get(employee.id, payload["old_salary"])
+        delta = new_salary - old_salary
+        if employee.id in self._salaries:
+            self._salaries[employee.id] = new_salary
+
+        code = self._employee_department.get(employee.id)
+        if code is not None:
+            self._departments[code].total_salary += delta
+            self._changed_departments.add(code)
+
+        for project_id in self._employee_projects.get(employee.id, ()):
+            self._projects[project_id].total_salary += delta
+            self._total_budget += delta
+            self._changed_projects.add(project_id)
+
+    def _on_department_added(self, payload: dict) -> None:
+        self._add_department(payload["department"])
+
+    def _on_department_removed(self, payload: dict) -> None:
+        code = payload["department"].code
+        self._departments.pop(code, None)
+        self._changed_departments.add(code)
+
+    def _on_project_added(self, payload: dict) -> None:
+        self._add_project(payload["project"])
+
+    def _on_project_removed(self, payload: dict) -> None:
+        project_id = payload["project"].project_id
+        aggregate = self._projects.pop(project_id, None)
+        if aggregate is not None:
+            self._count_status(aggregate.status, -1)
+        self._changed_projects.add(project_id)
+
+    # Построение агрегатов
+    def _add_department(self, department: Department) -> None:
+        self._departments[department.code] = _DepartmentAggregate(department.name)
+        for employee in department:
+            self._add_employee(department.code, employee)
+        self._changed_departments.add(department.code)
+
+    def _add_employee(self, code: str, employee) -> None:
+        aggregate = self._departments.get(code)
+        if aggregate is None:
+            return
+        salary = employee.calculate_salary()
+        self._salaries[employee.id] = salary
+        self._employee_department[employee.id] = code
+        emp_type = employee.__class__.__name__
+        aggregate.employee_count += 1
+        aggregate.total_salary += salary
+        aggregate.employee_types[emp_type] = aggregate.employee_types.get(emp_type, 0) + 1
+        self._changed_departments.add(code)
+
+    def _add_project(self, project: Project) -> None:
+        aggregate = _ProjectAggregate(project.status, project.deadline_ordinal)
+        self._projects[project.project_id] = aggregate
+        self._count_status(project.status, 1)
+        for employee in project.get_team():
+            salary = self._salaries.get(employee.id)
+            if salary is None:
+                salary = employee.calculate_salary()
+            aggregate.team_size += 1
+            aggregate.total_salary += salary
+            self._total_team_size += 1
+            self._total_budget += salary
+            self._employee_projects.setdefault(employee.id, set()).add(
+                project.project_id
+            )
+        self._changed_projects.add(project.project_id)
+
+    def _count_status(self, status: str, delta: int) -> None:
+        count = self._status_counts.get(status, 0) + delta
+        if count:
+            self._status_counts[status] = count
+        else:
+            self._status_counts.pop(status, None)
+
+    # Чтение результатов
+    def get_department_stats(self) -> Dict[str, Any]:
+        """Статистика по отделам в формате Company.get_department_stats"""
+        return {code: self._department_stats(code) for code in self._departments}
+
+    def _department_stats(self, code: str) -> Dict[str, Any]:
+        aggregate = self._departments[code]
+        return {
+            "name": aggregate.name,
+            "employee_count": aggregate.employee_count,
+            "total_salary": aggregate.total_salary,
+            "employee_types": dict(aggregate.employee_types),
+            "avg_salary": aggregate.total_salary / aggregate.employee_count
+            if aggregate.employee_count > 0
+            else 0,
+        }
+
+    def get_project_budget_analysis(self, as_of=None) -> Dict[str, Any]:
+        """Анализ бюджетов в формате Company.get_project_budget_analysis"""
+        reference = as_of_ordinal(as_of)
+        # Просрочка зависит от текущего времени, поэтому считается при чтении
+        overdue = sum(
+            1
+            for aggregate in self._projects.values()
+            if aggregate.status in ("planning", "active") and reference > aggregate.deadline
+        )
+        return {
+            "total_projects": len(self._projects),
+            "by_status": dict(self._status_counts),
+            "total_budget": self._total_budget,
+            "avg_team_size": self._total_team_size / len(self._projects)
+            if self._projects
+            else 0,
+            "overdue_projects": overdue,
+        }
+
+    def drain_changes(self) -> Tuple[Dict[str, Any], Dict[int, Dict[str, Any]]]:
+        """Вернуть статистику только изменившихся отделов и проектов
+
+        Returns:
+            Кортеж (статистика отделов по коду, агрегаты проектов по ID)
+            с момента предыдущего вызова. Удалённые объекты возвращаются
+            со значением None.
+        """
+        departments = {
+            code: self._department_stats(code) if code in self._departments else None
+            for code in self._changed_departments
+        }
+        projects = {}
+        for project_id in self._changed_projects:
+            aggregate = self._projects.get(project_id)
+            projects[project_id] = (
+                {
+                    "status": aggregate.status,
+                    "team_size": aggregate.team_size,
+                    "total_salary": aggregate.total_salary,
+                }
+                if aggregate is not None
+                else None
+            )
+        self._changed_departments.clear()
+        self._changed_projects.clear()
+        return departments, projects
@@ -0,0 +1,182 @@
+"""Сжатый архив компании с независимыми кадрами отделов и проектов"""
+
+import json
+import lzma
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from source_code.part4 import (
+    Company,
+    Department,
+    DepartmentNotFoundError,
+    Project,
+    ProjectNotFoundError,
+)
+
+MAGIC = b"CARC"
+VERSION = 1
+_HEADER = struct.Struct("<4sH")
+# Окончание файла: длина индекса и сигнатура
+_FOOTER = struct.Struct("<Q4s")
+
+
+def _zlib_compress(data: bytes, level: Optional[int]) -> bytes:
+    return zlib.compress(data, 6 if level is None else level)
+
+
+def _lzma_compress(data: bytes, level: Optional[int]) -> bytes:
+    return lzma.compress(data, preset=6 if level is None else level)
+
+
+CODECS = {
+    "zlib": (_zlib_compress, zlib.decompress),
+    "lzma": (_lzma_compress, lzma.decompress),
+}
+
+
+def _encode(data: Any) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def save_archive(
+    company: Company,
+    filename: str,
+    codec: str = "zlib",
+    level: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Сохранить компанию в архив с отдельным сжатым кадром на каждый отдел
+
+    Кадры сжимаются параллельно в пуле потоков (zlib и lzma отпускают
+    GIL во время сжатия), в конце файла записывается индекс кадров.
+
+    Args:
+        company: Компания для сохранения
+        filename: Имя файла архива
+        codec: "zlib" или "lzma"
+        level: Уровень сжатия (по умолчанию 6)
+        workers: Число потоков сжатия (None - по числу процессоров)
+
+    Returns:
+        Dict[str, Any]: Индекс архива
+    """
+    if codec not in CODECS:
+        raise ValueError(f"Неизвестный кодек: {codec}. Допустимые: {', '.join(CODECS)}")
+    compress = CODECS[codec][0]
+
+    departments = company.get_departments()
+    payloads = [_encode(dept.to_dict()) for dept in departments]
+    payloads.append(_encode([proj.to_dict() for proj in company.get_projects()]))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        frames = list(executor.map(lambda data: compress(data, level), payloads))
+
+    index: Dict[str, Any] = {"company": company.name, "codec": codec, "departments": []}
+    with open(filename, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION))
+        for dept, payload, frame in zip(departments, payloads, frames):
+            index["departments"].append(
+                {
+                    "code": dept.code,
+                    "name": dept.name,
+                    "employees": dept.employee_count,
+                    "offset": f.tell(),
+                    "length": len(frame),
+                    "size": len(payload),
+                }
+            )
+            f.write(frame)
+        index["projects"] = {
+            "count": len(company.get_projects()),
+            "offset": f.tell(),
+            "length": len(frames[-1]),
+            "size": len(payloads[-1]),
+        }
+        f.write(frames[-1])
+        index_data = _encode(index)
+        f.write(index_data)
+        f.write(_FOOTER.pack(len(index_data), MAGIC))
+    return index
+
+
+class CompanyArchive:
+    """Чтение архива save_archive
+
+    При открытии читается только индекс в конце файла. Отдел или таблица
+    проектов читаются переходом к смещению своего кадра и распаковкой
+    только этого кадра.
+    """
+
+    def __init__(self, filename: str):
+        self.__filename = filename
+        with open(filename, "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size or _HEADER.unpack(header)[0] != MAGIC:
+                raise ValueError(f"Файл {filename} не является архивом компании")
+            version = _HEADER.unpack(header)[1]
+            if version != VERSION:
+                raise ValueError(f"Неподдерживаемая версия архива: {version}")
+            if f.seek(0, 2) < _HEADER.size + _FOOTER.size:
+                raise ValueError(f"Архив {filename} поврежден: нет индекса")
+            f.seek(-_FOOTER.size, 2)
+            index_length, magic = _FOOTER.unpack(f.read(_FOOTER.size))
+            if magic != MAGIC:
+                raise ValueError(f"Архив {filename} поврежден: нет индекса")
+            f.seek(-_FOOTER.size - index_length, 2)
+            self.__index = json.loads(f.read(index_length).decode("utf-8"))
+        self.__decompress = CODECS[self.__index["codec"]][1]
+        self.__departments = {item["code"]: item for item in self.__index["departments"]}
+
+    @property
+    def company_name(self) -> str:
+        return self.__index["company"]
+
+    @property
+    def codec(self) -> str:
+        return self.__index["codec"]
+
+    def department_codes(self) -> List[str]:
+        """Коды отделов в порядке сохранения"""
+        return list(self.__departments)
+
+    def department_info(self, code: str) -> Dict[str, Any]:
+        """Сведения об отделе из индекса (без распаковки)"""
+        return dict(self._department_entry(code))
+
+    def _department_entry(self, code: str) -> Dict[str, Any]:
+        entry = self.__departments.get(code)
+        if entry is None:
+            raise DepartmentNotFoundError(f"Отдел с кодом {code} отсутствует в архиве")
+        return entry
+
+    def _read_frame(self, entry: Dict[str, Any]) -> Any:
+        with open(self.__filename, "rb") as f:
+            f.seek(entry["offset"])
+            frame = f.read(entry["length"])
+        return json.loads(self.__decompress(frame).decode("utf-8"))
+
+    def read_department(self, code: str) -> Department:
+        """Прочитать один отдел, распаковав только его кадр"""
+        return Department.from_dict(self._read_frame(self._department_entry(code)))
+
+    def read_projects(self) -> List[Dict[str, Any]]:
+        """Таблица проектов (словари Project.to_dict с ID команды)"""
+        return self._read_frame(self.__index["projects"])
+
+    def read_project(self, project_id: int) -> Dict[str, Any]:
+        """Данные одного проекта"""
+        for data in self.read_projects():
+            if data["project_id"] == project_id:
+                return data
+        raise ProjectNotFoundError(f"Проект с ID {project_id} отсутствует в архиве")
+
+    def load(self) -> Company:
+        """Загрузить компанию целиком (как Company.load_from_json)"""
+        company = Company(self.company_name)
+        for entry in self.__index["departments"]:
+            company.add_department(Department.from_dict(self._read_frame(entry), company))
+        for proj_data in self.read_projects():
+            company.add_project(Project.from_dict(proj_data, company))
+        return company
@@ -0,0 +1,292 @@
+"""Граф совместной работы сотрудников по командам проектов"""
+
+from collections import deque
+from typing import Dict, List, Optional, Set
+
+from source_code.part4 import ChangeEvent, Company, Department, Project
+
+
+class CollaborationGraph:
+    """Взвешенный граф "кто с кем работает"
+
+    Вершины - сотрудники, ребро соединяет участников общего проекта,
+    вес ребра - число общих проектов. Граф хранится словарями смежности
+    и обновляется по событиям компании: добавление участника в команду
+    из T человек стоит O(T), а не пересчета всех команд.
+    """
+
+    def __init__(self, company: Optional[Company] = None):
+        self._company = company
+        self._adjacency: Dict[int, Dict[int, int]] = {}
+        self._teams: Dict[int, Set[int]] = {}
+        self._memberships: Dict[int, int] = {}
+        self._staff: Set[int] = set()
+        self._edge_count = 0
+
+        self._handlers = {
+            ChangeEvent.EMPLOYEE_ADDED: self._on_employee_added,
+            ChangeEvent.EMPLOYEE_REMOVED: self._on_employee_removed,
+            ChangeEvent.TEAM_MEMBER_ADDED: self._on_team_member_added,
+            ChangeEvent.TEAM_MEMBER_REMOVED: self._on_team_member_removed,
+            ChangeEvent.DEPARTMENT_ADDED: self._on_department_added,
+            ChangeEvent.DEPARTMENT_REMOVED: self._on_department_removed,
+            ChangeEvent.PROJECT_ADDED: self._on_project_added,
+            ChangeEvent.PROJECT_REMOVED: self._on_project_removed,
+        }
+
+        if company is not None:
+            for dept in company.get_departments():
+                self._add_department(dept)
+            for proj in company.get_projects():
+                self._add_project(proj)
+            company.add_observer(self)
+
+    def close(self) -> None:
+        """Отписаться от событий компании"""
+        if self._company is not None:
+            self._company.remove_observer(self)
+
+    # Приём событий
+    def update(self, subject, event: ChangeEvent) -> None:
+        """Применить событие к графу (интерфейс наблюдателя)"""
+        handler = self._handlers.get(event.kind)
+        if handler is not None:
+            handler(event.payload)
+
+    def _on_employee_added(self, payload: dict) -> None:
+        self.add_employee(payload["employee"].id)
+
+    def _on_employee_removed(self, payload: dict) -> None:
+        self.remove_employee(payload["employee"].id)
+
+    def _on_team_member_added(self, payload: dict) -> None:
+        self.add_team_member(payload["project"].project_id, payload["employee"].id)
+
+    def _on_team_member_removed(self, payload: dict) -> None:
+        self.remove_team_member(payload["project"].project_id, payload["employee"].id)
+
+    def _on_department_added(self, payload: dict) -> None:
+        self._add_department(payload["department"])
+
+    def _on_department_removed(self, payload: dict) -> None:
+        for emp in payload["department"]:
+            self.remove_employee(emp.id)
+
+    def _on_project_added(self, payload: dict) -> None:
+        self._add_project(payload["project"])
+
+    def _on_project_removed(self, payload: dict) -> None:
+        project_id = payload["project"].project_id
+        for employee_id in list(self._teams.get(project_id, ())):
+            self.remove_team_member(project_id, employee_id)
+        self._teams.pop(project_id, None)
+
+    def _add_department(self, department: Department) -> None:
+        for emp in department:
+            self.add_employee(emp.id)
+
+    def _add_project(self, project: Project) -> None:
+        self._teams.setdefault(project.project_id, set())
+        for emp in project.get_team():
+            self.add_team_member(project.project_id, emp.id)
+
+    # Изменение графа
+    def add_employee(self, employee_id: int) -> None:
+        """Добавить сотрудника как вершину (без связей)"""
+        self._staff.add(employee_id)
+        self._adjacency.setdefault(employee_id, {})
+
+    def remove_employee(self, employee_id: int) -> None:
+        """Убрать сотрудника из штата; вершина остается, пока он в командах"""
+        self._staff.discard(employee_id)
+        self._drop_if_unused(employee_id)
+
+    def add_team_member(self, project_id: int, employee_id: int) -> None:
+        """Добавить сотрудника в команду и связать с её участниками"""
+        team = self._teams.setdefault(project_id, set())
+        if employee_id in team:
+            return
+        links = self._adjacency.setdefault(employee_id, {})
+        for colleague in team:
+            weight = links.get(colleague, 0)
+            if weight == 0:
+                self._edge_count += 1
+            links[colleague] = weight + 1
+            self._adjacency[colleague][employee_id] = weight + 1
+        team.add(employee_id)
+        self._memberships[employee_id] = self._memberships.get(employee_id, 0) + 1
+
+    def remove_team_member(self, project_id: int, employee_id: int) -> None:
+        """Убрать сотрудника из команды и ослабить его связи"""
+        team = self._teams.get(project_id)
+        if team is None or employee_id not in team:
+            return
+        team.discard(employee_id)
+        links = self._adjacency[employee_id]
+        for colleague in team:
+            weight = links[colleague] - 1
+            if weight:
+                links[colleague] = weight
+                self._adjacency[colleague][employee_id] = weight
+            else:
+                del links[colleague]
+                del self._adjacency[colleague][employee_id]
+                self._edge_count -= 1
+        count = self._memberships[employee_id] - 1
+        if count:
+            self._memberships[employee_id] = count
+        else:
+            del self._memberships[employee_id]
+            self._drop_if_unused(employee_id)
+
+    def _drop_if_unused(self, employee_id: int) -> None:
+        if employee_id not in self._staff and employee_id not in self._memberships:
+            links = self._adjacency.pop(employee_id, {})
+            for colleague in links:
+                del self._adjacency[colleague][employee_id]
+            self._edge_count -= len(links)
+
+    # Запросы
+    @property
+    def node_count(self) -> int:
+        return len(self._adjacency)
+
+    @property
+    def edge_count(self) -> int:
+        return self._edge_count
+
+    def __contains__(self, employee_id: int) -> bool:
+        return employee_id in self._adjacency
+
+    def neighbors(self, employee_id: int) -> Dict[int, int]:
+        """Коллеги сотрудника с числом общих проектов"""
+        return dict(self._adjacency.get(employee_id, {}))
+
+    def weight(self, first_id: int, second_id: int) -> int:
+        """Число общих проектов двух сотрудников"""
+        return self._adjacency.get(first_id, {}).get(second_id, 0)
+
+    def degree(self, employee_id: int) -> int:
+        """Количество разных коллег сотрудника"""
+        return len(self._adjacency.get(employee_id, {}))
+
+    def degree_centrality(self) -> Dict[int, float]:
+        """Доля сотрудников, с которыми работал каждый сотрудник"""
+        if len(self._adjacency) < 2:
+            return {employee_id: 0.0 for employee_id in self._adjacency}
+        scale = 1 / (len(self._adjacency) - 1)
+        return {
+            employee_id: len(links) * scale
+            for employee_id, links in self._adjacency.items()
+        }
+
+    def top_connected(self, count: int = 10) -> List[int]:
+        """ID сотрудников с наибольшим числом коллег"""
+        return sorted(
+            self._adjacency, key=lambda employee_id: -len(self._adjacency[employee_id])
+        )[:count]
+
+    def neighborhood(self, employee_id: int, hops: int = 1) -> Dict[int, int]:
+        """
+        Сотрудники не дальше hops шагов по графу
+
+        Returns:
+            Dict[int, int]: ID сотрудника -> расстояние (сам сотрудник не входит)
+        """
+        if employee_id not in self._adjacency:
+            raise KeyError(f"Сотрудник с ID {employee_id} отсутствует в графе")
+        distances = {employee_id: 0}
+        queue = deque([employee_id])
+        while queue:
+            current = queue.popleft()
+            distance = distances[current]
+            if distance == hops:
+                continue
+            for colleague in self._adjacency[current]:
+                if colleague not in distances:
+                    distances[colleague] = distance + 1
+                    queue.append(colleague)
+        del distances[employee_id]
+        return distances
+
+    def connected_components(self, exclude: Optional[int] = None) -> List[Set[int]]:
+        """Группы сотрудников, связанных через проекты (по убыванию размера)"""
+        seen: Set[int] = set() if exclude is None else {exclude}
+        components = []
+        for start in self._adjacency:
+            if start in seen:
+                continue
+            component = {start}
+            seen.add(start)
+            stack = [start]
+            while stack:
+                for colleague in self._adjacency[stack.pop()]:
+                    if colleague not in seen:
+                        seen.add(colleague)
+                        component.add(colleague)
+                        stack.append(colleague)
+            components.append(component)
+        components.sort(key=len, reverse=True)
+        return components
+
+    def isolated(self) -> List[int]:
+        """Сотрудники без общих проектов с кем-либо"""
+        return [employee_id for employee_id, links in self._adjacency.items() if not links]
+
+    def articulation_points(self) -> Set[int]:
+        """Ключевые связующие: их уход разбивает группу на части"""
+        discovery: Dict[int, int] = {}
+        low: Dict[int, int] = {}
+        points: Set[int] = set()
+        counter = 0
+        for root in self._adjacency:
+            if root in discovery:
+                continue
+            discovery[root] = low[root] = counter
+            counter += 1
+            root_children = 0
+            # Итеративный обход в глубину: (вершина, родитель, итератор соседей)
+            stack = [(root, None, iter(self._adjacency[root]))]
+            while stack:
+                node, parent, colleagues = stack[-1]
+                advanced = False
+                for colleague in colleagues:
+                    if colleague == parent:
+                        continue
+                    if colleague in discovery:
+                        low[node] = min(low[node], discovery[colleague])
+                    else:
+                        discovery[colleague] = low[colleague] = counter
+                        counter += 1
+                        if node == root:
+                            root_children += 1
+                        stack.append((colleague, node, iter(self._adjacency[colleague])))
+                        advanced = True
+                        break
+                if advanced:
+                    continue
+                stack.pop()
+                if parent is not None:
+                    low[parent] = min(low[parent], low[node])
+                    if parent != root and low[node] >= discovery[parent]:
+                        points.add(parent)
+            if root_children > 1:
+                points.add(root)
+        return points
+
+    def removal_impact(self, employee_id: int) -> List[Set[int]]:
+        """
+        Последствия ухода сотрудника для его группы
+
+        Returns:
+            List[Set[int]]: Части, на которые распадется группа сотрудника
+            (одна часть - группа осталась связной)
+        """
+        if employee_id not in self._adjacency:
+            raise KeyError(f"Сотрудник с ID {employee_id} отсутствует в графе")
+        group = set(self.neighborhood(employee_id, len(self._adjacency)))
+        return [
+            component
+            for component in self.connected_components(exclude=employee_id)
+            if component <= group
+        ]
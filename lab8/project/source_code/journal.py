@@ -0,0 +1,368 @@
+"""Журнал изменений компании (write-ahead log) с контрольными точками"""
+
+import glob
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+from source_code.part4 import (
+    AbstractEmployee,
+    ChangeEvent,
+    Company,
+    Department,
+    EmployeeFactory,
+    Project,
+)
+
+
+class CompanyJournal:
+    """Журнал изменений компании только на дозапись
+
+    Журнал подписывается на события компании и записывает каждое
+    изменение (прием, удаление и перевод сотрудника, назначение в проект,
+    смена статуса, изменение зарплатных параметров, добавление и удаление
+    отделов и проектов) строкой JSON с порядковым номером. Записи
+    сбрасываются на диск группами с одним fsync на группу. Время от
+    времени компания целиком сохраняется в контрольную точку
+    (save_to_json), после чего журнал очищается.
+
+    При запуске recover загружает последнюю контрольную точку и применяет
+    к ней хвост журнала. Изменения, не порождающие событий (например,
+    смена имени), попадают на диск только с очередной контрольной точкой.
+    """
+
+    JOURNAL_FILE = "journal.log"
+    CHECKPOINT_PATTERN = "checkpoint_*.json"
+
+    SALARY_FIELDS = (
+        "base_salary",
+        "bonus",
+        "seniority_level",
+        "commission_rate",
+        "sales_volume",
+    )
+
+    def __init__(
+        self,
+        directory: str,
+        group_size: int = 64,
+        sync_interval: float = 1.0,
+        checkpoint_every: int = 10000,
+    ):
+        """
+        Args:
+            directory: Каталог журнала и контрольных точек
+            group_size: Сколько записей копить до сброса на диск
+            sync_interval: Через сколько секунд после прошлого сброса
+                следующая запись сбрасывает группу, даже неполную.
+                Проверяется только при записи: в простаивающем журнале
+                записи ждут очередной записи, commit() или close()
+            checkpoint_every: Через сколько записей делать контрольную точку
+        """
+        self.__directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.__journal_path = os.path.join(directory, self.JOURNAL_FILE)
+        self.group_size = group_size
+        self.sync_interval = sync_interval
+        self.checkpoint_every = checkpoint_every
+
+        self.__company: Optional[Company] = None
+        self.__file = None
+        self.__pending: List[bytes] = []
+        self.__pending_removal = None
+        self.__seq = 0
+        self.__checkpoint_seq = 0
+        self.__last_sync = time.monotonic()
+        self.syncs = 0
+
+    @property
+    def seq(self) -> int:
+        """Номер последней записи"""
+        return self.__seq
+
+    # Подключение
+    def attach(self, company: Company) -> None:
+        """Начать журнал для новой компании (создает первую контрольную точку)"""
+        if self._checkpoints():
+            raise ValueError(f"В каталоге {self.__directory} уже есть журнал компании")
+        self.__company = company
+        self.checkpoint()
+        company.add_observer(self)
+
+    def recover(self) -> Optional[Company]:
+        """
+        Восстановить компанию: последняя контрольная точка + хвост журнала
+
+        Returns:
+            Optional[Company]: Компания или None, если журнал пуст
+        """
+        checkpoints = self._checkpoints()
+        if not checkpoints:
+            return None
+        self.__checkpoint_seq, path = checkpoints[-1]
+        company = Company.load_from_json(path)
+        self.__seq = self.__checkpoint_seq
+        self._replay(company)
+        self.__company = company
+        self.__file = open(self.__journal_path, "ab")
+        company.add_observer(self)
+        return company
+
+    def _checkpoints(self) -> List[tuple]:
+        result = []
+        for path in glob.glob(os.path.join(self.__directory, self.CHECKPOINT_PATTERN)):
+            name = os.path.basename(path)
+            result.append((int(name[len("checkpoint_") : -len(".json")]), path))
+        result.sort()
+        return result
+
+    def close(self) -> None:
+        """Сбросить записи на диск и отписаться от компании"""
+        if self.__company is not None:
+            self.commit()
+            self.__company.remove_observer(self)
+            self.__company = None
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+    def __enter__(self) -> "CompanyJournal":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    # Запись
+    def update(self, subject, event: ChangeEvent) -> None:
+        """Записать событие компании (интерфейс наблюдателя)"""
+        payload = event.payload
+        removal = self.__pending_removal
+        if removal is not None:
+            self.__pending_removal = None
+            # Перевод приходит парой событий: удаление и добавление того же объекта
+            if (
+                event.kind == ChangeEvent.EMPLOYEE_ADDED
+                and payload["employee"] is removal[1]
+            ):
+                self._append(
+                    {
+                        "op": "transfer",
+                        "employee_id": removal[1].id,
+                        "from": removal[0].code,
+                        "to": payload["department"].code,
+                    }
+                )
+                return
+            self._append(
+                {"op": "remove", "department": removal[0].code, "employee_id": removal[1].id}
+            )
+
+        kind = event.kind
+        if kind == ChangeEvent.EMPLOYEE_REMOVED:
+            self.__pending_removal = (payload["department"], payload["employee"])
+            return
+        if kind == ChangeEvent.EMPLOYEE_ADDED:
+            record = {
+                "op": "hire",
+                "department": payload["department"].code,
+                "employee": self._employee_data(payload["employee"]),
+            }
+        elif kind == ChangeEvent.SALARY_CHANGED:
+            employee = payload["employee"]
+            data = employee.to_dict()
+            record = {
+                "op": "salary",
+                "employee_id": employee.id,
+                "fields": {name: data[name] for name in self.SALARY_FIELDS if name in data},
+            }
+        elif kind == ChangeEvent.TEAM_MEMBER_ADDED:
+            record = {
+                "op": "assign",
+                "project_id": payload["project"].project_id,
+                "employee_id": payload["employee"].id,
+            }
+        elif kind == ChangeEvent.TEAM_MEMBER_REMOVED:
+            record = {
+                "op": "unassign",
+                "project_id": payload["project"].project_id,
+                "employee_id": payload["employee"].id,
+            }
+        elif kind == ChangeEvent.STATUS_CHANGED:
+            record = {
+                "op": "status",
+                "project_id": payload["project"].project_id,
+                "status": payload["new_status"],
+            }
+        elif kind == ChangeEvent.DEPARTMENT_ADDED:
+            department = payload["department"]
+            record = {
+                "op": "add_department",
+                "department": {
+                    "name": department.name,
+                    "code": department.code,
+                    "employees": [self._employee_data(emp) for emp in department],
+                },
+            }
+        elif kind == ChangeEvent.DEPARTMENT_REMOVED:
+            record = {"op": "remove_department", "code": payload["department"].code}
+        elif kind == ChangeEvent.PROJECT_ADDED:
+            record = {"op": "add_project", "project": payload["project"].to_dict()}
+        elif kind == ChangeEvent.PROJECT_REMOVED:
+            record = {"op": "remove_project", "project_id": payload["project"].project_id}
+        else:
+            return
+        self._append(record)
+
+    @staticmethod
+    def _employee_data(employee: AbstractEmployee) -> Dict[str, Any]:
+        data = employee.to_dict()
+        # Связи с проектами журналируются отдельными записями assign
+        data.pop("assigned_project_ids", None)
+        return data
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        self._record(record)
+        if (
+            len(self.__pending) >= self.group_size
+            or time.monotonic() - self.__last_sync >= self.sync_interval
+        ):
+            self._flush()
+
+    def _record(self, record: Dict[str, Any]) -> None:
+        self.__seq += 1
+        record["seq"] = self.__seq
+        self.__pending.append(
+            json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            + b"\n"
+        )
+
+    def _flush(self) -> None:
+        """Записать накопленную группу одним write и одним fsync"""
+        removal = self.__pending_removal
+        if removal is not None:
+            self.__pending_removal = None
+            self._record(
+                {"op": "remove", "department": removal[0].code, "employee_id": removal[1].id}
+            )
+        if self.__pending:
+            if self.__file is None:
+                self.__file = open(self.__journal_path, "ab")
+            self.__file.write(b"".join(self.__pending))
+            self.__file.flush()
+            os.fsync(self.__file.fileno())
+            self.__pending.clear()
+            self.syncs += 1
+        self.__last_sync = time.monotonic()
+
+    def commit(self) -> None:
+        """
+        Точка фиксации: сбросить записи на диск и при необходимости
+        сделать контрольную точку
+
+        Контрольные точки создаются только здесь, а не при сбросе группы
+        внутри обработки события, когда изменение еще не завершено.
+        """
+        self._flush()
+        if self.__seq - self.__checkpoint_seq >= self.checkpoint_every:
+            self.checkpoint()
+
+    def checkpoint(self) -> None:
+        """Сохранить компанию целиком и очистить журнал"""
+        if self.__company is None:
+            raise ValueError("Журнал не подключен к компании")
+        self._flush()
+        seq = self.__seq
+        path = os.path.join(self.__directory, f"checkpoint_{seq}.json")
+        tmp_path = path + ".tmp"
+        self.__company.save_to_json(tmp_path)
+        with open(tmp_path, "rb") as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        # Записи с номером не больше seq уже учтены в контрольной точке
+        if self.__file is not None:
+            self.__file.close()
+        self.__file = open(self.__journal_path, "wb")
+        self.__checkpoint_seq = seq
+        for old_seq, old_path in self._checkpoints():
+            if old_seq < seq:
+                os.remove(old_path)
+
+    # Воспроизведение
+    def _replay(self, company: Company) -> None:
+        if not os.path.exists(self.__journal_path):
+            return
+        employees = {emp.id: emp for emp in company.get_all_employees()}
+        valid_length = 0
+        with open(self.__journal_path, "rb") as f:
+            lines = f.readlines()
+        for number, line in enumerate(lines):
+            try:
+                if not line.endswith(b"\n"):
+                    raise ValueError("Неполная запись")
+                record = json.loads(line)
+            except ValueError:
+                if number == len(lines) - 1:
+                    # Оборванная последняя запись: сбой во время дозаписи
+                    break
+                raise ValueError(f"Журнал поврежден в записи {number + 1}")
+            valid_length += len(line)
+            if record["seq"] <= self.__seq:
+                continue
+            self._apply(company, employees, record)
+            self.__seq = record["seq"]
+        if valid_length < sum(len(line) for line in lines):
+            with open(self.__journal_path, "r+b") as f:
+                f.truncate(valid_length)
+
+    @classmethod
+    def _apply(
+        cls, company: Company, employees: Dict[int, AbstractEmployee], record: dict
+    ) -> None:
+        op = record["op"]
+        if op == "hire":
+            employee = EmployeeFactory.from_dict(record["employee"])
+            company.find_department_by_code(record["department"]).add_employee(employee)
+            employees[employee.id] = employee
+        elif op == "remove":
+            company.find_department_by_code(record["department"]).remove_employee(
+                record["employee_id"]
+            )
+            employees.pop(record["employee_id"], None)
+        elif op == "transfer":
+            source = company.find_department_by_code(record["from"])
+            source.transfer_employee(
+                record["employee_id"], company.find_department_by_code(record["to"])
+            )
+        elif op == "salary":
+            employee = employees[record["employee_id"]]
+            for name, value in record["fields"].items():
+                if getattr(employee, name) != value:
+                    setattr(employee, name, value)
+        elif op == "assign":
+            company.find_project_by_id(record["project_id"]).add_team_member(
+                employees[record["employee_id"]]
+            )
+        elif op == "unassign":
+            company.find_project_by_id(record["project_id"]).remove_team_member(
+                record["employee_id"]
+            )
+        elif op == "status":
+            company.find_project_by_id(record["project_id"]).change_status(record["status"])
+        elif op == "add_department":
+            department = Department.from_dict(record["department"])
+            company.add_department(department)
+            for employee in department:
+                employees[employee.id] = employee
+        elif op == "remove_department":
+            company.remove_department(record["code"])
+        elif op == "add_project":
+            project = Project.from_dict(record["project"])
+            for employee_id in record["project"].get("team", []):
+                if employee_id in employees:
+                    project.add_team_member(employees[employee_id])
+            company.add_project(project)
+        elif op == "remove_project":
+            company.remove_project(record["project_id"])
+        else:
+            raise ValueError(f"Неизвестная операция журнала: {op}")
@@ -0,0 +1,226 @@
+"""Потоковая загрузка компании из JSON без построения всего дерева словарей"""
+
+import json
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from source_code.part4 import (
+    AbstractEmployee,
+    Company,
+    Department,
+    DuplicateIdError,
+    EmployeeFactory,
+    Project,
+)
+
+
+class JsonStreamReader:
+    """Инкрементальный разбор JSON из текстового потока
+
+    Файл читается блоками по chunk_size символов. Контейнеры верхних
+    уровней обходятся генераторами iter_object/iter_array, а записи
+    (сотрудник, проект) разбираются целиком через JSONDecoder.raw_decode,
+    поэтому в памяти одновременно находится только текущая запись.
+
+    Пример:
+        for key in reader.iter_object():
+            if key == "items":
+                for _ in reader.iter_array():
+                    item = reader.read_value()
+            else:
+                reader.read_value()
+    """
+
+    WHITESPACE = " \t\n\r"
+
+    def __init__(self, stream: TextIO, chunk_size: int = 1 << 16):
+        if chunk_size < 1:
+            raise ValueError("Размер блока должен быть положительным")
+        self.__stream = stream
+        self.__chunk_size = chunk_size
+        self.__buffer = ""
+        self.__pos = 0
+        self.__eof = False
+        self.__decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Дочитать данные; размер чтения растет вместе с недоразобранной записью"""
+        if self.__eof:
+            return False
+        pending = len(self.__buffer) - self.__pos
+        data = self.__stream.read(max(self.__chunk_size, pending))
+        if not data:
+            self.__eof = True
+            return False
+        self.__buffer = self.__buffer[self.__pos :] + data
+        self.__pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Следующий значимый символ ('' в конце потока)"""
+        while True:
+            buffer = self.__buffer
+            pos = self.__pos
+            while pos < len(buffer) and buffer[pos] in self.WHITESPACE:
+                pos += 1
+            self.__pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char: str) -> None:
+        found = self._peek()
+        if found != char:
+            raise ValueError(
+                f"Ошибка разбора JSON: ожидался '{char}', получено '{found or 'конец файла'}'"
+            )
+        self.__pos += 1
+
+    def read_value(self) -> Any:
+        """Разобрать следующее значение целиком"""
+        if not self._peek():
+            raise ValueError("Ошибка разбора JSON: неожиданный конец файла")
+        while True:
+            try:
+                value, end = self.__decoder.raw_decode(self.__buffer, self.__pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # Число на границе блока могло быть прочитано не полностью
+            if end == len(self.__buffer) and self._fill():
+                continue
+            self.__pos = end
+            return value
+
+    def iter_object(self) -> Iterator[str]:
+        """Обход ключей объекта; значение каждого ключа читает вызывающий код"""
+        self._expect("{")
+        if self._peek() == "}":
+            self.__pos += 1
+            return
+        while True:
+            key = self.read_value()
+            if not isinstance(key, str):
+                raise ValueError("Ошибка разбора JSON: ключ объекта должен быть строкой")
+            self._expect(":")
+            yield key
+            if self._peek() == ",":
+                self.__pos += 1
+                continue
+            self._expect("}")
+            return
+
+    def iter_array(self) -> Iterator[int]:
+        """Обход элементов массива; каждый элемент читает вызывающий код"""
+        self._expect("[")
+        if self._peek() == "]":
+            self.__pos += 1
+            return
+        index = 0
+        while True:
+            yield index
+            index += 1
+            if self._peek() == ",":
+                self.__pos += 1
+                continue
+            self._expect("]")
+            return
+
+
+class StreamingCompanyLoader:
+    """Потоковая загрузка файла Company.save_to_json
+
+    Отделы и сотрудники создаются по мере разбора их записей, проекты
+    запоминаются вместе со списком ID команды. Вторым проходом команды
+    связываются с сотрудниками через словарь ID -> сотрудник, без
+    поиска по всем отделам. Результат совпадает с Company.load_from_json.
+    """
+
+    def __init__(self, chunk_size: int = 1 << 16):
+        self.chunk_size = chunk_size
+
+    def load(self, filename: str) -> Company:
+        """Загрузить компанию из JSON файла"""
+        with open(filename, "r", encoding="utf-8") as f:
+            return self.load_stream(f)
+
+    def load_stream(self, stream: TextIO) -> Company:
+        """Загрузить компанию из открытого текстового потока"""
+        reader = JsonStreamReader(stream, self.chunk_size)
+        name = None
+        departments: List[Department] = []
+        projects: List[Tuple[Project, List[int]]] = []
+        employees_by_id: Dict[int, AbstractEmployee] = {}
+
+        for key in reader.iter_object():
+            if key == "name":
+                name = reader.read_value()
+            elif key == "departments":
+                for _ in reader.iter_array():
+                    departments.append(self._read_department(reader, employees_by_id))
+            elif key == "projects":
+                for _ in reader.iter_array():
+                    data = reader.read_value()
+                    projects.append((Project.from_dict(data), data.get("team", [])))
+            else:
+                reader.read_value()
+
+        if name is None:
+            raise ValueError("Ошибка разбора JSON: отсутствует название компании")
+        company = Company(name)
+        for department in departments:
+            company.add_department(department)
+
+        # Второй проход: восстановление команд проектов
+        for project, team in projects:
+            for employee_id in team:
+                employee = employees_by_id.get(employee_id)
+                if employee:
+                    try:
+                        project.add_team_member(employee)
+                    except (DuplicateIdError, ValueError):
+                        # Как и в load_from_json: уже в команде или перегружен
+                        pass
+            company.add_project(project)
+        return company
+
+    @staticmethod
+    def _read_department(
+        reader: JsonStreamReader, employees_by_id: Dict[int, AbstractEmployee]
+    ) -> Department:
+        name = code = None
+        department: Optional[Department] = None
+        # Сотрудники, встреченные раньше названия и кода отдела
+        early: List[AbstractEmployee] = []
+
+        for key in reader.iter_object():
+            if key == "name":
+                name = reader.read_value()
+            elif key == "code":
+                code = reader.read_value()
+            elif key == "employees":
+                for _ in reader.iter_array():
+                    employee = EmployeeFactory.from_dict(reader.read_value())
+                    employees_by_id.setdefault(employee.id, employee)
+                    if department is None and name is not None and code is not None:
+                        department = Department(name, code)
+                    if department is None:
+                        early.append(employee)
+                    else:
+                        department.add_employee(employee)
+            else:
+                reader.read_value()
+
+        if name is None or code is None:
+            raise ValueError("Ошибка разбора JSON: у отдела нет названия или кода")
+        if department is None:
+            department = Department(name, code)
+        for employee in early:
+            department.add_employee(employee)
+        return department
+
+
+def load_company_json(filename: str, chunk_size: int = 1 << 16) -> Company:
+    """Потоковый аналог Company.load_from_json"""
+    return StreamingCompanyLoader(chunk_size).load(filename)
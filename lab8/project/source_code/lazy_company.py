@@ -0,0 +1,218 @@
+"""Ленивое представление компании поверх бинарного снимка"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional
+
+from source_code.part4 import AbstractEmployee, Company, Developer, as_of_ordinal
+from source_code.snapshot import EMPLOYEE_TYPES, SnapshotFile, load_snapshot
+
+
+class LazyCompany:
+    """Компания только для чтения, объекты которой создаются по требованию
+
+    Агрегаты (затраты, статистика отделов, анализ проектов) считаются
+    прямо по колонкам снимка save_snapshot. Объект сотрудника создается
+    только при обращении к нему через find_employee_by_id, итерацию или
+    индекс и хранится в ограниченном LRU-кэше.
+
+    Созданные объекты - отдельные копии: изменения в них не записываются
+    в файл, а связи с проектами у них не восстанавливаются.
+    """
+
+    ITERATION_BATCH = 1024
+
+    def __init__(self, filename: str, cache_size: int = 1024):
+        if cache_size < 1:
+            raise ValueError("Размер кэша должен быть положительным")
+        self.__filename = filename
+        self.__snapshot = SnapshotFile(filename)
+        self.__cache_size = cache_size
+        self.__cache: "OrderedDict[int, AbstractEmployee]" = OrderedDict()
+        self.__rows_by_id: Optional[Dict[int, int]] = None
+        self.__salaries: Optional[List[float]] = None
+        self.hits = 0
+        self.misses = 0
+
+    def __enter__(self) -> "LazyCompany":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Закрыть файл снимка"""
+        self.__cache.clear()
+        self.__snapshot.close()
+
+    @property
+    def name(self):
+        return self.__snapshot.company_name
+
+    def __len__(self) -> int:
+        return self.__snapshot.employee_count
+
+    # Доступ к сотрудникам
+    def _employee(self, row: int) -> AbstractEmployee:
+        employee = self.__cache.get(row)
+        if employee is not None:
+            self.__cache.move_to_end(row)
+            self.hits += 1
+            return employee
+        self.misses += 1
+        return self._remember(row, self.__snapshot.build_employee(row))
+
+    def _remember(self, row: int, employee: AbstractEmployee) -> AbstractEmployee:
+        self.__cache[row] = employee
+        if len(self.__cache) > self.__cache_size:
+            self.__cache.popitem(last=False)
+        return employee
+
+    def __getitem__(self, index: int) -> AbstractEmployee:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Индекс сотрудника вне диапазона")
+        return self._employee(index)
+
+    def __iter__(self) -> Iterator[AbstractEmployee]:
+        for start in range(0, len(self), self.ITERATION_BATCH):
+            stop = min(start + self.ITERATION_BATCH, len(self))
+            batch = None
+            for row in range(start, stop):
+                employee = self.__cache.get(row)
+                if employee is not None:
+                    self.__cache.move_to_end(row)
+                    self.hits += 1
+                else:
+                    if batch is None:
+                        batch = self.__snapshot.build_employees(start, stop)
+                    self.misses += 1
+                    employee = self._remember(row, batch[row - start])
+                yield employee
+
+    def find_employee_by_id(self, employee_id: int) -> Optional[AbstractEmployee]:
+        """Найти сотрудника по ID (создает только этот объект)"""
+        row = self._rows_by_id().get(employee_id)
+        return None if row is None else self._employee(row)
+
+    def _rows_by_id(self) -> Dict[int, int]:
+        if self.__rows_by_id is None:
+            rows: Dict[int, int] = {}
+            for row, employee_id in enumerate(self.__snapshot.column("emp_id").tolist()):
+                rows.setdefault(employee_id, row)
+            self.__rows_by_id = rows
+        return self.__rows_by_id
+
+    def cache_info(self) -> Dict[str, int]:
+        """Статистика кэша созданных объектов"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self.__cache),
+            "max_size": self.__cache_size,
+        }
+
+    def materialize(self) -> Company:
+        """Загрузить полноценную компанию со всеми объектами"""
+        return load_snapshot(self.__filename)
+
+    # Агрегаты по колонкам
+    def _salary_column(self) -> List[float]:
+        """Итоговые зарплаты по строкам (формулы calculate_salary по колонкам)"""
+        if self.__salaries is None:
+            snapshot = self.__snapshot
+            multipliers = [
+                Developer.SENIORITY_MULTIPLIERS.get(value, 0.0) for value in snapshot.strings
+            ]
+            manager = EMPLOYEE_TYPES.index("Manager")
+            developer = EMPLOYEE_TYPES.index("Developer")
+            salesperson = EMPLOYEE_TYPES.index("Salesperson")
+            salaries = []
+            for type_code, base, bonus, rate, volume, seniority in zip(
+                snapshot.column("emp_type").tolist(),
+                snapshot.column("base_salary").tolist(),
+                snapshot.column("bonus").tolist(),
+                snapshot.column("commission_rate").tolist(),
+                snapshot.column("sales_volume").tolist(),
+                snapshot.column("seniority").tolist(),
+            ):
+                if type_code == manager:
+                    salaries.append(base + bonus)
+                elif type_code == developer:
+                    salaries.append(base * multipliers[seniority])
+                elif type_code == salesperson:
+                    salaries.append(base + rate * volume)
+                else:
+                    salaries.append(base)
+            self.__salaries = salaries
+        return self.__salaries
+
+    def calculate_total_monthly_cost(self) -> float:
+        """Рассчитать общие месячные затраты на зарплаты"""
+        return sum(self._salary_column())
+
+    def get_department_stats(self) -> Dict[str, Any]:
+        """Статистика по отделам в формате Company.get_department_stats"""
+        snapshot = self.__snapshot
+        strings = snapshot.strings
+        salaries = self._salary_column()
+        types = snapshot.column("emp_type").tolist()
+        offsets = snapshot.column("dept_offsets").tolist()
+        names = snapshot.column("dept_name")
+        codes = snapshot.column("dept_code")
+
+        stats = {}
+        for index in range(snapshot.department_count):
+            start, stop = offsets[index], offsets[index + 1]
+            employee_types: Dict[str, int] = {}
+            for type_code in types[start:stop]:
+                emp_type = EMPLOYEE_TYPES[type_code]
+                employee_types[emp_type] = employee_types.get(emp_type, 0) + 1
+            count = stop - start
+            total = sum(salaries[start:stop])
+            stats[strings[codes[index]]] = {
+                "name": strings[names[index]],
+                "employee_count": count,
+                "total_salary": total,
+                "employee_types": employee_types,
+                "avg_salary": total / count if count > 0 else 0,
+            }
+        return stats
+
+    def get_project_budget_analysis(self, as_of=None) -> Dict[str, Any]:
+        """Анализ бюджетов в формате Company.get_project_budget_analysis"""
+        snapshot = self.__snapshot
+        strings = snapshot.strings
+        reference = as_of_ordinal(as_of)
+        salaries = self._salary_column()
+        rows_by_id = self._rows_by_id()
+        team_offsets = snapshot.column("team_offsets").tolist()
+        team_items = snapshot.column("team_items").tolist()
+        deadlines = snapshot.column("proj_deadline")
+        statuses = snapshot.column("proj_status")
+
+        analysis = {
+            "total_projects": snapshot.project_count,
+            "by_status": {},
+            "total_budget": 0,
+            "avg_team_size": 0,
+            "overdue_projects": 0,
+        }
+        total_team_size = 0
+        for index in range(snapshot.project_count):
+            status = strings[statuses[index]]
+            analysis["by_status"][status] = analysis["by_status"].get(status, 0) + 1
+            team = [
+                rows_by_id[employee_id]
+                for employee_id in team_items[team_offsets[index] : team_offsets[index + 1]]
+                if employee_id in rows_by_id
+            ]
+            analysis["total_budget"] += sum(salaries[row] for row in team)
+            total_team_size += len(team)
+            if reference > deadlines[index] and status in ["planning", "active"]:
+                analysis["overdue_projects"] += 1
+
+        analysis["avg_team_size"] = (
+            total_team_size / snapshot.project_count if snapshot.project_count else 0
+        )
+        return analysis
@@ -0,0 +1,257 @@
+"""Параллельная загрузка нескольких JSON файлов компаний и отделов"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from source_code.part4 import (
+    AbstractEmployee,
+    Company,
+    Department,
+    Developer,
+    DuplicateIdError,
+    Employee,
+    Manager,
+    Project,
+    Salesperson,
+)
+
+# Компактные записи, которые процесс-обработчик возвращает родителю:
+#   сотрудник: (тип, id, имя, отдел, базовая зарплата, доп1, доп2)
+#     Manager - (бонус, None), Developer - (стек, уровень),
+#     Salesperson - (ставка, объем), Employee - (None, None)
+#   отдел: (название, код, [записи сотрудников])
+#   проект: (id, название, описание, дедлайн, статус, [ID команды])
+EmployeeRecord = Tuple[str, int, str, str, float, Any, Any]
+DepartmentRecord = Tuple[str, str, List[EmployeeRecord]]
+ProjectRecord = Tuple[int, str, str, str, str, List[int]]
+
+
+def parse_company_file(filename: str) -> Dict[str, Any]:
+    """
+    Разобрать и проверить файл в процессе-обработчике
+
+    Поддерживаются файлы Company.save_to_json (ключ "departments") и
+    файлы отделов (Department.to_dict, ключ "employees"; отдел без кода
+    из part3 получает код, равный названию).
+
+    Returns:
+        Dict[str, Any]: {"file", "name", "departments", "projects"} с
+        компактными записями вместо словарей
+    """
+    with open(filename, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    try:
+        if not isinstance(data, dict):
+            raise ValueError("ожидался объект JSON")
+        if "departments" in data:
+            name = data.get("name")
+            departments = [_department_record(item) for item in data["departments"]]
+            projects = [_project_record(item) for item in data.get("projects", [])]
+        elif "employees" in data:
+            name = None
+            departments = [_department_record(data)]
+            projects = []
+        else:
+            raise ValueError("файл не содержит ни компании, ни отдела")
+    except (KeyError, TypeError, ValueError) as error:
+        message = f"отсутствует поле {error}" if isinstance(error, KeyError) else str(error)
+        raise ValueError(f"{filename}: {message}") from None
+    return {"file": filename, "name": name, "departments": departments, "projects": projects}
+
+
+def _department_record(data: Dict[str, Any]) -> DepartmentRecord:
+    name = data["name"]
+    if not name:
+        raise ValueError("название отдела не может быть пустым")
+    return (name, data.get("code", name), [_employee_record(item) for item in data["employees"]])
+
+
+def _employee_record(data: Dict[str, Any]) -> EmployeeRecord:
+    emp_type = data["type"]
+    emp_id = int(data["id"])
+    if emp_id < 1:
+        raise ValueError(f"ID сотрудника должен быть положительным: {emp_id}")
+    name = str(data["name"])
+    if not name:
+        raise ValueError(f"у сотрудника {emp_id} пустое имя")
+    base_salary = _non_negative(data["base_salary"], "зарплата", emp_id)
+
+    if emp_type == "Manager":
+        extra = (_non_negative(data["bonus"], "бонус", emp_id), None)
+    elif emp_type == "Developer":
+        level = data["seniority_level"]
+        if level not in Developer.SENIORITY_MULTIPLIERS:
+            raise ValueError(f"у сотрудника {emp_id} неверный уровень: {level}")
+        extra = (list(data["tech_stack"]), level)
+    elif emp_type == "Salesperson":
+        rate = float(data["commission_rate"])
+        if not 0 <= rate <= 1:
+            raise ValueError(f"у сотрудника {emp_id} ставка комиссии вне [0, 1]")
+        extra = (rate, _non_negative(data["sales_volume"], "объем продаж", emp_id))
+    elif emp_type == "Employee":
+        extra = (None, None)
+    else:
+        raise ValueError(f"неизвестный тип сотрудника: {emp_type}")
+    return (emp_type, emp_id, name, str(data["department"]), base_salary) + extra
+
+
+def _non_negative(value: Any, field: str, emp_id: int) -> float:
+    value = float(value)
+    if value < 0:
+        raise ValueError(f"у сотрудника {emp_id} отрицательное значение: {field}")
+    return value
+
+
+def _project_record(data: Dict[str, Any]) -> ProjectRecord:
+    project_id = int(data["project_id"])
+    if project_id < 1:
+        raise ValueError(f"ID проекта должен быть положительным: {project_id}")
+    status = data["status"]
+    if status not in Project.VALID_STATUSES:
+        raise ValueError(f"у проекта {project_id} недопустимый статус: {status}")
+    datetime.strptime(data["deadline"], "%Y-%m-%d")
+    return (
+        project_id,
+        data["name"],
+        data["description"],
+        data["deadline"],
+        status,
+        [int(employee_id) for employee_id in data.get("team", [])],
+    )
+
+
+def _build_employee(record: EmployeeRecord) -> AbstractEmployee:
+    emp_type, emp_id, name, department, base_salary, first, second = record
+    if emp_type == "Manager":
+        return Manager(emp_id, name, department, base_salary, first)
+    if emp_type == "Developer":
+        return Developer(emp_id, name, department, base_salary, first, second)
+    if emp_type == "Salesperson":
+        return Salesperson(emp_id, name, department, base_salary, first, second)
+    return Employee(emp_id, name, department, base_salary)
+
+
+def build_department(record: DepartmentRecord) -> Department:
+    """Создать отдел с сотрудниками из компактной записи"""
+    name, code, employee_records = record
+    department = Department(name, code)
+    for employee_record in employee_records:
+        department.add_employee(_build_employee(employee_record))
+    return department
+
+
+class ParallelCompanyLoader:
+    """Загрузка нескольких файлов в одну компанию с разбором в процессах
+
+    Разбор JSON и проверка полей выполняются в пуле процессов, которые
+    возвращают компактные кортежи вместо объектов. Родительский процесс
+    только создает объекты из кортежей, связывает команды проектов через
+    словарь ID -> сотрудник и проверяет уникальность ID сотрудников,
+    проектов и кодов отделов во всех файлах.
+    """
+
+    def __init__(self, workers: Optional[int] = None, chunksize: int = 1):
+        """
+        Args:
+            workers: Число процессов (None - по числу процессоров,
+                0 - разбор в текущем процессе)
+            chunksize: Сколько файлов передавать процессу за раз
+        """
+        if workers is not None and workers < 0:
+            raise ValueError("Число процессов не может быть отрицательным")
+        self.workers = workers
+        self.chunksize = chunksize
+
+    def parse(self, filenames: Sequence[str]) -> List[Dict[str, Any]]:
+        """Разобрать файлы (в порядке filenames)"""
+        filenames = list(filenames)
+        if self.workers == 0 or len(filenames) < 2:
+            return [parse_company_file(name) for name in filenames]
+        workers = min(self.workers or os.cpu_count() or 1, len(filenames))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(parse_company_file, filenames, chunksize=self.chunksize))
+
+    def load(self, filenames: Sequence[str], company_name: Optional[str] = None) -> Company:
+        """
+        Загрузить файлы в одну компанию
+
+        Args:
+            filenames: Файлы компаний и отделов
+            company_name: Название итоговой компании (по умолчанию
+                название из первого файла компании)
+
+        Returns:
+            Company: Компания со всеми отделами и проектами
+
+        Raises:
+            DuplicateIdError: Повтор ID сотрудника или проекта либо кода
+                отдела в разных (или одном) файлах
+            ValueError: Файл не прошел проверку
+        """
+        parsed = self.parse(filenames)
+        if company_name is None:
+            company_name = next(
+                (item["name"] for item in parsed if item["name"]), "Консолидация"
+            )
+        company = Company(company_name)
+
+        employees_by_id: Dict[int, AbstractEmployee] = {}
+        employee_files: Dict[int, str] = {}
+        department_files: Dict[str, str] = {}
+        project_files: Dict[int, str] = {}
+        projects: List[Tuple[Project, List[int]]] = []
+
+        for item in parsed:
+            filename = item["file"]
+            for name, code, employee_records in item["departments"]:
+                if code in department_files:
+                    raise DuplicateIdError(
+                        f"Отдел с кодом {code} есть в {department_files[code]} и {filename}"
+                    )
+                department_files[code] = filename
+                department = Department(name, code)
+                for record in employee_records:
+                    emp_id = record[1]
+                    if emp_id in employee_files:
+                        raise DuplicateIdError(
+                            f"Сотрудник с ID {emp_id} есть в "
+                            f"{employee_files[emp_id]} и {filename}"
+                        )
+                    employee_files[emp_id] = filename
+                    employee = _build_employee(record)
+                    employees_by_id[emp_id] = employee
+                    department.add_employee(employee)
+                company.add_department(department)
+
+            for project_id, name, description, deadline, status, team in item["projects"]:
+                if project_id in project_files:
+                    raise DuplicateIdError(
+                        f"Проект с ID {project_id} есть в "
+                        f"{project_files[project_id]} и {filename}"
+                    )
+                project_files[project_id] = filename
+                projects.append((Project(project_id, name, description, deadline, status), team))
+
+        for project, team in projects:
+            for employee_id in team:
+                employee = employees_by_id.get(employee_id)
+                if employee:
+                    try:
+                        project.add_team_member(employee)
+                    except (DuplicateIdError, ValueError):
+                        # Как и в load_from_json: уже в команде или перегружен
+                        pass
+            company.add_project(project)
+        return company
+
+
+def load_company_files(
+    filenames: Sequence[str],
+    company_name: Optional[str] = None,
+    workers: Optional[int] = None,
+) -> Company:
+    """Параллельная загрузка файлов компаний и отделов в одну компанию"""
+    return ParallelCompanyLoader(workers).load(filenames, company_name)
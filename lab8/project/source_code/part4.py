@@ -1,8 +1,11 @@
 import json
 import csv
+import os
+import sqlite3
 from datetime import datetime, date
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, NamedTuple
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 import functools
 
 
@@ -55,10 +58,197 @@ class ProjectHasTeamError(Exception):
     pass
 
 
-# Базовые классы (из предыдущего кода с дополнениями)
-class AbstractEmployee(ABC):
+# События изменений модели
+@dataclass(frozen=True)
+class ChangeEvent:
+    """Событие изменения модели компании
+
+    subject - объект, в котором произошло изменение (сотрудник, отдел,
+    проект или компания), payload - данные изменения.
+    """
+
+    EMPLOYEE_ADDED = "employee_added"
+    EMPLOYEE_REMOVED = "employee_removed"
+    TEAM_MEMBER_ADDED = "team_member_added"
+    TEAM_MEMBER_REMOVED = "team_member_removed"
+    STATUS_CHANGED = "status_changed"
+    SALARY_CHANGED = "salary_changed"
+    DEPARTMENT_ADDED = "department_added"
+    DEPARTMENT_REMOVED = "department_removed"
+    PROJECT_ADDED = "project_added"
+    PROJECT_REMOVED = "project_removed"
+
+    kind: str
+    subject: Any
+    payload: Dict[str, Any] = field(default_factory=dict)
+
+
+class Observable:
+    """Источник событий изменений (паттерн Observer)
+
+    Наблюдатель должен реализовать метод update(subject, event).
+    Пока наблюдателей нет, события не создаются.
+    """
+
+    _observers: tuple = ()
+
+    def add_observer(self, observer) -> None:
+        """Подписать наблюдателя на события объекта"""
+        if not any(obs is observer for obs in self._observers):
+            self._observers = self._observers + (observer,)
+
+    def remove_observer(self, observer) -> None:
+        """Отписать наблюдателя от событий объекта"""
+        self._observers = tuple(obs for obs in self._observers if obs is not observer)
+
+    def notify_observers(self, event: ChangeEvent) -> None:
+        """Разослать событие всем наблюдателям"""
+        for observer in self._observers:
+            observer.update(self, event)
+
+    def _emit(self, kind: str, **payload) -> None:
+        if self._observers:
+            self.notify_observers(ChangeEvent(kind, self, payload))
+
+
+def as_of_ordinal(as_of=None) -> int:
+    """
+    Порядковый день (date.toordinal), от которого отсчитываются сроки
+
+    Снимок времени берется один раз, а сроки всех проектов считаются
+    вычитанием целых чисел. Разница (дедлайн - момент).days округляется
+    вниз, поэтому момент после полуночи сдвигает отсчет на следующий день.
+
+    Args:
+        as_of: datetime, date, строка YYYY-MM-DD или None (текущее время)
+    """
+    if as_of is None:
+        as_of = datetime.now()
+    elif isinstance(as_of, str):
+        as_of = datetime.strptime(as_of, "%Y-%m-%d")
+    if isinstance(as_of, datetime):
+        past_midnight = as_of.time() != datetime.min.time()
+        return as_of.toordinal() + (1 if past_midnight else 0)
+    return as_of.toordinal()
+
+
+# Кодеки сериализации сотрудников
+class CodecField(NamedTuple):
+    """Поле сериализации сотрудника
+
+    attribute - имя приватного атрибута без префикса класса (значение
+    хранится в _<Класс>__<attribute> класса, объявившего поле).
+    encode/decode - преобразование значения при записи в словарь и при
+    чтении из него. Поля с init=False не передаются в конструктор
+    и могут отсутствовать в словаре.
+    """
+
+    key: str
+    attribute: str
+    encode: Optional[Callable] = None
+    decode: Optional[Callable] = None
+    init: bool = True
+
+
+class EmployeeCodec:
+    """Кодек класса сотрудника, собираемый один раз при объявлении класса
+
+    Поля берутся из _CODEC_FIELDS классов иерархии (от базового к
+    производному). По ним генерируются функции encode и decode: encode
+    строит словарь одним литералом из приватных атрибутов (без свойств и
+    цепочки super().to_dict()), decode заполняет атрибуты нового объекта
+    напрямую, без цепочки конструкторов.
+
+    Если класс иерархии объявляет собственный __init__ без _CODEC_FIELDS,
+    его состояние кодеку неизвестно: такой класс создается через
+    конструктор с полями init=True в порядке объявления.
+    """
+
+    def __init__(self, cls: type):
+        self.cls = cls
+        self.type_name = cls.__name__
+        fields = []
+        direct = True
+        for klass in reversed(cls.__mro__):
+            own = klass.__dict__
+            if "_CODEC_FIELDS" in own:
+                fields.extend(
+                    (f"_{klass.__name__.lstrip('_')}__{item.attribute}", item)
+                    for item in own["_CODEC_FIELDS"]
+                )
+            elif "__init__" in own and klass not in (object, ABC, Observable):
+                direct = False
+        self.fields = tuple(item for _, item in fields)
+        self.direct = direct
+        self.encode = self._build_encoder(fields)
+        self.decode = self._build_decoder(fields, direct)
+
+    def _build_encoder(self, fields) -> Callable[["AbstractEmployee"], dict]:
+        namespace: Dict[str, Any] = {"type_name": self.type_name}
+        items = ['"type": type_name']
+        for number, (attribute, item) in enumerate(fields):
+            value = f"employee.{attribute}"
+            if item.encode:
+                namespace[f"encode_{number}"] = item.encode
+                value = f"encode_{number}({value})"
+            items.append(f"{item.key!r}: {value}")
+        source = "def encode(employee):\n    return {" + ", ".join(items) + "}\n"
+        exec(source, namespace)
+        return namespace["encode"]
+
+    def _build_decoder(self, fields, direct: bool) -> Callable[[dict], "AbstractEmployee"]:
+        namespace: Dict[str, Any] = {"cls": self.cls}
+        if not direct:
+            arguments = ", ".join(f"data[{item.key!r}]" for _, item in fields if item.init)
+            source = f"def decode(data):\n    return cls({arguments})\n"
+        else:
+            lines = ["def decode(data):", "    employee = cls.__new__(cls)"]
+            for number, (attribute, item) in enumerate(fields):
+                value = f"data[{item.key!r}]" if item.init else f"data.get({item.key!r})"
+                if item.decode:
+                    namespace[f"decode_{number}"] = item.decode
+                    value = f"decode_{number}({value})"
+                lines.append(f"    employee.{attribute} = {value}")
+            lines.append("    return employee")
+            source = "\n".join(lines) + "\n"
+        exec(source, namespace)
+        return namespace["decode"]
+
+
+def _project_ids(projects: List["Project"]) -> List[int]:
+    return [project.project_id for project in projects]
+
+
+def _no_projects(project_ids: Optional[List[int]]) -> List["Project"]:
+    # Связи с проектами восстанавливает from_dict при наличии компании
+    return []
+
+
+class AbstractEmployee(Observable, ABC):
     """Абстрактный базовый класс для всех сотрудников"""
 
+    _CODEC_FIELDS = (
+        CodecField("id", "id"),
+        CodecField("name", "name"),
+        CodecField("department", "department"),
+        CodecField("base_salary", "base_salary"),
+        CodecField(
+            "assigned_project_ids",
+            "assigned_projects",
+            encode=_project_ids,
+            decode=_no_projects,
+            init=False,
+        ),
+    )
+    # Кодеки классов сотрудников по имени типа (заполняется __init_subclass__)
+    _codecs: Dict[str, EmployeeCodec] = {}
+    _codec: Optional[EmployeeCodec] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._codec = EmployeeCodec(cls)
+        AbstractEmployee._codecs[cls.__name__] = cls._codec
+
     def __init__(self, id: int, name: str, department: str, base_salary: float):
         self.__id = id
         self.__name = name
@@ -112,7 +302,23 @@ class AbstractEmployee(ABC):
         value = float(value)
         if value < 0:
             raise ValueError("Зарплата не может быть отрицательной")
+        old_salary = self._salary_before_change()
         self.__base_salary = value
+        self._salary_changed(old_salary)
+
+    def _salary_before_change(self) -> Optional[float]:
+        """Итоговая зарплата до изменения (только при наличии наблюдателей)"""
+        return self.calculate_salary() if self._observers else None
+
+    def _salary_changed(self, old_salary: Optional[float]) -> None:
+        """Сообщить наблюдателям об изменении итоговой зарплаты"""
+        if old_salary is not None:
+            self._emit(
+                ChangeEvent.SALARY_CHANGED,
+                employee=self,
+                old_salary=old_salary,
+                new_salary=self.calculate_salary(),
+            )
 
     def assign_to_project(self, project: "Project") -> None:
         """Назначить сотрудника на проект"""
@@ -162,19 +368,22 @@ class AbstractEmployee(ABC):
             return other + self.calculate_salary()
 
     def to_dict(self) -> dict:
-        """Сериализация сотрудника в словарь"""
-        return {
-            "type": self.__class__.__name__,
-            "id": self.id,
-            "name": self.name,
-            "department": self.department,
-            "base_salary": self.base_salary,
-            "assigned_project_ids": [p.project_id for p in self.__assigned_projects],
-        }
+        """Сериализация сотрудника в словарь (кодек класса)"""
+        return self._codec.encode(self)
 
     @classmethod
     def from_dict(cls, data: dict, company: "Company" = None) -> "AbstractEmployee":
-        raise NotImplementedError("Должен быть реализован в подклассах")
+        """Десериализация сотрудника из словаря (кодек класса)"""
+        if cls._codec is None:
+            raise NotImplementedError("Должен быть реализован в подклассах")
+        employee = cls._codec.decode(data)
+        # Восстановление связей с проектами
+        if company:
+            for project_id in data.get("assigned_project_ids", []):
+                project = company.find_project_by_id(project_id)
+                if project:
+                    employee.assign_to_project(project)
+        return employee
 
 
 class Employee(AbstractEmployee):
@@ -188,28 +397,10 @@ class Employee(AbstractEmployee):
             f"проектов: {self.get_project_count()}"
         )
 
-    def to_dict(self) -> dict:
-        data = super().to_dict()
-        return data
-
-    @classmethod
-    def from_dict(cls, data: dict, company: "Company" = None) -> "Employee":
-        employee = cls(
-            id=data["id"],
-            name=data["name"],
-            department=data["department"],
-            base_salary=data["base_salary"],
-        )
-        # Восстановление связей с проектами
-        if company:
-            for project_id in data.get("assigned_project_ids", []):
-                project = company.find_project_by_id(project_id)
-                if project:
-                    employee.assign_to_project(project)
-        return employee
-
 
 class Manager(Employee):
+    _CODEC_FIELDS = (CodecField("bonus", "bonus"),)
+
     def __init__(
         self, id: int, name: str, department: str, base_salary: float, bonus: float
     ):
@@ -225,7 +416,9 @@ class Manager(Employee):
         value = float(value)
         if value < 0:
             raise ValueError("Бонус не может быть отрицательным")
+        old_salary = self._salary_before_change()
         self.__bonus = value
+        self._salary_changed(old_salary)
 
     def calculate_salary(self) -> float:
         return self.base_salary + self.bonus
@@ -237,29 +430,14 @@ class Manager(Employee):
             f"итоговая зарплата: {self.calculate_salary()}, проектов: {self.get_project_count()}"
         )
 
-    def to_dict(self) -> dict:
-        data = super().to_dict()
-        data["bonus"] = self.bonus
-        return data
-
-    @classmethod
-    def from_dict(cls, data: dict, company: "Company" = None) -> "Manager":
-        manager = cls(
-            id=data["id"],
-            name=data["name"],
-            department=data["department"],
-            base_salary=data["base_salary"],
-            bonus=data["bonus"],
-        )
-        if company:
-            for project_id in data.get("assigned_project_ids", []):
-                project = company.find_project_by_id(project_id)
-                if project:
-                    manager.assign_to_project(project)
-        return manager
-
 
 class Developer(Employee):
+    _CODEC_FIELDS = (
+        CodecField("tech_stack", "tech_stack", encode=list),
+        CodecField("seniority_level", "seniority_level"),
+    )
+    SENIORITY_MULTIPLIERS = {"junior": 1.0, "middle": 1.5, "senior": 2.0}
+
     def __init__(
         self,
         id: int,
@@ -288,14 +466,15 @@ class Developer(Employee):
             raise ValueError(
                 f'Уровень должен быть один из: {", ".join(allowed_levels)}'
             )
+        old_salary = self._salary_before_change()
         self.__seniority_level = value
+        self._salary_changed(old_salary)
 
     def add_skill(self, new_skill: str) -> None:
         self.__tech_stack.append(new_skill)
 
     def calculate_salary(self) -> float:
-        multipliers = {"junior": 1.0, "middle": 1.5, "senior": 2.0}
-        return self.base_salary * multipliers[self.seniority_level]
+        return self.base_salary * self.SENIORITY_MULTIPLIERS[self.seniority_level]
 
     def get_info(self) -> str:
         return (
@@ -308,31 +487,13 @@ class Developer(Employee):
     def __iter__(self):
         return iter(self.__tech_stack)
 
-    def to_dict(self) -> dict:
-        data = super().to_dict()
-        data["tech_stack"] = self.tech_stack
-        data["seniority_level"] = self.seniority_level
-        return data
-
-    @classmethod
-    def from_dict(cls, data: dict, company: "Company" = None) -> "Developer":
-        developer = cls(
-            id=data["id"],
-            name=data["name"],
-            department=data["department"],
-            base_salary=data["base_salary"],
-            tech_stack=data["tech_stack"],
-            seniority_level=data["seniority_level"],
-        )
-        if company:
-            for project_id in data.get("assigned_project_ids", []):
-                project = company.find_project_by_id(project_id)
-                if project:
-                    developer.assign_to_project(project)
-        return developer
-
 
 class Salesperson(Employee):
+    _CODEC_FIELDS = (
+        CodecField("commission_rate", "commission_rate"),
+        CodecField("sales_volume", "sales_volume"),
+    )
+
     def __init__(
         self,
         id: int,
@@ -359,19 +520,25 @@ class Salesperson(Employee):
         value = float(value)
         if not 0 <= value <= 1:
             raise ValueError("Ставка комиссии должна быть между 0 и 1")
+        old_salary = self._salary_before_change()
         self.__commission_rate = value
+        self._salary_changed(old_salary)
 
     @sales_volume.setter
     def sales_volume(self, value):
         value = float(value)
         if value < 0:
             raise ValueError("Объем продаж не может быть отрицательным")
+        old_salary = self._salary_before_change()
         self.__sales_volume = value
+        self._salary_changed(old_salary)
 
     def update_sales(self, new_sales: float) -> None:
         if new_sales < 0:
             raise ValueError("Нельзя добавить отрицательный объем продаж")
+        old_salary = self._salary_before_change()
         self.__sales_volume += new_sales
+        self._salary_changed(old_salary)
 
     def calculate_salary(self) -> float:
         return self.base_salary + (self.commission_rate * self.sales_volume)
@@ -384,31 +551,8 @@ class Salesperson(Employee):
             f"проектов: {self.get_project_count()}"
         )
 
-    def to_dict(self) -> dict:
-        data = super().to_dict()
-        data["commission_rate"] = self.commission_rate
-        data["sales_volume"] = self.sales_volume
-        return data
 
-    @classmethod
-    def from_dict(cls, data: dict, company: "Company" = None) -> "Salesperson":
-        salesperson = cls(
-            id=data["id"],
-            name=data["name"],
-            department=data["department"],
-            base_salary=data["base_salary"],
-            commission_rate=data["commission_rate"],
-            sales_volume=data["sales_volume"],
-        )
-        if company:
-            for project_id in data.get("assigned_project_ids", []):
-                project = company.find_project_by_id(project_id)
-                if project:
-                    salesperson.assign_to_project(project)
-        return salesperson
-
-
-class Department:
+class Department(Observable):
     def __init__(self, name: str, code: str):
         self.__name = name
         self.__code = code
@@ -436,6 +580,10 @@ class Department:
         if not isinstance(employee, AbstractEmployee):
             raise TypeError("Можно добавлять только объекты AbstractEmployee")
         self.__employees.append(employee)
+        # Наблюдатели отдела получают и изменения зарплат его сотрудников
+        for observer in self._observers:
+            employee.add_observer(observer)
+        self._emit(ChangeEvent.EMPLOYEE_ADDED, department=self, employee=employee)
 
     def remove_employee(self, employee_id: int) -> None:
         for i, emp in enumerate(self.__employees):
@@ -445,9 +593,26 @@ class Department:
                         f"Сотрудник {emp.name} участвует в проектах и не может быть удален"
                     )
                 del self.__employees[i]
+                self._detach_employee(emp)
                 return
         raise EmployeeNotFoundError(f"Сотрудник с ID {employee_id} не найден в отделе")
 
+    def _detach_employee(self, employee: AbstractEmployee) -> None:
+        """Отписать наблюдателей отдела от сотрудника и сообщить об удалении"""
+        for observer in self._observers:
+            employee.remove_observer(observer)
+        self._emit(ChangeEvent.EMPLOYEE_REMOVED, department=self, employee=employee)
+
+    def add_observer(self, observer) -> None:
+        super().add_observer(observer)
+        for emp in self.__employees:
+            emp.add_observer(observer)
+
+    def remove_observer(self, observer) -> None:
+        super().remove_observer(observer)
+        for emp in self.__employees:
+            emp.remove_observer(observer)
+
     def get_employees(self) -> List[AbstractEmployee]:
         return self.__employees.copy()
 
@@ -473,6 +638,7 @@ class Department:
             raise EmployeeNotFoundError(f"Сотрудник с ID {employee_id} не найден")
 
         self.__employees.remove(employee)
+        self._detach_employee(employee)
         new_department.add_employee(employee)
         employee.department = new_department.name
 
@@ -504,7 +670,7 @@ class Department:
         return department
 
 
-class Project:
+class Project(Observable):
     """Класс проекта с композицией - команда проекта"""
 
     VALID_STATUSES = ["planning", "active", "completed", "cancelled"]
@@ -521,6 +687,7 @@ class Project:
         self.__name = name
         self.__description = description
         self.__deadline = self._parse_date(deadline)
+        self.__deadline_ordinal = self.__deadline.toordinal()
         self.__status = status
         self.__team: List[AbstractEmployee] = []  # Композиция
 
@@ -540,6 +707,11 @@ class Project:
     def deadline(self):
         return self.__deadline
 
+    @property
+    def deadline_ordinal(self) -> int:
+        """Дедлайн как порядковый номер дня (разобран один раз)"""
+        return self.__deadline_ordinal
+
     @property
     def status(self):
         return self.__status
@@ -577,6 +749,7 @@ class Project:
 
         self.__team.append(employee)
         employee.assign_to_project(self)
+        self._emit(ChangeEvent.TEAM_MEMBER_ADDED, project=self, employee=employee)
 
     def remove_team_member(self, employee_id: int) -> None:
         """Удалить сотрудника из команды проекта по ID"""
@@ -584,6 +757,7 @@ class Project:
             if emp.id == employee_id:
                 emp.remove_from_project(self)
                 del self.__team[i]
+                self._emit(ChangeEvent.TEAM_MEMBER_REMOVED, project=self, employee=emp)
                 return
         raise EmployeeNotFoundError(f"Сотрудник с ID {employee_id} не найден в проекте")
 
@@ -617,15 +791,22 @@ class Project:
             raise InvalidStatusError(
                 f'Неверный статус. Допустимые: {", ".join(self.VALID_STATUSES)}'
             )
+        old_status = self.__status
         self.__status = new_status
+        self._emit(
+            ChangeEvent.STATUS_CHANGED,
+            project=self,
+            old_status=old_status,
+            new_status=new_status,
+        )
 
-    def is_overdue(self) -> bool:
-        """Проверить, просрочен ли проект"""
-        return datetime.now() > self.__deadline
+    def is_overdue(self, as_of=None) -> bool:
+        """Проверить, просрочен ли проект на момент as_of (по умолчанию сейчас)"""
+        return as_of_ordinal(as_of) > self.__deadline_ordinal
 
-    def days_until_deadline(self) -> int:
-        """Количество дней до дедлайна"""
-        return (self.__deadline - datetime.now()).days
+    def days_until_deadline(self, as_of=None) -> int:
+        """Количество дней до дедлайна на момент as_of (по умолчанию сейчас)"""
+        return self.__deadline_ordinal - as_of_ordinal(as_of)
 
     def to_dict(self) -> dict:
         """Сериализация проекта в словарь"""
@@ -662,8 +843,12 @@ class Project:
         return project
 
 
-class Company:
-    """Класс компании с агрегацией - отделы и проекты"""
+class Company(Observable):
+    """Класс компании с агрегацией - отделы и проекты
+
+    Наблюдатели компании подписываются на все её отделы, проекты и
+    сотрудников и получают единый поток событий ChangeEvent.
+    """
 
     def __init__(self, name: str):
         self.__name = name
@@ -694,6 +879,9 @@ class Company:
                 )
 
         self.__departments.append(department)
+        for observer in self._observers:
+            department.add_observer(observer)
+        self._emit(ChangeEvent.DEPARTMENT_ADDED, department=department)
 
     def remove_department(self, department_code: str) -> None:
         """Удалить отдел из компании"""
@@ -704,9 +892,28 @@ class Company:
                         f"Отдел {dept.name} не пуст и не может быть удален"
                     )
                 del self.__departments[i]
+                for observer in self._observers:
+                    dept.remove_observer(observer)
+                self._emit(ChangeEvent.DEPARTMENT_REMOVED, department=dept)
                 return
         raise DepartmentNotFoundError(f"Отдел с кодом {department_code} не найден")
 
+    def add_observer(self, observer) -> None:
+        """Подписать наблюдателя на события всей компании"""
+        super().add_observer(observer)
+        for dept in self.__departments:
+            dept.add_observer(observer)
+        for proj in self.__projects:
+            proj.add_observer(observer)
+
+    def remove_observer(self, observer) -> None:
+        """Отписать наблюдателя от событий всей компании"""
+        super().remove_observer(observer)
+        for dept in self.__departments:
+            dept.remove_observer(observer)
+        for proj in self.__projects:
+            proj.remove_observer(observer)
+
     def get_departments(self) -> List[Department]:
         """Получить список всех отделов"""
         return self.__departments.copy()
@@ -732,6 +939,9 @@ class Company:
                 )
 
         self.__projects.append(project)
+        for observer in self._observers:
+            project.add_observer(observer)
+        self._emit(ChangeEvent.PROJECT_ADDED, project=project)
 
     def remove_project(self, project_id: int) -> None:
         """Удалить проект из компании"""
@@ -742,6 +952,9 @@ class Company:
                         f"Проект {proj.name} имеет команду и не может быть удален"
                     )
                 del self.__projects[i]
+                for observer in self._observers:
+                    proj.remove_observer(observer)
+                self._emit(ChangeEvent.PROJECT_REMOVED, project=proj)
                 return
         raise ProjectNotFoundError(f"Проект с ID {project_id} не найден")
 
@@ -826,8 +1039,14 @@ class Company:
             }
         return stats
 
-    def get_project_budget_analysis(self) -> Dict[str, Any]:
-        """Анализ бюджетов проектов"""
+    def get_project_budget_analysis(self, as_of=None) -> Dict[str, Any]:
+        """Анализ бюджетов проектов
+
+        Args:
+            as_of: Момент проверки просрочки (по умолчанию текущее время,
+                снятое один раз на весь анализ)
+        """
+        reference = as_of_ordinal(as_of)
         analysis = {
             "total_projects": len(self.__projects),
             "by_status": {},
@@ -850,7 +1069,7 @@ class Company:
             total_team_size += proj.get_team_size()
 
             # Просроченные проекты
-            if proj.is_overdue() and proj.status in ["planning", "active"]:
+            if reference > proj.deadline_ordinal and proj.status in ["planning", "active"]:
                 analysis["overdue_projects"] += 1
 
         analysis["avg_team_size"] = (
@@ -871,10 +1090,21 @@ class Company:
             "projects": [proj.to_dict() for proj in self.__projects],
         }
 
-    def save_to_json(self, filename: str) -> None:
-        """Сохранить компанию в JSON файл"""
+    def save_to_json(self, filename: str, indent: Optional[int] = 2) -> None:
+        """
+        Сохранить компанию в JSON файл
+
+        С indent=None данные кодируются одним вызовом json.dumps на C:
+        компактный вывод в несколько раз быстрее, чем с отступами,
+        которые строит кодировщик на Python.
+
+        Args:
+            filename: Имя файла
+            indent: Отступ для читаемого вывода (None - компактно и быстро)
+        """
+        text = json.dumps(self.to_dict(), ensure_ascii=False, indent=indent)
         with open(filename, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+            f.write(text)
 
     @classmethod
     def load_from_json(cls, filename: str) -> "Company":
@@ -883,19 +1113,504 @@ class Company:
             data = json.load(f)
 
         company = cls(data["name"])
+        employees_by_id: Dict[int, AbstractEmployee] = {}
 
         # Сначала создаем отделы и сотрудников
         for dept_data in data["departments"]:
             department = Department.from_dict(dept_data, company)
             company.add_department(department)
+            for employee in department:
+                employees_by_id.setdefault(employee.id, employee)
 
-        # Затем создаем проекты и восстанавливаем связи
+        # Затем создаем проекты и восстанавливаем связи (через словарь ID,
+        # как find_employee_by_id, но без обхода всех отделов)
         for proj_data in data["projects"]:
-            project = Project.from_dict(proj_data, company)
+            project = Project.from_dict(proj_data)
+            for employee_id in proj_data.get("team", []):
+                employee = employees_by_id.get(employee_id)
+                if employee:
+                    try:
+                        project.add_team_member(employee)
+                    except (DuplicateIdError, ValueError):
+                        # Игнорируем ошибки при загрузке (уже в команде или перегружен)
+                        pass
             company.add_project(project)
 
         return company
 
+    # Снимок в SQLite
+    SQLITE_SCHEMA = """
+        CREATE TABLE company (name TEXT NOT NULL);
+        CREATE TABLE departments (
+            position INTEGER PRIMARY KEY,
+            code TEXT NOT NULL,
+            name TEXT NOT NULL
+        );
+        CREATE TABLE employees (
+            position INTEGER PRIMARY KEY,
+            department_position INTEGER NOT NULL,
+            type TEXT NOT NULL,
+            id INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            department TEXT NOT NULL,
+            base_salary REAL NOT NULL,
+            bonus REAL,
+            seniority_level TEXT,
+            commission_rate REAL,
+            sales_volume REAL
+        );
+        CREATE TABLE developer_skills (
+            employee_position INTEGER NOT NULL,
+            position INTEGER NOT NULL,
+            skill TEXT NOT NULL,
+            PRIMARY KEY (employee_position, position)
+        ) WITHOUT ROWID;
+        CREATE TABLE projects (
+            position INTEGER PRIMARY KEY,
+            project_id INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            description TEXT NOT NULL,
+            deadline TEXT NOT NULL,
+            status TEXT NOT NULL
+        );
+        CREATE TABLE project_team (
+            project_id INTEGER NOT NULL,
+            position INTEGER NOT NULL,
+            employee_id INTEGER NOT NULL,
+            PRIMARY KEY (project_id, position)
+        ) WITHOUT ROWID;
+    """
+    # Индексы строятся после загрузки строк - так быстрее, чем по одной
+    SQLITE_INDEXES = """
+        CREATE INDEX idx_employees_id ON employees (id);
+        CREATE INDEX idx_employees_department ON employees (department, type);
+        CREATE INDEX idx_developer_skills_skill ON developer_skills (skill);
+        CREATE INDEX idx_project_team_employee ON project_team (employee_id);
+    """
+
+    def to_sqlite_connection(self) -> sqlite3.Connection:
+        """
+        Загрузить компанию в новую базу SQLite в памяти
+
+        Строки каждой таблицы вставляются одним executemany в одной
+        транзакции, индексы строятся после вставки. База подходит для
+        тяжелых SQL-запросов по копии компании: закрытие соединения
+        освобождает копию.
+
+        Returns:
+            sqlite3.Connection: Соединение с базой ":memory:"
+        """
+        employee_rows = []
+        skill_rows = []
+        department_rows = []
+        for dept_position, dept in enumerate(self.__departments):
+            department_rows.append((dept_position, dept.code, dept.name))
+            for emp in dept:
+                position = len(employee_rows)
+                employee_rows.append(
+                    self._sqlite_employee_row(position, dept_position, emp)
+                )
+                if isinstance(emp, Developer):
+                    skill_rows.extend(
+                        (position, index, skill)
+                        for index, skill in enumerate(emp.tech_stack)
+                    )
+        project_rows = []
+        team_rows = []
+        for position, proj in enumerate(self.__projects):
+            project_rows.append(
+                (
+                    position,
+                    proj.project_id,
+                    proj.name,
+                    proj.description,
+                    proj.deadline.strftime("%Y-%m-%d"),
+                    proj.status,
+                )
+            )
+            team_rows.extend(
+                (proj.project_id, index, emp.id)
+                for index, emp in enumerate(proj.get_team())
+            )
+
+        connection = sqlite3.connect(":memory:")
+        try:
+            connection.executescript(self.SQLITE_SCHEMA)
+            with connection:
+                connection.execute("INSERT INTO company VALUES (?)", (self.name,))
+                connection.executemany(
+                    "INSERT INTO departments VALUES (?, ?, ?)", department_rows
+                )
+                connection.executemany(
+                    "INSERT INTO employees VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    employee_rows,
+                )
+                connection.executemany(
+                    "INSERT INTO developer_skills VALUES (?, ?, ?)", skill_rows
+                )
+                connection.executemany(
+                    "INSERT INTO projects VALUES (?, ?, ?, ?, ?, ?)", project_rows
+                )
+                connection.executemany(
+                    "INSERT INTO project_team VALUES (?, ?, ?)", team_rows
+                )
+            connection.executescript(self.SQLITE_INDEXES)
+        except Exception:
+            connection.close()
+            raise
+        return connection
+
+    @staticmethod
+    def _sqlite_employee_row(
+        position: int, dept_position: int, emp: AbstractEmployee
+    ) -> tuple:
+        emp_type = emp.__class__.__name__
+        if emp_type not in ("Employee", "Manager", "Developer", "Salesperson"):
+            raise ValueError(f"Тип сотрудника {emp_type} не поддерживается в SQLite")
+        bonus = seniority_level = commission_rate = sales_volume = None
+        if isinstance(emp, Manager):
+            bonus = emp.bonus
+        elif isinstance(emp, Developer):
+            seniority_level = emp.seniority_level
+        elif isinstance(emp, Salesperson):
+            commission_rate = emp.commission_rate
+            sales_volume = emp.sales_volume
+        return (
+            position,
+            dept_position,
+            emp_type,
+            emp.id,
+            emp.name,
+            emp.department,
+            emp.base_salary,
+            bonus,
+            seniority_level,
+            commission_rate,
+            sales_volume,
+        )
+
+    def to_sqlite(self, filename: str) -> None:
+        """
+        Сохранить компанию в файл базы SQLite
+
+        Компания загружается в базу в памяти (to_sqlite_connection), а
+        затем страницы базы копируются в файл online backup API. Файл
+        перезаписывается целиком.
+
+        Args:
+            filename: Имя файла базы
+        """
+        source = self.to_sqlite_connection()
+        try:
+            target = sqlite3.connect(filename)
+            try:
+                source.backup(target)
+            finally:
+                target.close()
+        finally:
+            source.close()
+
+    @classmethod
+    def from_sqlite(cls, filename: str) -> "Company":
+        """
+        Загрузить компанию из файла базы SQLite
+
+        Файл копируется в базу в памяти online backup API, после чего
+        объекты строятся из нее (from_sqlite_connection).
+
+        Args:
+            filename: Имя файла базы, записанного to_sqlite
+        """
+        if not os.path.exists(filename):
+            raise FileNotFoundError(f"Файл {filename} не найден")
+        connection = sqlite3.connect(":memory:")
+        try:
+            source = sqlite3.connect(filename)
+            try:
+                source.backup(connection)
+            finally:
+                source.close()
+            return cls.from_sqlite_connection(connection)
+        finally:
+            connection.close()
+
+    @classmethod
+    def from_sqlite_connection(cls, connection: sqlite3.Connection) -> "Company":
+        """
+        Построить компанию по базе со схемой SQLITE_SCHEMA
+
+        Каждая таблица читается одним запросом. Команды проектов
+        восстанавливаются так же, как в load_from_json.
+        """
+        name_row = connection.execute("SELECT name FROM company").fetchone()
+        if name_row is None:
+            raise ValueError("В базе нет данных компании")
+        company = cls(name_row[0])
+
+        skills: Dict[int, List[str]] = {}
+        for position, skill in connection.execute(
+            "SELECT employee_position, skill FROM developer_skills "
+            "ORDER BY employee_position, position"
+        ):
+            skills.setdefault(position, []).append(skill)
+
+        departments = [
+            Department(name, code)
+            for code, name in connection.execute(
+                "SELECT code, name FROM departments ORDER BY position"
+            )
+        ]
+        employees_by_id: Dict[int, AbstractEmployee] = {}
+        for row in connection.execute(
+            "SELECT position, department_position, type, id, name, department, "
+            "base_salary, bonus, seniority_level, commission_rate, sales_volume "
+            "FROM employees ORDER BY position"
+        ):
+            (position, dept_position, emp_type, emp_id, name, department,
+             base_salary, bonus, seniority_level, commission_rate, sales_volume) = row
+            if emp_type == "Manager":
+                employee = Manager(emp_id, name, department, base_salary, bonus)
+            elif emp_type == "Developer":
+                employee = Developer(
+                    emp_id,
+                    name,
+                    department,
+                    base_salary,
+                    skills.get(position, []),
+                    seniority_level,
+                )
+            elif emp_type == "Salesperson":
+                employee = Salesperson(
+                    emp_id, name, department, base_salary, commission_rate, sales_volume
+                )
+            else:
+                employee = Employee(emp_id, name, department, base_salary)
+            employees_by_id.setdefault(emp_id, employee)
+            departments[dept_position].add_employee(employee)
+        for department in departments:
+            company.add_department(department)
+
+        teams: Dict[int, List[int]] = {}
+        for project_id, employee_id in connection.execute(
+            "SELECT project_id, employee_id FROM project_team "
+            "ORDER BY project_id, position"
+        ):
+            teams.setdefault(project_id, []).append(employee_id)
+        for project_id, name, description, deadline, status in connection.execute(
+            "SELECT project_id, name, description, deadline, status FROM projects "
+            "ORDER BY position"
+        ):
+            project = Project(project_id, name, description, deadline, status)
+            for employee_id in teams.get(project_id, []):
+                employee = employees_by_id.get(employee_id)
+                if employee:
+                    try:
+                        project.add_team_member(employee)
+                    except (DuplicateIdError, ValueError):
+                        # Игнорируем ошибки при загрузке (уже в команде или перегружен)
+                        pass
+            company.add_project(project)
+        return company
+
+    # Импорт из CSV
+    EMPLOYEE_CSV_REQUIRED = ("ID", "Имя", "Отдел", "Должность", "Базовая зарплата")
+    PROJECT_CSV_REQUIRED = ("ID", "Название", "Дедлайн")
+    CSV_LIST_SEPARATOR = ";"
+
+    def import_employees_csv(
+        self, filename: str, create_departments: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Импорт сотрудников из CSV
+
+        Читает колонки export_employees_csv. Параметры отдельных типов
+        берутся из необязательных колонок "Бонус", "Уровень",
+        "Стек технологий" (через ";"), "Ставка комиссии" и "Объем продаж".
+        Бонус менеджера и уровень разработчика при их отсутствии
+        восстанавливаются по колонке "Итоговая зарплата".
+
+        Файл читается построчно, строки с ошибками пропускаются и
+        попадают в список ошибок, исключения по строкам не выбрасываются.
+
+        Args:
+            filename: Имя CSV файла
+            create_departments: Создавать отсутствующие отделы (код = название)
+
+        Returns:
+            Dict[str, Any]: {"imported": число сотрудников,
+            "errors": [(номер строки, описание ошибки), ...]}
+        """
+        departments = {dept.code: dept for dept in self.__departments}
+        known_ids = {emp.id for emp in self.get_all_employees()}
+        errors = []
+        imported = 0
+
+        with open(filename, "r", newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            self._check_csv_columns(reader.fieldnames, self.EMPLOYEE_CSV_REQUIRED)
+            for row in reader:
+                try:
+                    employee = self._employee_from_csv_row(row)
+                    if employee.id in known_ids:
+                        raise DuplicateIdError(f"Сотрудник с ID {employee.id} уже существует")
+                    department = departments.get(employee.department)
+                    if department is None:
+                        if not create_departments:
+                            raise DepartmentNotFoundError(
+                                f"Отдел с кодом {employee.department} не найден"
+                            )
+                        department = Department(employee.department, employee.department)
+                        self.add_department(department)
+                        departments[department.code] = department
+                except (ValueError, TypeError, DuplicateIdError, DepartmentNotFoundError) as e:
+                    errors.append((reader.line_num, str(e)))
+                    continue
+                known_ids.add(employee.id)
+                department.add_employee(employee)
+                imported += 1
+
+        return {"imported": imported, "errors": errors}
+
+    def import_projects_csv(self, filename: str) -> Dict[str, Any]:
+        """
+        Импорт проектов из CSV
+
+        Обязательные колонки: "ID", "Название", "Дедлайн" (YYYY-MM-DD).
+        Необязательные: "Статус" (по умолчанию planning), "Описание" и
+        "Команда" - ID сотрудников через ";". Ошибки строк и участников
+        команды собираются в список, проект с неизвестным участником
+        импортируется без него.
+
+        Returns:
+            Dict[str, Any]: {"imported": число проектов,
+            "errors": [(номер строки, описание ошибки), ...]}
+        """
+        known_ids = {proj.project_id for proj in self.__projects}
+        employees_by_id = None
+        errors = []
+        imported = 0
+
+        with open(filename, "r", newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            self._check_csv_columns(reader.fieldnames, self.PROJECT_CSV_REQUIRED)
+            for row in reader:
+                try:
+                    project_id = int(self._csv_field(row, "ID"))
+                    if project_id in known_ids:
+                        raise DuplicateIdError(f"Проект с ID {project_id} уже существует")
+                    status = (row.get("Статус") or "").strip() or "planning"
+                    if status not in Project.VALID_STATUSES:
+                        raise InvalidStatusError(
+                            f"Неверный статус {status}. "
+                            f'Допустимые: {", ".join(Project.VALID_STATUSES)}'
+                        )
+                    project = Project(
+                        project_id,
+                        self._csv_field(row, "Название"),
+                        (row.get("Описание") or "").strip(),
+                        self._csv_field(row, "Дедлайн"),
+                        status,
+                    )
+                    team = [
+                        int(item)
+                        for item in (row.get("Команда") or "").split(self.CSV_LIST_SEPARATOR)
+                        if item.strip()
+                    ]
+                except (ValueError, DuplicateIdError, InvalidStatusError) as e:
+                    errors.append((reader.line_num, str(e)))
+                    continue
+
+                if team and employees_by_id is None:
+                    employees_by_id = {}
+                    for emp in self.get_all_employees():
+                        employees_by_id.setdefault(emp.id, emp)
+                for employee_id in team:
+                    employee = employees_by_id.get(employee_id)
+                    if employee is None:
+                        errors.append(
+                            (reader.line_num, f"Сотрудник с ID {employee_id} не найден")
+                        )
+                        continue
+                    try:
+                        project.add_team_member(employee)
+                    except (DuplicateIdError, ValueError) as e:
+                        errors.append((reader.line_num, str(e)))
+                known_ids.add(project_id)
+                self.add_project(project)
+                imported += 1
+
+        return {"imported": imported, "errors": errors}
+
+    @staticmethod
+    def _check_csv_columns(fieldnames, required) -> None:
+        missing = [name for name in required if name not in (fieldnames or [])]
+        if missing:
+            raise ValueError(f"В CSV отсутствуют колонки: {', '.join(missing)}")
+
+    @staticmethod
+    def _csv_field(row: Dict[str, str], name: str) -> str:
+        value = (row.get(name) or "").strip()
+        if not value:
+            raise ValueError(f"Не заполнено поле '{name}'")
+        return value
+
+    @classmethod
+    def _employee_from_csv_row(cls, row: Dict[str, str]) -> AbstractEmployee:
+        """Создать сотрудника по строке CSV с проверкой значений"""
+        emp_type = cls._csv_field(row, "Должность").lower()
+        emp_id = int(cls._csv_field(row, "ID"))
+        if emp_id < 1:
+            raise ValueError("ID сотрудника должен быть положительным")
+        base_salary = float(cls._csv_field(row, "Базовая зарплата"))
+        if base_salary < 0:
+            raise ValueError("Базовая зарплата не может быть отрицательной")
+        data = {
+            "id": emp_id,
+            "name": cls._csv_field(row, "Имя"),
+            "department": cls._csv_field(row, "Отдел"),
+            "base_salary": base_salary,
+        }
+        total = (row.get("Итоговая зарплата") or "").strip()
+
+        if emp_type == "manager":
+            bonus = (row.get("Бонус") or "").strip()
+            if bonus:
+                data["bonus"] = float(bonus)
+            elif total:
+                data["bonus"] = float(total) - base_salary
+            else:
+                raise ValueError("Для менеджера нужна колонка 'Бонус' или 'Итоговая зарплата'")
+            if data["bonus"] < 0:
+                raise ValueError("Бонус менеджера не может быть отрицательным")
+        elif emp_type == "developer":
+            level = (row.get("Уровень") or "").strip()
+            if not level and total and base_salary > 0:
+                ratio = float(total) / base_salary
+                level = next(
+                    (
+                        name
+                        for name, multiplier in Developer.SENIORITY_MULTIPLIERS.items()
+                        if abs(ratio - multiplier) < 1e-9
+                    ),
+                    "",
+                )
+            if level not in Developer.SENIORITY_MULTIPLIERS:
+                raise ValueError(f"Некорректный уровень разработчика: '{level}'")
+            data["seniority_level"] = level
+            data["tech_stack"] = [
+                tech.strip()
+                for tech in (row.get("Стек технологий") or "").split(cls.CSV_LIST_SEPARATOR)
+                if tech.strip()
+            ]
+        elif emp_type == "salesperson":
+            data["commission_rate"] = float(cls._csv_field(row, "Ставка комиссии"))
+            data["sales_volume"] = float(cls._csv_field(row, "Объем продаж"))
+            if not 0 <= data["commission_rate"] <= 1:
+                raise ValueError("Ставка комиссии должна быть между 0 и 1")
+            if data["sales_volume"] < 0:
+                raise ValueError("Объем продаж не может быть отрицательным")
+        return EmployeeFactory.create_employee(emp_type, **data)
+
     # Экспорт отчетов
     def export_employees_csv(self, filename: str) -> None:
         """Экспорт сотрудников в CSV"""
@@ -926,8 +1641,10 @@ class Company:
                     ]
                 )
 
-    def export_projects_csv(self, filename: str) -> None:
-        """Экспорт проектов в CSV"""
+    def export_projects_csv(self, filename: str, as_of=None) -> None:
+        """Экспорт проектов в CSV (сроки считаются от одного момента as_of)"""
+        reference = as_of_ordinal(as_of)
+        days_left = [proj.deadline_ordinal - reference for proj in self.__projects]
         with open(filename, "w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
             writer.writerow(
@@ -942,7 +1659,7 @@ class Company:
                 ]
             )
 
-            for proj in self.__projects:
+            for proj, days in zip(self.__projects, days_left):
                 writer.writerow(
                     [
                         proj.project_id,
@@ -951,11 +1668,11 @@ class Company:
                         proj.deadline.strftime("%Y-%m-%d"),
                         proj.get_team_size(),
                         proj.calculate_total_salary(),
-                        proj.days_until_deadline(),
+                        days,
                     ]
                 )
 
-    def export_financial_report(self, filename: str) -> None:
+    def export_financial_report(self, filename: str, as_of=None) -> None:
         """Экспорт финансового отчета"""
         with open(filename, "w", encoding="utf-8") as f:
             f.write("ФИНАНСОВЫЙ ОТЧЕТ КОМПАНИИ\n")
@@ -975,7 +1692,7 @@ class Company:
                 )
 
             f.write("\nАНАЛИЗ ПРОЕКТОВ:\n")
-            analysis = self.get_project_budget_analysis()
+            analysis = self.get_project_budget_analysis(as_of)
             f.write(f"Всего проектов: {analysis['total_projects']}\n")
             f.write(f"Общий бюджет: {analysis['total_budget']:.2f}\n")
             f.write(f"Средний размер команды: {analysis['avg_team_size']:.1f}\n")
@@ -1036,16 +1753,10 @@ class EmployeeFactory:
     @staticmethod
     def from_dict(data: dict, company: "Company" = None) -> AbstractEmployee:
         employee_type = data.get("type")
-        if employee_type == "Employee":
-            return Employee.from_dict(data, company)
-        elif employee_type == "Manager":
-            return Manager.from_dict(data, company)
-        elif employee_type == "Developer":
-            return Developer.from_dict(data, company)
-        elif employee_type == "Salesperson":
-            return Salesperson.from_dict(data, company)
-        else:
+        codec = AbstractEmployee._codecs.get(employee_type)
+        if codec is None:
             raise ValueError(f"Неизвестный тип сотрудника в словаре: {employee_type}")
+        return codec.cls.from_dict(data, company)
 
 
 # Функции-компараторы (из предыдущего кода)
@@ -0,0 +1,261 @@
+"""Хранилище истории выплат: колоночные срезы по каждому запуску расчета"""
+
+import json
+import os
+from array import array
+from datetime import date
+from typing import List, Dict, Any, Optional, Tuple, Union
+
+from source_code.part4 import Company, DuplicateIdError
+
+
+class PayrollHistoryStore:
+    """Хранилище истории зарплат по запускам расчета
+
+    Каждый запуск сохраняется отдельным компактным файлом с колонками
+    id, отдел, тип и итоговая зарплата сотрудника. Итоги по отделам и
+    типам для всех запусков хранятся в общем индексе, поэтому запросы по
+    отделу или типу не открывают файлы запусков, а запрос по сотруднику
+    читает только колонки нужных запусков.
+    """
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, directory: str):
+        self.__directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.__index_path = os.path.join(directory, self.INDEX_FILE)
+        if os.path.exists(self.__index_path):
+            with open(self.__index_path, "r", encoding="utf-8") as f:
+                self.__runs: List[Dict[str, Any]] = json.load(f)["runs"]
+        else:
+            self.__runs = []
+
+    @property
+    def directory(self):
+        return self.__directory
+
+    # Запись
+    def append_run(self, company: Company, run_date: Union[str, date]) -> Dict[str, Any]:
+        """
+        Добавить срез зарплат компании за запуск
+
+        Args:
+            company: Компания для среза
+            run_date: Дата запуска (YYYY-MM-DD или date)
+
+        Returns:
+            Dict[str, Any]: Итоги запуска, записанные в индекс
+        """
+        run = self._run_key(run_date)
+        if any(entry["run"] == run for entry in self.__runs):
+            raise DuplicateIdError(f"Запуск {run} уже сохранен")
+
+        departments: List[str] = []
+        types: List[str] = []
+        type_codes: Dict[str, int] = {}
+        ids = array("q")
+        dept_column = array("H")
+        type_column = array("B")
+        salaries = array("d")
+        dept_rollups: Dict[str, Dict[str, Any]] = {}
+        type_rollups: Dict[str, Dict[str, Any]] = {}
+
+        for dept in company.get_departments():
+            dept_code = len(departments)
+            departments.append(dept.code)
+            rollup = dept_rollups.setdefault(
+                dept.code, {"total": 0.0, "count": 0, "by_type": {}}
+            )
+            for emp in dept:
+                emp_type = emp.__class__.__name__
+                if emp_type not in type_codes:
+                    type_codes[emp_type] = len(types)
+                    types.append(emp_type)
+                salary = emp.calculate_salary()
+
+                ids.append(emp.id)
+                dept_column.append(dept_code)
+                type_column.append(type_codes[emp_type])
+                salaries.append(salary)
+
+                rollup["total"] += salary
+                rollup["count"] += 1
+                rollup["by_type"][emp_type] = rollup["by_type"].get(emp_type, 0.0) + salary
+                type_rollup = type_rollups.setdefault(emp_type, {"total": 0.0, "count": 0})
+                type_rollup["total"] += salary
+                type_rollup["count"] += 1
+
+        filename = f"run_{run}.bin"
+        header = {
+            "run": run,
+            "count": len(ids),
+            "departments": departments,
+            "types": types,
+        }
+        with open(os.path.join(self.__directory, filename), "wb") as f:
+            f.write(json.dumps(header, ensure_ascii=False).encode("utf-8") + b"\n")
+            for column in (ids, dept_column, type_column, salaries):
+                column.tofile(f)
+
+        entry = {
+            "run": run,
+            "file": filename,
+            "employee_count": len(ids),
+            "total": sum(salaries),
+            "departments": dept_rollups,
+            "types": type_rollups,
+        }
+        self.__runs.append(entry)
+        self.__runs.sort(key=lambda item: item["run"])
+        self._save_index()
+        return entry
+
+    def _save_index(self) -> None:
+        tmp_path = self.__index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"runs": self.__runs}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.__index_path)
+
+    @staticmethod
+    def _run_key(run_date: Union[str, date, None]) -> Optional[str]:
+        if run_date is None:
+            return None
+        if isinstance(run_date, date):
+            return run_date.isoformat()
+        return date.fromisoformat(run_date).isoformat()
+
+    # Чтение
+    def runs(self, start=None, end=None) -> List[str]:
+        """Список запусков в диапазоне дат [start, end]"""
+        return [entry["run"] for entry in self._select(start, end)]
+
+    def _select(self, start, end) -> List[Dict[str, Any]]:
+        start, end = self._run_key(start), self._run_key(end)
+        return [
+            entry
+            for entry in self.__runs
+            if (start is None or entry["run"] >= start)
+            and (end is None or entry["run"] <= end)
+        ]
+
+    def totals(
+        self,
+        department: Optional[str] = None,
+        emp_type: Optional[str] = None,
+        start=None,
+        end=None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Итоговые выплаты по каждому запуску из индекса
+
+        Args:
+            department: Код отдела (None - все отделы)
+            emp_type: Тип сотрудника, например "Developer" (None - все типы)
+            start: Начало диапазона дат
+            end: Конец диапазона дат
+
+        Returns:
+            List[Tuple[str, float]]: Пары (запуск, сумма выплат)
+        """
+        result = []
+        for entry in self._select(start, end):
+            if department is not None:
+                rollup = entry["departments"].get(department)
+                if rollup is None:
+                    total = 0.0
+                elif emp_type is not None:
+                    total = rollup["by_type"].get(emp_type, 0.0)
+                else:
+                    total = rollup["total"]
+            elif emp_type is not None:
+                total = entry["types"].get(emp_type, {}).get("total", 0.0)
+            else:
+                total = entry["total"]
+            result.append((entry["run"], total))
+        return result
+
+    def total_payroll(
+        self,
+        department: Optional[str] = None,
+        emp_type: Optional[str] = None,
+        start=None,
+        end=None,
+    ) -> float:
+        """Сумма выплат за диапазон запусков"""
+        return sum(total for _, total in self.totals(department, emp_type, start, end))
+
+    def trend(
+        self,
+        department: Optional[str] = None,
+        emp_type: Optional[str] = None,
+        start=None,
+        end=None,
+    ) -> List[Dict[str, Any]]:
+        """Динамика выплат: сумма и изменение относительно предыдущего запуска"""
+        trend = []
+        previous = None
+        for run, total in self.totals(department, emp_type, start, end):
+            change = None if previous is None else total - previous
+            trend.append({"run": run, "total": total, "change": change})
+            previous = total
+        return trend
+
+    def employee_history(
+        self, employee_id: int, start=None, end=None
+    ) -> List[Tuple[str, float]]:
+        """
+        Зарплата сотрудника по запускам
+
+        Читает из файлов запусков только колонки id и зарплаты.
+
+        Returns:
+            List[Tuple[str, float]]: Пары (запуск, зарплата) для запусков,
+            в которых сотрудник присутствовал
+        """
+        history = []
+        for entry in self._select(start, end):
+            ids, salaries = self._read_columns(entry)
+            try:
+                position = ids.index(employee_id)
+            except ValueError:
+                continue
+            history.append((entry["run"], salaries[position]))
+        return history
+
+    def _read_columns(self, entry: Dict[str, Any]) -> Tuple[array, array]:
+        count = entry["employee_count"]
+        with open(os.path.join(self.__directory, entry["file"]), "rb") as f:
+            f.readline()
+            ids = array("q")
+            ids.fromfile(f, count)
+            # Колонки отделов и типов пропускаются без чтения
+            f.seek(count * (array("H").itemsize + array("B").itemsize), os.SEEK_CUR)
+            salaries = array("d")
+            salaries.fromfile(f, count)
+        return ids, salaries
+
+    def load_run(self, run_date: Union[str, date]) -> List[Dict[str, Any]]:
+        """Полный срез одного запуска в виде списка записей"""
+        run = self._run_key(run_date)
+        entry = next((item for item in self.__runs if item["run"] == run), None)
+        if entry is None:
+            raise KeyError(f"Запуск {run} не найден")
+        count = entry["employee_count"]
+        with open(os.path.join(self.__directory, entry["file"]), "rb") as f:
+            header = json.loads(f.readline())
+            columns = []
+            for typecode in ("q", "H", "B", "d"):
+                column = array(typecode)
+                column.fromfile(f, count)
+                columns.append(column)
+        ids, dept_column, type_column, salaries = columns
+        return [
+            {
+                "id": ids[i],
+                "department": header["departments"][dept_column[i]],
+                "type": header["types"][type_column[i]],
+                "salary": salaries[i],
+            }
+            for i in range(count)
+        ]
@@ -0,0 +1,309 @@
+"""Хранение компании в каталоге: отдельный файл на каждый отдел"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional, Set
+
+from source_code.part4 import (
+    AbstractEmployee,
+    ChangeEvent,
+    Company,
+    Department,
+    DuplicateIdError,
+    Project,
+)
+from source_code.parallel_loader import ParallelCompanyLoader, build_department
+
+
+class ShardedCompanyStore:
+    """Каталог компании: manifest.json, projects.json и файл на каждый отдел
+
+    Хранилище подписывается на события сохраненной или загруженной
+    компании и помечает затронутые отделы как измененные. Повторный save
+    перезаписывает только файлы измененных отделов, файл проектов (если
+    менялись проекты или команды) и манифест. Каждый файл пишется во
+    временный и заменяется через os.replace, манифест - последним.
+
+    Изменения без событий (например, переименование отдела или
+    сотрудника) нужно отметить вручную через mark_dirty.
+    """
+
+    MANIFEST_FILE = "manifest.json"
+    PROJECTS_FILE = "projects.json"
+    FORMAT_VERSION = 1
+
+    def __init__(self, directory: str, workers: Optional[int] = None):
+        """
+        Args:
+            directory: Каталог хранилища
+            workers: Число процессов разбора отделов при загрузке
+                (None - по числу процессоров, 0 - в текущем процессе)
+        """
+        self.__directory = directory
+        self.workers = workers
+        self.__company: Optional[Company] = None
+        # Файлы отделов по коду (имена файлов не зависят от кода)
+        self.__files: Dict[str, str] = {}
+        self.__next_file = 0
+        # Отдел каждого сотрудника: события зарплаты и команд приходят от сотрудника
+        self.__owners: Dict[int, Department] = {}
+        self.__dirty: Set[str] = set()
+        self.__projects_dirty = False
+        self.__manifest_dirty = False
+
+    @property
+    def directory(self) -> str:
+        return self.__directory
+
+    @property
+    def dirty_departments(self) -> Set[str]:
+        """Коды отделов, которые будут перезаписаны при следующем save"""
+        return set(self.__dirty)
+
+    @property
+    def projects_dirty(self) -> bool:
+        return self.__projects_dirty
+
+    def mark_dirty(self, code: Optional[str] = None) -> None:
+        """Отметить отдел (или, без кода, файл проектов) как измененный"""
+        if code is None:
+            self.__projects_dirty = True
+        else:
+            self.__dirty.add(code)
+        self.__manifest_dirty = True
+
+    # Подключение к компании
+    def _attach(self, company: Company) -> None:
+        self.close()
+        self.__company = company
+        self.__owners = {
+            id(emp): dept for dept in company.get_departments() for emp in dept
+        }
+        self.__dirty.clear()
+        self.__projects_dirty = False
+        self.__manifest_dirty = False
+        company.add_observer(self)
+
+    def close(self) -> None:
+        """Отписаться от компании"""
+        if self.__company is not None:
+            self.__company.remove_observer(self)
+            self.__company = None
+        self.__owners = {}
+
+    def __enter__(self) -> "ShardedCompanyStore":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def update(self, subject, event: ChangeEvent) -> None:
+        """Пометить затронутые файлы (интерфейс наблюдателя)"""
+        kind = event.kind
+        payload = event.payload
+        if kind == ChangeEvent.EMPLOYEE_ADDED:
+            self.__owners[id(payload["employee"])] = payload["department"]
+            self.__dirty.add(payload["department"].code)
+            self.__manifest_dirty = True
+        elif kind == ChangeEvent.EMPLOYEE_REMOVED:
+            self.__owners.pop(id(payload["employee"]), None)
+            self.__dirty.add(payload["department"].code)
+            self.__manifest_dirty = True
+        elif kind == ChangeEvent.SALARY_CHANGED:
+            self._mark_owner(payload["employee"])
+        elif kind in (ChangeEvent.TEAM_MEMBER_ADDED, ChangeEvent.TEAM_MEMBER_REMOVED):
+            # ID проектов хранятся и в команде проекта, и у сотрудника
+            self._mark_owner(payload["employee"])
+            self.__projects_dirty = True
+        elif kind in (
+            ChangeEvent.STATUS_CHANGED,
+            ChangeEvent.PROJECT_ADDED,
+            ChangeEvent.PROJECT_REMOVED,
+        ):
+            self.__projects_dirty = True
+        elif kind == ChangeEvent.DEPARTMENT_ADDED:
+            department = payload["department"]
+            for emp in department:
+                self.__owners[id(emp)] = department
+            self.__dirty.add(department.code)
+            self.__manifest_dirty = True
+        elif kind == ChangeEvent.DEPARTMENT_REMOVED:
+            self.__dirty.discard(payload["department"].code)
+            self.__manifest_dirty = True
+
+    def _mark_owner(self, employee: AbstractEmployee) -> None:
+        department = self.__owners.get(id(employee))
+        if department is not None:
+            self.__dirty.add(department.code)
+
+    # Сохранение
+    def save(self, company: Optional[Company] = None) -> Dict[str, Any]:
+        """
+        Сохранить компанию
+
+        Новая компания (или первый вызов) записывается целиком и
+        подключается к хранилищу; для подключенной компании
+        перезаписываются только измененные файлы.
+
+        Args:
+            company: Компания (по умолчанию подключенная)
+
+        Returns:
+            Dict[str, Any]: Коды записанных отделов и признак записи проектов
+        """
+        if company is None:
+            company = self.__company
+            if company is None:
+                raise ValueError("Хранилище не подключено к компании")
+        departments = company.get_departments()
+        if company is not self.__company:
+            self._attach(company)
+            self.__files = self._read_manifest_files()
+            self.__dirty = {dept.code for dept in departments}
+            self.__projects_dirty = True
+            self.__manifest_dirty = True
+
+        os.makedirs(self.__directory, exist_ok=True)
+        written = []
+        for dept in departments:
+            if dept.code not in self.__files:
+                self.__files[dept.code] = self._new_file_name()
+                self.__dirty.add(dept.code)
+            if dept.code in self.__dirty:
+                self._write_json(self.__files[dept.code], dept.to_dict())
+                written.append(dept.code)
+        projects_written = self.__projects_dirty
+        if projects_written:
+            self._write_json(
+                self.PROJECTS_FILE, [proj.to_dict() for proj in company.get_projects()]
+            )
+
+        if self.__manifest_dirty or written or projects_written:
+            codes = {dept.code for dept in departments}
+            stale = [name for code, name in self.__files.items() if code not in codes]
+            self.__files = {dept.code: self.__files[dept.code] for dept in departments}
+            self._write_json(self.MANIFEST_FILE, self._manifest(company))
+            # Файлы удаленных отделов убираются после записи нового манифеста
+            for name in stale:
+                path = os.path.join(self.__directory, name)
+                if os.path.exists(path):
+                    os.remove(path)
+
+        self.__dirty.clear()
+        self.__projects_dirty = False
+        self.__manifest_dirty = False
+        return {"departments": written, "projects": projects_written}
+
+    def _manifest(self, company: Company) -> Dict[str, Any]:
+        return {
+            "version": self.FORMAT_VERSION,
+            "name": company.name,
+            "next_file": self.__next_file,
+            "departments": [
+                {
+                    "code": dept.code,
+                    "name": dept.name,
+                    "file": self.__files[dept.code],
+                    "employees": dept.employee_count,
+                }
+                for dept in company.get_departments()
+            ],
+            "projects": self.PROJECTS_FILE,
+        }
+
+    def _read_manifest_files(self) -> Dict[str, str]:
+        """Имена файлов отделов из существующего манифеста (для перезаписи)"""
+        manifest = self.read_manifest()
+        if manifest is None:
+            return {}
+        self.__next_file = max(self.__next_file, manifest.get("next_file", 0))
+        return {item["code"]: item["file"] for item in manifest["departments"]}
+
+    def _new_file_name(self) -> str:
+        used = set(self.__files.values())
+        while True:
+            name = f"department_{self.__next_file}.json"
+            self.__next_file += 1
+            if name not in used:
+                return name
+
+    def _write_json(self, name: str, data: Any) -> None:
+        path = os.path.join(self.__directory, name)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    # Загрузка
+    def read_manifest(self) -> Optional[Dict[str, Any]]:
+        """Манифест хранилища или None, если компания еще не сохранялась"""
+        path = os.path.join(self.__directory, self.MANIFEST_FILE)
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != self.FORMAT_VERSION:
+            raise ValueError(f"Неподдерживаемая версия хранилища: {manifest.get('version')}")
+        return manifest
+
+    def load(self) -> Company:
+        """
+        Загрузить компанию и подключить ее к хранилищу
+
+        Файлы отделов разбираются параллельно в пуле процессов
+        ParallelCompanyLoader (разбор JSON в потоках держал бы GIL).
+        Команды проектов восстанавливаются в конце через словарь
+        ID -> сотрудник, поэтому сотрудники разных отделов связываются
+        без поиска.
+        """
+        manifest = self.read_manifest()
+        if manifest is None:
+            raise FileNotFoundError(f"В каталоге {self.__directory} нет сохраненной компании")
+        entries = manifest["departments"]
+        paths = [os.path.join(self.__directory, entry["file"]) for entry in entries]
+        parsed = ParallelCompanyLoader(self.workers).parse(paths)
+        departments = [
+            build_department(record)
+            for item in parsed
+            for record in item["departments"]
+        ]
+        projects_data = self._read_json(manifest["projects"])
+
+        company = Company(manifest["name"])
+        employees_by_id: Dict[int, AbstractEmployee] = {}
+        for department in departments:
+            for employee in department:
+                employees_by_id.setdefault(employee.id, employee)
+            company.add_department(department)
+
+        for data in projects_data:
+            company.add_project(self._build_project(data, employees_by_id))
+
+        self._attach(company)
+        self.__files = {item["code"]: item["file"] for item in entries}
+        self.__next_file = manifest.get("next_file", len(entries))
+        return company
+
+    def _read_json(self, name: str) -> Any:
+        with open(os.path.join(self.__directory, name), "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    @staticmethod
+    def _build_project(
+        data: Dict[str, Any], employees_by_id: Dict[int, AbstractEmployee]
+    ) -> Project:
+        project = Project.from_dict(data)
+        for employee_id in data.get("team", []):
+            employee = employees_by_id.get(employee_id)
+            if employee:
+                try:
+                    project.add_team_member(employee)
+                except (DuplicateIdError, ValueError):
+                    # Как и в load_from_json: уже в команде или перегружен
+                    pass
+        return project
+
+    def department_files(self) -> List[str]:
+        """Имена файлов отделов в порядке манифеста"""
+        manifest = self.read_manifest()
+        return [] if manifest is None else [item["file"] for item in manifest["departments"]]
@@ -0,0 +1,323 @@
+"""Потоковые квантильные скетчи (KLL) для распределений зарплат"""
+
+import csv
+import math
+import random
+from typing import List, Dict, Optional, Tuple, Iterable
+
+from source_code.part4 import AbstractEmployee, Company
+
+
+class KLLSketch:
+    """Квантильный скетч KLL с ограниченной памятью
+
+    Хранит иерархию компакторов: элемент уровня h имеет вес 2**h.
+    Размер скетча определяется параметром k и не зависит от числа
+    значений, а погрешность ранга составляет примерно 1.7 / k.
+    Скетчи с одинаковым k можно объединять через merge.
+    """
+
+    RANK_ERROR_FACTOR = 1.7
+    _CAPACITY_DECAY = 2 / 3
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None):
+        """
+        Args:
+            k: Параметр точности (больше - точнее и больше памяти)
+            seed: Зерно генератора для воспроизводимого сжатия
+        """
+        if k < 8:
+            raise ValueError("Параметр k должен быть не меньше 8")
+        self.__k = k
+        self.__random = random.Random(seed)
+        self.__compactors: List[List[float]] = []
+        self.__size = 0
+        self.__max_size = 0
+        self.__count = 0
+        self.__min: Optional[float] = None
+        self.__max: Optional[float] = None
+        self._grow()
+
+    @classmethod
+    def for_error(cls, epsilon: float, seed: Optional[int] = None) -> "KLLSketch":
+        """Создать скетч с погрешностью ранга не больше epsilon (примерно)"""
+        if not 0 < epsilon < 1:
+            raise ValueError("Погрешность должна быть между 0 и 1")
+        return cls(max(8, math.ceil(cls.RANK_ERROR_FACTOR / epsilon)), seed)
+
+    @property
+    def k(self):
+        return self.__k
+
+    @property
+    def count(self):
+        """Количество добавленных значений"""
+        return self.__count
+
+    @property
+    def rank_error(self):
+        """Ожидаемая нормированная погрешность ранга"""
+        return self.RANK_ERROR_FACTOR / self.__k
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.__compactors) - level - 1
+        return max(2, math.ceil(self.__k * self._CAPACITY_DECAY**depth))
+
+    def _grow(self) -> None:
+        self.__compactors.append([])
+        self.__max_size = sum(self._capacity(h) for h in range(len(self.__compactors)))
+
+    def update(self, value: float) -> None:
+        """Добавить значение в скетч"""
+        value = float(value)
+        self.__compactors[0].append(value)
+        self.__size += 1
+        self.__count += 1
+        if self.__min is None or value < self.__min:
+            self.__min = value
+        if self.__max is None or value > self.__max:
+            self.__max = value
+        if self.__size >= self.__max_size:
+            self._compress()
+
+    def extend(self, values: Iterable[float]) -> None:
+        """Добавить несколько значений"""
+        for value in values:
+            self.update(value)
+
+    def _compress(self) -> None:
+        for level in range(len(self.__compactors)):
+            if len(self.__compactors[level]) >= self._capacity(level):
+                if level + 1 >= len(self.__compactors):
+                    self._grow()
+                compactor = sorted(self.__compactors[level])
+                # Нечетный элемент остается на своем уровне
+                leftover = [compactor.pop()] if len(compactor) % 2 else []
+                offset = self.__random.randint(0, 1)
+                self.__compactors[level + 1].extend(compactor[offset::2])
+                self.__compactors[level] = leftover
+                self.__size = sum(len(c) for c in self.__compactors)
+                if self.__size < self.__max_size:
+                    break
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        """Объединить с другим скетчем (на месте), вернуть self"""
+        if not isinstance(other, KLLSketch):
+            raise TypeError("Можно объединять только объекты KLLSketch")
+        if other.k != self.__k:
+            raise ValueError("Объединять можно только скетчи с одинаковым k")
+        if other.count == 0:
+            return self
+        other_compactors = other.__compactors
+        while len(self.__compactors) < len(other_compactors):
+            self._grow()
+        for level, items in enumerate(other_compactors):
+            self.__compactors[level].extend(items)
+        self.__size = sum(len(c) for c in self.__compactors)
+        self.__count += other.count
+        self.__min = other.__min if self.__min is None else min(self.__min, other.__min)
+        self.__max = other.__max if self.__max is None else max(self.__max, other.__max)
+        while self.__size >= self.__max_size:
+            self._compress()
+        return self
+
+    def _weighted_items(self) -> List[Tuple[float, int]]:
+        items = [
+            (value, 1 << level)
+            for level, compactor in enumerate(self.__compactors)
+            for value in compactor
+        ]
+        items.sort()
+        return items
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Приближенное значение q-квантиля (0 <= q <= 1)"""
+        return self.quantiles([q])[0]
+
+    def quantiles(self, qs: Iterable[float]) -> List[Optional[float]]:
+        """Приближенные значения нескольких квантилей за один проход"""
+        qs = list(qs)
+        for q in qs:
+            if not 0 <= q <= 1:
+                raise ValueError("Квантиль должен быть между 0 и 1")
+        if self.__count == 0:
+            return [None] * len(qs)
+
+        items = self._weighted_items()
+        total = sum(weight for _, weight in items)
+        result: List[Optional[float]] = [None] * len(qs)
+        order = sorted(range(len(qs)), key=lambda i: qs[i])
+        cumulative = 0
+        position = 0
+        for i in order:
+            q = qs[i]
+            if q == 0:
+                result[i] = self.__min
+                continue
+            if q == 1:
+                result[i] = self.__max
+                continue
+            target = q * total
+            while position < len(items) and cumulative + items[position][1] < target:
+                cumulative += items[position][1]
+                position += 1
+            result[i] = items[min(position, len(items) - 1)][0]
+        return result
+
+    def rank(self, value: float) -> float:
+        """Приближенная доля значений, не превышающих value"""
+        if self.__count == 0:
+            return 0.0
+        items = self._weighted_items()
+        total = sum(weight for _, weight in items)
+        return sum(weight for item, weight in items if item <= value) / total
+
+    # Сериализация
+    def to_dict(self) -> dict:
+        """Сериализация скетча в словарь (пригоден для JSON)"""
+        return {
+            "k": self.__k,
+            "count": self.__count,
+            "min": self.__min,
+            "max": self.__max,
+            "compactors": [list(c) for c in self.__compactors],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, seed: Optional[int] = None) -> "KLLSketch":
+        """Десериализация скетча из словаря"""
+        sketch = cls(data["k"], seed)
+        while len(sketch.__compactors) < len(data["compactors"]):
+            sketch._grow()
+        sketch.__compactors = [list(map(float, c)) for c in data["compactors"]]
+        sketch.__size = sum(len(c) for c in sketch.__compactors)
+        sketch.__count = data["count"]
+        sketch.__min = data["min"]
+        sketch.__max = data["max"]
+        return sketch
+
+
+class SalarySketches:
+    """Скетчи распределения зарплат по отделам и типам сотрудников
+
+    Пополняется результатами calculate_salary или строками CSV-экспорта.
+    Скетчи отдельных запусков сериализуются и объединяются через merge.
+    """
+
+    PERCENTILES = (0.5, 0.9, 0.99)
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None):
+        self.__k = k
+        self.__seed = seed
+        self.__sketches: Dict[Tuple[str, str], KLLSketch] = {}
+
+    @classmethod
+    def for_error(cls, epsilon: float, seed: Optional[int] = None) -> "SalarySketches":
+        """Создать набор скетчей с погрешностью ранга не больше epsilon"""
+        return cls(KLLSketch.for_error(epsilon).k, seed)
+
+    @property
+    def k(self):
+        return self.__k
+
+    def keys(self) -> List[Tuple[str, str]]:
+        """Пары (отдел, тип сотрудника), для которых есть данные"""
+        return list(self.__sketches)
+
+    def _sketch(self, department: str, emp_type: str) -> KLLSketch:
+        key = (department, emp_type)
+        sketch = self.__sketches.get(key)
+        if sketch is None:
+            sketch = self.__sketches[key] = KLLSketch(self.__k, self.__seed)
+        return sketch
+
+    def add(self, department: str, emp_type: str, salary: float) -> None:
+        """Добавить одну зарплату"""
+        self._sketch(department, emp_type).update(salary)
+
+    def add_employee(self, employee: AbstractEmployee, department: str = None) -> None:
+        """Добавить итоговую зарплату сотрудника"""
+        self.add(
+            department or employee.department,
+            employee.__class__.__name__,
+            employee.calculate_salary(),
+        )
+
+    def add_company(self, company: Company) -> None:
+        """Добавить зарплаты всех сотрудников компании (ключ - код отдела)"""
+        for dept in company.get_departments():
+            for emp in dept:
+                self.add_employee(emp, dept.code)
+
+    def add_csv(self, filename: str) -> int:
+        """
+        Добавить зарплаты из CSV, созданного Company.export_employees_csv
+
+        Returns:
+            int: Количество прочитанных строк
+        """
+        rows = 0
+        with open(filename, "r", newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                self.add(row["Отдел"], row["Должность"], float(row["Итоговая зарплата"]))
+                rows += 1
+        return rows
+
+    def merge(self, other: "SalarySketches") -> "SalarySketches":
+        """Объединить с набором скетчей другого запуска (на месте)"""
+        for (department, emp_type), sketch in other.__sketches.items():
+            self._sketch(department, emp_type).merge(sketch)
+        return self
+
+    def combined(
+        self, department: Optional[str] = None, emp_type: Optional[str] = None
+    ) -> KLLSketch:
+        """Скетч, объединяющий все подходящие пары (отдел, тип)"""
+        result = KLLSketch(self.__k, self.__seed)
+        for (dept, typ), sketch in self.__sketches.items():
+            if (department is None or dept == department) and (
+                emp_type is None or typ == emp_type
+            ):
+                result.merge(sketch)
+        return result
+
+    def percentiles(
+        self,
+        department: Optional[str] = None,
+        emp_type: Optional[str] = None,
+        qs: Iterable[float] = PERCENTILES,
+    ) -> Dict[str, Optional[float]]:
+        """
+        Перцентили зарплат, например {"p50": ..., "p90": ..., "p99": ...}
+
+        Args:
+            department: Отдел (None - все отделы)
+            emp_type: Тип сотрудника (None - все типы)
+            qs: Квантили от 0 до 1
+        """
+        qs = list(qs)
+        values = self.combined(department, emp_type).quantiles(qs)
+        return {f"p{q * 100:g}": value for q, value in zip(qs, values)}
+
+    def to_dict(self) -> dict:
+        """Сериализация в словарь (пригоден для JSON)"""
+        return {
+            "k": self.__k,
+            "sketches": [
+                {"department": dept, "type": emp_type, "sketch": sketch.to_dict()}
+                for (dept, emp_type), sketch in self.__sketches.items()
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, seed: Optional[int] = None) -> "SalarySketches":
+        """Десериализация из словаря"""
+        sketches = cls(data["k"], seed)
+        for item in data["sketches"]:
+            sketches.__sketches[(item["department"], item["type"])] = KLLSketch.from_dict(
+                item["sketch"], seed
+            )
+        return sketches
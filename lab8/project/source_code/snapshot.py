@@ -0,0 +1,361 @@
+"""Бинарный снимок компании с загрузкой через mmap"""
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from source_code.part4 import (
+    AbstractEmployee,
+    Company,
+    Department,
+    Developer,
+    DuplicateIdError,
+    Employee,
+    Manager,
+    Project,
+    Salesperson,
+)
+
+MAGIC = b"CSNP"
+VERSION = 1
+# Заголовок: сигнатура, версия, смещение каталога секций
+_HEADER = struct.Struct("<4sHxxQ")
+_ALIGNMENT = 8
+NO_STRING = 0xFFFFFFFF
+
+EMPLOYEE_TYPES = ("Employee", "Manager", "Developer", "Salesperson")
+_TYPE_CODES = {name: code for code, name in enumerate(EMPLOYEE_TYPES)}
+
+
+class SnapshotFile:
+    """Открытый файл снимка: колонки как типизированные memoryview над mmap
+
+    Колонки сотрудников (по строке на сотрудника, в порядке отделов):
+        emp_id, emp_type, emp_name, emp_department, base_salary, bonus,
+        commission_rate, sales_volume, seniority, tech_offsets/tech_items
+    Отделы: dept_name, dept_code, dept_offsets (границы строк сотрудников)
+    Проекты: proj_id, proj_name, proj_description, proj_deadline
+        (порядковый день), proj_status, team_offsets/team_items (ID)
+    Строки хранятся один раз в таблице str_offsets/str_data, колонки
+    содержат их номера.
+    """
+
+    def __init__(self, filename: str):
+        self.__file = open(filename, "rb")
+        try:
+            self.__mmap = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.__file.close()
+            raise ValueError(f"Файл снимка {filename} пуст")
+        self.__view = memoryview(self.__mmap)
+        self.__columns: Dict[str, memoryview] = {}
+        self.__strings: Optional[List[str]] = None
+        try:
+            self.__directory = self._read_directory(filename)
+        except Exception:
+            self.close()
+            raise
+
+    def _read_directory(self, filename: str) -> dict:
+        if len(self.__view) < _HEADER.size:
+            raise ValueError(f"Файл {filename} не является снимком компании")
+        magic, version, directory_offset = _HEADER.unpack_from(self.__view)
+        if magic != MAGIC:
+            raise ValueError(f"Файл {filename} не является снимком компании")
+        if version != VERSION:
+            raise ValueError(f"Неподдерживаемая версия снимка: {version}")
+        directory = json.loads(bytes(self.__view[directory_offset:]).decode("utf-8"))
+        if directory["byteorder"] != sys.byteorder:
+            raise ValueError("Снимок записан на платформе с другим порядком байтов")
+        return directory
+
+    def __enter__(self) -> "SnapshotFile":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Освободить представления колонок и закрыть файл"""
+        for column in self.__columns.values():
+            column.release()
+        self.__columns.clear()
+        self.__view.release()
+        self.__mmap.close()
+        self.__file.close()
+
+    @property
+    def company_name(self) -> str:
+        return self.__directory["company"]
+
+    @property
+    def employee_count(self) -> int:
+        return self.__directory["counts"]["employees"]
+
+    @property
+    def department_count(self) -> int:
+        return self.__directory["counts"]["departments"]
+
+    @property
+    def project_count(self) -> int:
+        return self.__directory["counts"]["projects"]
+
+    def column(self, name: str) -> memoryview:
+        """Колонка как memoryview нужного типа (без копирования)"""
+        column = self.__columns.get(name)
+        if column is None:
+            offset, typecode, count = self.__directory["sections"][name]
+            size = array(typecode).itemsize
+            column = self.__view[offset : offset + count * size].cast(typecode)
+            self.__columns[name] = column
+        return column
+
+    @property
+    def strings(self) -> List[str]:
+        """Таблица строк (декодируется один раз при первом обращении)"""
+        if self.__strings is None:
+            offsets = self.column("str_offsets")
+            data = self.column("str_data").tobytes()
+            self.__strings = [
+                data[offsets[i] : offsets[i + 1]].decode("utf-8")
+                for i in range(len(offsets) - 1)
+            ]
+        return self.__strings
+
+    def string(self, index: int) -> Optional[str]:
+        return None if index == NO_STRING else self.strings[index]
+
+    def build_employee(self, row: int) -> AbstractEmployee:
+        """Создать объект сотрудника по номеру строки"""
+        return self.build_employees(row, row + 1)[0]
+
+    def build_employees(self, start: int, stop: int) -> List[AbstractEmployee]:
+        """Создать объекты сотрудников для строк [start, stop)
+
+        Срезы колонок переводятся в списки одним вызовом tolist,
+        поэтому цикл по строкам не обращается к memoryview.
+        """
+        strings = self.strings
+
+        def values(name: str) -> list:
+            return self.column(name)[start:stop].tolist()
+
+        tech_offsets = self.column("tech_offsets")[start : stop + 1].tolist()
+        tech_items = self.column("tech_items")[tech_offsets[0] : tech_offsets[-1]].tolist()
+        first_tech = tech_offsets[0]
+
+        rows = zip(
+            values("emp_type"),
+            values("emp_id"),
+            values("emp_name"),
+            values("emp_department"),
+            values("base_salary"),
+            values("bonus"),
+            values("commission_rate"),
+            values("sales_volume"),
+            values("seniority"),
+        )
+        employees = []
+        for i, row in enumerate(rows):
+            (type_code, emp_id, name, department, base_salary,
+             bonus, commission_rate, sales_volume, seniority) = row
+            name = strings[name]
+            department = strings[department]
+            emp_type = EMPLOYEE_TYPES[type_code]
+            if emp_type == "Manager":
+                employee = Manager(emp_id, name, department, base_salary, bonus)
+            elif emp_type == "Developer":
+                tech_stack = [
+                    strings[item]
+                    for item in tech_items[
+                        tech_offsets[i] - first_tech : tech_offsets[i + 1] - first_tech
+                    ]
+                ]
+                employee = Developer(
+                    emp_id, name, department, base_salary, tech_stack, strings[seniority]
+                )
+            elif emp_type == "Salesperson":
+                employee = Salesperson(
+                    emp_id, name, department, base_salary, commission_rate, sales_volume
+                )
+            else:
+                employee = Employee(emp_id, name, department, base_salary)
+            employees.append(employee)
+        return employees
+
+    def build_project(self, index: int) -> Tuple[Project, List[int]]:
+        """Создать проект по номеру и вернуть его вместе с ID команды"""
+        strings = self.strings
+        project = Project(
+            self.column("proj_id")[index],
+            strings[self.column("proj_name")[index]],
+            strings[self.column("proj_description")[index]],
+            date.fromordinal(self.column("proj_deadline")[index]).isoformat(),
+            strings[self.column("proj_status")[index]],
+        )
+        offsets = self.column("team_offsets")
+        team = self.column("team_items")[offsets[index] : offsets[index + 1]].tolist()
+        return project, team
+
+
+class _StringTable:
+    """Таблица строк с дедупликацией для записи снимка"""
+
+    def __init__(self):
+        self.indexes: Dict[str, int] = {}
+        self.offsets = array("Q", [0])
+        self.data = bytearray()
+
+    def add(self, value: Optional[str]) -> int:
+        if value is None:
+            return NO_STRING
+        index = self.indexes.get(value)
+        if index is None:
+            index = self.indexes[value] = len(self.offsets) - 1
+            self.data += value.encode("utf-8")
+            self.offsets.append(len(self.data))
+        return index
+
+
+def save_snapshot(company: Company, filename: str) -> None:
+    """
+    Сохранить компанию в бинарный снимок
+
+    Args:
+        company: Компания для сохранения
+        filename: Имя файла снимка
+    """
+    strings = _StringTable()
+    columns = {
+        "emp_id": array("q"),
+        "emp_type": array("B"),
+        "emp_name": array("I"),
+        "emp_department": array("I"),
+        "base_salary": array("d"),
+        "bonus": array("d"),
+        "commission_rate": array("d"),
+        "sales_volume": array("d"),
+        "seniority": array("I"),
+        "tech_offsets": array("Q", [0]),
+        "tech_items": array("I"),
+        "dept_name": array("I"),
+        "dept_code": array("I"),
+        "dept_offsets": array("Q", [0]),
+        "proj_id": array("q"),
+        "proj_name": array("I"),
+        "proj_description": array("I"),
+        "proj_deadline": array("i"),
+        "proj_status": array("I"),
+        "team_offsets": array("Q", [0]),
+        "team_items": array("q"),
+    }
+
+    for dept in company.get_departments():
+        columns["dept_name"].append(strings.add(dept.name))
+        columns["dept_code"].append(strings.add(dept.code))
+        for emp in dept:
+            _append_employee(columns, strings, emp)
+        columns["dept_offsets"].append(len(columns["emp_id"]))
+
+    for proj in company.get_projects():
+        columns["proj_id"].append(proj.project_id)
+        columns["proj_name"].append(strings.add(proj.name))
+        columns["proj_description"].append(strings.add(proj.description))
+        columns["proj_deadline"].append(proj.deadline_ordinal)
+        columns["proj_status"].append(strings.add(proj.status))
+        columns["team_items"].extend(emp.id for emp in proj.get_team())
+        columns["team_offsets"].append(len(columns["team_items"]))
+
+    columns["str_offsets"] = strings.offsets
+    columns["str_data"] = array("B", strings.data)
+
+    sections = {}
+    with open(filename, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, 0))
+        for name, column in columns.items():
+            _pad(f)
+            sections[name] = [f.tell(), column.typecode, len(column)]
+            column.tofile(f)
+        _pad(f)
+        directory_offset = f.tell()
+        directory = {
+            "byteorder": sys.byteorder,
+            "company": company.name,
+            "counts": {
+                "employees": len(columns["emp_id"]),
+                "departments": len(columns["dept_name"]),
+                "projects": len(columns["proj_id"]),
+            },
+            "sections": sections,
+        }
+        f.write(json.dumps(directory, ensure_ascii=False).encode("utf-8"))
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, VERSION, directory_offset))
+
+
+def _append_employee(columns: Dict[str, array], strings: _StringTable, emp) -> None:
+    emp_type = emp.__class__.__name__
+    if emp_type not in _TYPE_CODES:
+        raise ValueError(f"Тип сотрудника {emp_type} не поддерживается снимком")
+    columns["emp_id"].append(emp.id)
+    columns["emp_type"].append(_TYPE_CODES[emp_type])
+    columns["emp_name"].append(strings.add(emp.name))
+    columns["emp_department"].append(strings.add(emp.department))
+    columns["base_salary"].append(emp.base_salary)
+    columns["bonus"].append(emp.bonus if isinstance(emp, Manager) else 0.0)
+    is_sales = isinstance(emp, Salesperson)
+    columns["commission_rate"].append(emp.commission_rate if is_sales else 0.0)
+    columns["sales_volume"].append(emp.sales_volume if is_sales else 0.0)
+    if isinstance(emp, Developer):
+        columns["seniority"].append(strings.add(emp.seniority_level))
+        columns["tech_items"].extend(strings.add(tech) for tech in emp.tech_stack)
+    else:
+        columns["seniority"].append(NO_STRING)
+    columns["tech_offsets"].append(len(columns["tech_items"]))
+
+
+def _pad(f) -> None:
+    remainder = f.tell() % _ALIGNMENT
+    if remainder:
+        f.write(b"\0" * (_ALIGNMENT - remainder))
+
+
+def load_snapshot(filename: str) -> Company:
+    """
+    Загрузить компанию из бинарного снимка
+
+    Объекты создаются напрямую из колонок файла, отображенного в память.
+    Команды проектов восстанавливаются так же, как в Company.load_from_json.
+    """
+    with SnapshotFile(filename) as snapshot:
+        company = Company(snapshot.company_name)
+        strings = snapshot.strings
+        dept_offsets = snapshot.column("dept_offsets")
+        dept_names = snapshot.column("dept_name")
+        dept_codes = snapshot.column("dept_code")
+        employees_by_id: Dict[int, AbstractEmployee] = {}
+
+        for index in range(snapshot.department_count):
+            department = Department(strings[dept_names[index]], strings[dept_codes[index]])
+            for employee in snapshot.build_employees(
+                dept_offsets[index], dept_offsets[index + 1]
+            ):
+                employees_by_id.setdefault(employee.id, employee)
+                department.add_employee(employee)
+            company.add_department(department)
+
+        for index in range(snapshot.project_count):
+            project, team = snapshot.build_project(index)
+            for employee_id in team:
+                employee = employees_by_id.get(employee_id)
+                if employee:
+                    try:
+                        project.add_team_member(employee)
+                    except (DuplicateIdError, ValueError):
+                        pass
+            company.add_project(project)
+        return company
@@ -1,8 +1,16 @@
+import asyncio
 import sqlite3
 import json
+import re
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 import functools
 
@@ -128,6 +136,8 @@ class Manager(Employee):
 
 
 class Developer(Employee):
+    SENIORITY_MULTIPLIERS = {"junior": 1.0, "middle": 1.5, "senior": 2.0}
+
     def __init__(
         self,
         id: int,
@@ -150,9 +160,8 @@ class Developer(Employee):
         return self.__seniority
 
     def calculate_salary(self) -> float:
-        multiplier = {"junior": 1.0, "middle": 1.5, "senior": 2.0}
         return (
-            self.base_salary * multiplier.get(self.seniority, 1.0)
+            self.base_salary * self.SENIORITY_MULTIPLIERS.get(self.seniority, 1.0)
             + self.calculate_bonus()
         )
 
@@ -170,6 +179,14 @@ class Salesperson(Employee):
         self.__commission_rate = commission_rate
         self.__sales = 0
 
+    @property
+    def commission_rate(self):
+        return self.__commission_rate
+
+    @property
+    def sales(self):
+        return self.__sales
+
     def update_sales(self, amount: float):
         if amount < 0:
             raise ValueError("Сумма продаж не может быть отрицательной")
@@ -212,17 +229,42 @@ class Department:
     def get_employees(self):
         return self.__employees.copy()
 
+    def __iter__(self):
+        return iter(self.__employees.copy())
+
     def __len__(self):
         return len(self.__employees)
 
 
 class Project:
-    def __init__(self, id: int, name: str, status: str = "planning"):
+    def __init__(
+        self, id: int, name: str, status: str = "planning", description: str = ""
+    ):
         self.__id = id
         self.__name = name
         self.__status = status
+        self.__description = description
         self.__team = []
 
+    @property
+    def id(self):
+        return self.__id
+
+    @property
+    def name(self):
+        return self.__name
+
+    @property
+    def status(self):
+        return self.__status
+
+    @property
+    def description(self):
+        return self.__description
+
+    def get_team(self):
+        return self.__team.copy()
+
     def add_team_member(self, employee):
         if employee not in self.__team:
             self.__team.append(employee)
@@ -283,46 +325,334 @@ class Company:
     def get_all_employees(self):
         return self.__employees.copy()
 
+    def get_departments(self):
+        return self.__departments.copy()
+
+    def get_projects(self):
+        return self.__projects.copy()
+
 
 # ==================== ЧАСТЬ 1: ПОРОЖДАЮЩИЕ ПАТТЕРНЫ ====================
 
 
 # 1.1. Singleton для подключения к БД
+# Итоговая зарплата строки employees по формулам calculate_salary (без
+# стратегий бонуса, которые в базе не хранятся)
+EMPLOYEE_SALARY_SQL = (
+    "CASE type"
+    " WHEN 'Manager' THEN base_salary + bonus"
+    " WHEN 'Developer' THEN base_salary * CASE seniority "
+    + " ".join(
+        f"WHEN '{level}' THEN {multiplier!r}"
+        for level, multiplier in Developer.SENIORITY_MULTIPLIERS.items()
+    )
+    + " ELSE 1.0 END"
+    " WHEN 'Salesperson' THEN base_salary + sales * commission_rate"
+    " ELSE base_salary END"
+)
+
+# Схема таблицы сотрудников: поля подклассов хранятся в отдельных колонках,
+# навыки разработчиков - в таблице employee_skills. Индекс по выражению
+# зарплаты используется условиями SalarySpecification, покрывающий индекс
+# (отдел, тип, зарплата) - зарплатными сводками GROUP BY
+EMPLOYEE_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS employees (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        department TEXT NOT NULL,
+        base_salary REAL NOT NULL,
+        type TEXT NOT NULL,
+        bonus REAL,
+        seniority TEXT,
+        commission_rate REAL,
+        sales REAL
+    );
+    CREATE INDEX IF NOT EXISTS idx_employees_type ON employees (type);
+    CREATE TABLE IF NOT EXISTS employee_skills (
+        employee_id INTEGER NOT NULL,
+        position INTEGER NOT NULL,
+        skill TEXT NOT NULL,
+        PRIMARY KEY (employee_id, position)
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_employee_skills_skill ON employee_skills (skill);
+""" + f"""
+    CREATE INDEX IF NOT EXISTS idx_employees_salary ON employees ({EMPLOYEE_SALARY_SQL});
+    CREATE INDEX IF NOT EXISTS idx_employees_payroll
+        ON employees (department, type, {EMPLOYEE_SALARY_SQL});
+"""
+
+
+def init_employee_schema(connection: sqlite3.Connection) -> None:
+    """Создать таблицы и индексы сотрудников (если их еще нет)"""
+    connection.executescript(EMPLOYEE_SCHEMA)
+    connection.commit()
+
+
+class _ThreadOwner:
+    """Метка потока, владеющего подключением пула (для weakref.finalize)"""
+
+
+class ConnectionPool:
+    """Пул подключений SQLite к файлу базы в режиме WAL
+
+    Каждый поток получает собственное подключение (повторный acquire в
+    том же потоке возвращает его же). В режиме WAL читатели работают
+    параллельно с писателем; записи внутри процесса упорядочиваются
+    блокировкой transaction(), между процессами - busy_timeout.
+    Подключений не больше max_connections: при исчерпании пула поток
+    ждет освобождения до timeout секунд. Подключение завершившегося
+    потока, не вызвавшего release, возвращается в пул автоматически.
+    """
+
+    def __init__(
+        self,
+        database: str,
+        max_connections: int = 8,
+        timeout: float = 5.0,
+        cache_size_kib: int = 16384,
+        mmap_size: int = 256 * 1024 * 1024,
+        busy_timeout_ms: int = 5000,
+        synchronous: str = "NORMAL",
+        initializer=init_employee_schema,
+    ):
+        """
+        Args:
+            database: Путь к файлу базы
+            max_connections: Максимум одновременно открытых подключений
+            timeout: Сколько ждать свободного подключения (сек.)
+            cache_size_kib: Размер кэша страниц каждого подключения (КиБ)
+            mmap_size: Объем файла, читаемый через mmap (байт, 0 - выключено)
+            busy_timeout_ms: Ожидание блокировки базы другим процессом (мс)
+            synchronous: Режим PRAGMA synchronous (NORMAL достаточно для WAL)
+            initializer: Функция подготовки схемы, вызывается один раз
+        """
+        if max_connections < 1:
+            raise ValueError("Размер пула должен быть положительным")
+        if database == ":memory:" and max_connections > 1:
+            raise ValueError("Каждое подключение к :memory: - отдельная база")
+        self.database = database
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.cache_size_kib = cache_size_kib
+        self.mmap_size = mmap_size
+        self.busy_timeout_ms = busy_timeout_ms
+        self.synchronous = synchronous
+        self._initializer = initializer
+        self._initialized = False
+
+        self._condition = threading.Condition()
+        self._write_lock = threading.RLock()
+        self._local = threading.local()
+        self._idle: List[sqlite3.Connection] = []
+        self._connections: List[sqlite3.Connection] = []
+        self._created = 0
+        self._in_use = 0
+        self._closed = False
+        # Метрики
+        self._acquisitions = 0
+        self._waits = 0
+        self._timeouts = 0
+        self._wait_time = 0.0
+        self._peak_in_use = 0
+
+    def _create(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.database,
+            timeout=self.busy_timeout_ms / 1000,
+            check_same_thread=False,
+        )
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute(f"PRAGMA synchronous = {self.synchronous}")
+        connection.execute(f"PRAGMA cache_size = {-int(self.cache_size_kib)}")
+        connection.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        connection.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+        with self._write_lock:
+            if not self._initialized and self._initializer is not None:
+                self._initializer(connection)
+            self._initialized = True
+        return connection
+
+    def acquire(self) -> sqlite3.Connection:
+        """Получить подключение текущего потока (вернуть через release)"""
+        local = self._local
+        connection = getattr(local, "connection", None)
+        if connection is not None:
+            local.depth += 1
+            return connection
+
+        with self._condition:
+            started = None
+            while True:
+                if self._closed:
+                    raise RuntimeError("Пул подключений закрыт")
+                if self._idle:
+                    connection = self._idle.pop()
+                    break
+                if self._created < self.max_connections:
+                    self._created += 1
+                    break
+                if started is None:
+                    started = time.monotonic()
+                    self._waits += 1
+                remaining = self.timeout - (time.monotonic() - started)
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise TimeoutError(
+                        f"Нет свободного подключения за {self.timeout} с "
+                        f"(занято {self._in_use} из {self.max_connections})"
+                    )
+                self._condition.wait(remaining)
+            if started is not None:
+                self._wait_time += time.monotonic() - started
+            self._in_use += 1
+            self._acquisitions += 1
+            self._peak_in_use = max(self._peak_in_use, self._in_use)
+
+        if connection is None:
+            try:
+                connection = self._create()
+            except Exception:
+                with self._condition:
+                    self._created -= 1
+                    self._in_use -= 1
+                    self._condition.notify()
+                raise
+            with self._condition:
+                self._connections.append(connection)
+        local.connection = connection
+        local.depth = 1
+        # Данные threading.local удаляются при завершении потока - вместе
+        # с owner, и финализатор возвращает подключение в пул
+        local.owner = owner = _ThreadOwner()
+        local.finalizer = weakref.finalize(owner, self._return, connection)
+        return connection
+
+    def release(self) -> None:
+        """Вернуть подключение текущего потока в пул"""
+        local = self._local
+        connection = getattr(local, "connection", None)
+        if connection is None:
+            raise RuntimeError("Поток не получал подключение из пула")
+        local.depth -= 1
+        if local.depth > 0:
+            return
+        local.connection = None
+        local.finalizer.detach()
+        local.owner = None
+        self._return(connection)
+
+    def _return(self, connection: sqlite3.Connection) -> None:
+        with self._condition:
+            self._in_use -= 1
+            if self._closed:
+                # close() уже закрыл все подключения пула
+                self._condition.notify()
+                return
+        if connection.in_transaction:
+            connection.rollback()
+        with self._condition:
+            if self._closed:
+                connection.close()
+            else:
+                self._idle.append(connection)
+            self._condition.notify()
+
+    def thread_connection(self) -> sqlite3.Connection:
+        """Подключение, закрепленное за текущим потоком
+
+        Возвращается в пул при завершении потока или закрытии пула.
+        """
+        connection = getattr(self._local, "connection", None)
+        return connection if connection is not None else self.acquire()
+
+    @contextmanager
+    def connection(self):
+        """Подключение на время блока with (для чтения)"""
+        connection = self.acquire()
+        try:
+            yield connection
+        finally:
+            self.release()
+
+    @contextmanager
+    def transaction(self):
+        """Транзакция записи: один писатель в процессе, commit или rollback"""
+        with self.connection() as connection:
+            with self._write_lock:
+                with connection:
+                    yield connection
+
+    def metrics(self) -> Dict[str, Any]:
+        """Метрики использования пула"""
+        with self._condition:
+            return {
+                "max_connections": self.max_connections,
+                "created": self._created,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "peak_in_use": self._peak_in_use,
+                "utilization": self._in_use / self.max_connections,
+                "acquisitions": self._acquisitions,
+                "waits": self._waits,
+                "timeouts": self._timeouts,
+                "total_wait_time": self._wait_time,
+            }
+
+    def close(self) -> None:
+        """Закрыть все подключения пула"""
+        with self._condition:
+            self._closed = True
+            connections, self._connections = self._connections, []
+            self._idle.clear()
+            self._condition.notify_all()
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+
 class DatabaseConnection:
+    """Точка доступа к базе сотрудников (Singleton поверх ConnectionPool)
+
+    get_connection возвращает подключение, закрепленное за текущим
+    потоком до его завершения или close_connection. Путь к файлу базы
+    и параметры пула задаются через configure; без database пул не
+    создается.
+    """
+
     _instance = None
+    _options: Dict[str, Any] = {}
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance._connection = None
+            cls._instance._pool = None
         return cls._instance
 
+    @classmethod
+    def configure(cls, **options) -> None:
+        """Задать параметры ConnectionPool (текущий пул закрывается)"""
+        cls._options = {**cls._options, **options}
+        if cls._instance is not None:
+            cls._instance.close_connection()
+
+    @property
+    def pool(self) -> ConnectionPool:
+        if self._pool is None:
+            if "database" not in self._options:
+                raise RuntimeError(
+                    "Путь к базе не задан: "
+                    "вызовите DatabaseConnection.configure(database=...)"
+                )
+            self._pool = ConnectionPool(**self._options)
+        return self._pool
+
     def get_connection(self):
-        if self._connection is None:
-            self._connection = sqlite3.connect(":memory:", check_same_thread=False)
-            self._init_db()
-        return self._connection
-
-    def _init_db(self):
-        cursor = self._connection.cursor()
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS employees (
-                id INTEGER PRIMARY KEY,
-                name TEXT,
-                department TEXT,
-                base_salary REAL,
-                type TEXT,
-                data TEXT
-            )
-        """
-        )
-        self._connection.commit()
+        return self.pool.thread_connection()
 
     def close_connection(self):
-        if self._connection:
-            self._connection.close()
-            self._connection = None
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
 
 
 # 1.2. Factory Method (рефакторинг существующей фабрики)
@@ -630,10 +960,15 @@ class TrainingDecorator(EmployeeDecorator):
 
 # 2.3. Facade для упрощенного управления компанией
 class CompanyFacade:
-    """Фасад для упрощения работы со сложной системой компании"""
+    """Фасад для упрощения работы со сложной системой компании
+
+    Если передан SqliteEmployeeRepository, зарплатные сводки считаются
+    агрегатами в базе, без создания объектов сотрудников.
+    """
 
-    def __init__(self, company: Company):
+    def __init__(self, company: Company, repository=None):
         self._company = company
+        self._repository = repository
         self._notification_system = NotificationSystem()
 
     def hire(self, employee_data: Dict) -> bool:
@@ -690,6 +1025,8 @@ class CompanyFacade:
 
     def calculate_payroll(self) -> Dict:
         """Расчет всех зарплат"""
+        if self._repository is not None:
+            return self._repository.payroll_summary()
         employees = self._company.get_all_employees()
         total = sum(e.calculate_salary() for e in employees)
         count = len(employees)
@@ -699,6 +1036,52 @@ class CompanyFacade:
             "average": total / count if count > 0 else 0,
         }
 
+    def get_department_stats(self) -> Dict[str, Any]:
+        """Статистика по отделам (ключ - код отдела, как employee.department)"""
+        names = {dept.code: dept.name for dept in self._company.get_departments()}
+        if self._repository is not None:
+            return self._repository.get_department_stats(names)
+        groups = {}
+        for employee in self._company.get_all_employees():
+            key = (employee.department, employee.__class__.__name__)
+            count, total = groups.get(key, (0, 0.0))
+            groups[key] = (count + 1, total + employee.calculate_salary())
+        rows = [key + value for key, value in groups.items()]
+        return _department_stats_from_groups(rows, names)
+
+
+def _department_stats_from_groups(groups, names: Optional[Dict[str, str]] = None):
+    """
+    Статистика отделов в формате Company.get_department_stats из групп
+
+    Args:
+        groups: Строки (отдел, тип, число сотрудников, сумма зарплат)
+        names: Названия отделов по коду (по умолчанию - сам код)
+
+    Returns:
+        Dict[str, Any]: name, employee_count, total_salary, employee_types,
+        avg_salary по каждому отделу
+    """
+    names = names or {}
+    stats: Dict[str, Any] = {}
+    for department, emp_type, count, total in groups:
+        entry = stats.setdefault(
+            department,
+            {
+                "name": names.get(department, department),
+                "employee_count": 0,
+                "total_salary": 0.0,
+                "employee_types": {},
+                "avg_salary": 0,
+            },
+        )
+        entry["employee_count"] += count
+        entry["total_salary"] += total
+        entry["employee_types"][emp_type] = count
+    for entry in stats.values():
+        entry["avg_salary"] = entry["total_salary"] / entry["employee_count"]
+    return stats
+
 
 # ==================== ЧАСТЬ 3: ПОВЕДЕНЧЕСКИЕ ПАТТЕРНЫ ====================
 
@@ -906,47 +1289,170 @@ class DepartmentRepository:
 
 # 4.2. Unit of Work для управления транзакциями
 class UnitOfWork:
-    """Unit of Work для управления транзакциями"""
+    """Unit of Work с картой идентичности
 
-    def __init__(self):
-        self._new_objects = []
-        self._dirty_objects = []
-        self._removed_objects = []
+    Загруженные через get и зарегистрированные объекты хранятся в карте
+    идентичности по ключу (тип, ID), поэтому повторное чтение возвращает
+    тот же объект. commit записывает новые, измененные и удаленные
+    объекты одной транзакцией (у SqliteEmployeeRepository - пакетами
+    executemany по таблицам), rollback возвращает объектам состояние на
+    момент попадания в карту или последнего commit.
+
+    Объект, который изменяется после загрузки не через get, нужно
+    зарегистрировать (register_clean) до изменения - иначе откат вернет
+    его к состоянию на момент register_dirty.
+    """
+
+    def __init__(self, repository=None):
+        """
+        Args:
+            repository: SqliteEmployeeRepository, EmployeeRepository или
+                None (изменения только учитываются)
+        """
+        self._repository = repository
+        self._identity_map: Dict[tuple, Any] = {}
+        self._snapshots: Dict[int, Dict[str, Any]] = {}
+        # Новые объекты еще без ID - по id() объекта, остальные - по ключу
+        self._new_objects: Dict[int, Any] = {}
+        self._dirty_objects: Dict[tuple, Any] = {}
+        self._removed_objects: Dict[tuple, Any] = {}
+
+    @staticmethod
+    def _key(obj) -> tuple:
+        # Сотрудники всех типов хранятся в одной таблице с общими ID
+        if isinstance(obj, AbstractEmployee):
+            return AbstractEmployee, obj.id
+        return type(obj), obj.id
+
+    @staticmethod
+    def _copy_state(state: Dict[str, Any]) -> Dict[str, Any]:
+        # Списки (навыки, наблюдатели) копируются, чтобы откат их восстановил
+        return {
+            name: value.copy() if isinstance(value, (list, dict, set)) else value
+            for name, value in state.items()
+        }
+
+    def _remember(self, obj) -> None:
+        self._identity_map[self._key(obj)] = obj
+        if id(obj) not in self._snapshots:
+            self._snapshots[id(obj)] = self._copy_state(vars(obj))
+
+    # Карта идентичности
+    def get(self, employee_id: int) -> Optional[AbstractEmployee]:
+        """Сотрудник из карты идентичности или из репозитория"""
+        obj = self._identity_map.get((AbstractEmployee, employee_id))
+        if obj is None and self._repository is not None:
+            obj = self._repository.get(employee_id)
+            if obj is not None:
+                self._remember(obj)
+        if obj is None or self._key(obj) in self._removed_objects:
+            return None
+        return obj
+
+    def register_clean(self, obj):
+        """Взять под учет объект, прочитанный из базы в обход get"""
+        key = self._key(obj)
+        if self._identity_map.get(key, obj) is not obj:
+            raise ValueError(f"Объект с ключом {key} уже зарегистрирован")
+        self._remember(obj)
 
     def register_new(self, obj):
-        self._new_objects.append(obj)
+        self._new_objects[id(obj)] = obj
 
     def register_dirty(self, obj):
-        if obj not in self._dirty_objects:
-            self._dirty_objects.append(obj)
+        if id(obj) in self._new_objects:
+            return
+        self.register_clean(obj)
+        self._dirty_objects[self._key(obj)] = obj
 
     def register_removed(self, obj):
-        self._removed_objects.append(obj)
+        if self._new_objects.pop(id(obj), None) is not None:
+            return
+        self.register_clean(obj)
+        key = self._key(obj)
+        self._dirty_objects.pop(key, None)
+        self._removed_objects[key] = obj
 
-    def commit(self):
-        # Здесь обычно происходит сохранение в БД
-        print(
-            f"Committing: {len(self._new_objects)} new, {len(self._dirty_objects)} dirty, {len(self._removed_objects)} removed"
-        )
+    @property
+    def has_changes(self) -> bool:
+        return bool(self._new_objects or self._dirty_objects or self._removed_objects)
 
-        # В реальной системе здесь был бы код для сохранения
+    def commit(self) -> Dict[str, int]:
+        """
+        Записать все изменения одной транзакцией
+
+        Returns:
+            Dict[str, int]: Число новых, измененных и удаленных объектов
+        """
+        new = list(self._new_objects.values())
+        dirty = list(self._dirty_objects.values())
+        removed = list(self._removed_objects.values())
+        repository = self._repository
+        if repository is not None:
+            if hasattr(repository, "save_changes"):
+                repository.save_changes(new, dirty, removed)
+            else:
+                for obj in new:
+                    repository.add(obj)
+                for obj in dirty:
+                    repository.update(obj)
+                for obj in removed:
+                    repository.delete(obj.id)
+
+        for obj in removed:
+            self._identity_map.pop(self._key(obj), None)
+            self._snapshots.pop(id(obj), None)
+        for obj in new + dirty:
+            self._identity_map[self._key(obj)] = obj
+            self._snapshots[id(obj)] = self._copy_state(vars(obj))
         self._new_objects.clear()
         self._dirty_objects.clear()
         self._removed_objects.clear()
+        return {"new": len(new), "dirty": len(dirty), "removed": len(removed)}
 
     def rollback(self):
-        print("Rolling back all changes")
+        """Отменить изменения и вернуть объектам сохраненное состояние"""
+        for changed in (self._dirty_objects, self._removed_objects):
+            for obj in changed.values():
+                state = vars(obj)
+                state.clear()
+                # Снимок остается в силе для следующего отката
+                state.update(self._copy_state(self._snapshots[id(obj)]))
         self._new_objects.clear()
         self._dirty_objects.clear()
         self._removed_objects.clear()
 
+    def __enter__(self) -> "UnitOfWork":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
 
 # 4.3. Specification Pattern для фильтрации
+# Спецификации умеют превращаться в условия WHERE по таблице employees;
+# SqliteEmployeeRepository выполняет их в базе, а остальное проверяет в Python
 class Specification(ABC):
     @abstractmethod
     def is_satisfied_by(self, employee: AbstractEmployee) -> bool:
         pass
 
+    def to_sql(self) -> Optional[Tuple[str, tuple]]:
+        """Условие WHERE с параметрами или None, если его нельзя выразить в SQL"""
+        return None
+
+    def sql_filters(self) -> List[Tuple[str, tuple]]:
+        """Условия, которым обязательно удовлетворяет подходящая строка
+
+        Для спецификаций без to_sql список неполон (или пуст): строки,
+        отобранные по нему, нужно проверить через is_satisfied_by.
+        """
+        condition = self.to_sql()
+        return [] if condition is None else [condition]
+
     def __and__(self, other):
         return AndSpecification(self, other)
 
@@ -961,6 +1467,9 @@ class SalarySpecification(Specification):
     def is_satisfied_by(self, employee: AbstractEmployee) -> bool:
         return employee.calculate_salary() >= self._min_salary
 
+    def to_sql(self) -> Optional[Tuple[str, tuple]]:
+        return f"({EMPLOYEE_SALARY_SQL}) >= ?", (self._min_salary,)
+
 
 class DepartmentSpecification(Specification):
     def __init__(self, department: str):
@@ -969,6 +1478,9 @@ class DepartmentSpecification(Specification):
     def is_satisfied_by(self, employee: AbstractEmployee) -> bool:
         return employee.department == self._department
 
+    def to_sql(self) -> Optional[Tuple[str, tuple]]:
+        return "department = ?", (self._department,)
+
 
 class SkillSpecification(Specification):
     def __init__(self, required_skill: str):
@@ -979,6 +1491,13 @@ class SkillSpecification(Specification):
             return self._required_skill in employee.skills
         return False
 
+    def to_sql(self) -> Optional[Tuple[str, tuple]]:
+        # Навыки в базе есть только у разработчиков
+        return (
+            "id IN (SELECT employee_id FROM employee_skills WHERE skill = ?)",
+            (self._required_skill,),
+        )
+
 
 class AndSpecification(Specification):
     def __init__(self, spec1: Specification, spec2: Specification):
@@ -990,6 +1509,16 @@ class AndSpecification(Specification):
             employee
         )
 
+    def to_sql(self) -> Optional[Tuple[str, tuple]]:
+        first, second = self._spec1.to_sql(), self._spec2.to_sql()
+        if first is None or second is None:
+            return None
+        return f"({first[0]}) AND ({second[0]})", first[1] + second[1]
+
+    def sql_filters(self) -> List[Tuple[str, tuple]]:
+        # Часть конъюнкции, выразимая в SQL, сужает выборку и без остальных
+        return self._spec1.sql_filters() + self._spec2.sql_filters()
+
 
 class OrSpecification(Specification):
     def __init__(self, spec1: Specification, spec2: Specification):
@@ -1001,6 +1530,1271 @@ class OrSpecification(Specification):
             employee
         )
 
+    def to_sql(self) -> Optional[Tuple[str, tuple]]:
+        first, second = self._spec1.to_sql(), self._spec2.to_sql()
+        if first is None or second is None:
+            return None
+        return f"({first[0]}) OR ({second[0]})", first[1] + second[1]
+
+
+# 4.4. Repository поверх SQLite
+class _SqliteRepository:
+    """Общая часть репозиториев SQLite: подключение или пул и схема"""
+
+    SCHEMA = EMPLOYEE_SCHEMA
+
+    def __init__(self, connection=None):
+        """
+        Args:
+            connection: sqlite3.Connection или ConnectionPool
+                (по умолчанию пул DatabaseConnection, заданный через configure)
+        """
+        if connection is None:
+            connection = DatabaseConnection().pool
+        if isinstance(connection, ConnectionPool):
+            self._pool = connection
+            self._connection = None
+        else:
+            self._pool = None
+            self._connection = connection
+        with self._writing() as connection:
+            connection.executescript(self.SCHEMA)
+
+    @contextmanager
+    def _reading(self):
+        if self._pool is None:
+            yield self._connection
+        else:
+            with self._pool.connection() as connection:
+                yield connection
+
+    @contextmanager
+    def _writing(self):
+        if self._pool is None:
+            with self._connection:
+                yield self._connection
+        else:
+            with self._pool.transaction() as connection:
+                yield connection
+
+
+class SqliteEmployeeRepository(_SqliteRepository):
+    """Репозиторий сотрудников с хранением в SQLite
+
+    Интерфейс совпадает с EmployeeRepository. Поля подклассов хранятся в
+    типизированных колонках таблицы employees, навыки разработчиков - в
+    employee_skills. Пакетные операции (add_many, upsert_many) выполняются
+    одним executemany в одной транзакции.
+
+    Работает либо с отдельным подключением, либо с ConnectionPool: тогда
+    чтение идет через подключение текущего потока, а запись - через
+    transaction() пула.
+
+    find_by_specification переводит спецификацию в параметризованное
+    условие WHERE; если часть спецификации в SQL не выражается, база
+    отбирает строки по остальным условиям, а проверка завершается в Python.
+    """
+
+    EMPLOYEE_TYPES = {
+        "Employee": Employee,
+        "Manager": Manager,
+        "Developer": Developer,
+        "Salesperson": Salesperson,
+    }
+    COLUMNS = (
+        "id",
+        "name",
+        "department",
+        "base_salary",
+        "type",
+        "bonus",
+        "seniority",
+        "commission_rate",
+        "sales",
+    )
+    _INSERT = (
+        f"INSERT INTO employees ({', '.join(COLUMNS)}) "
+        f"VALUES ({', '.join('?' * len(COLUMNS))})"
+    )
+    _UPSERT = _INSERT + " ON CONFLICT(id) DO UPDATE SET " + ", ".join(
+        f"{column} = excluded.{column}" for column in COLUMNS[1:]
+    )
+    # Нумерованные параметры: строка та же, что для _INSERT (id - первый)
+    _UPDATE = (
+        "UPDATE employees SET "
+        + ", ".join(
+            f"{column} = ?{number}" for number, column in enumerate(COLUMNS[1:], 2)
+        )
+        + " WHERE id = ?1"
+    )
+    _SELECT = f"SELECT {', '.join(COLUMNS)} FROM employees"
+
+    # Не больше стольких параметров в одном IN (...)
+    MAX_IN_PARAMS = 500
+
+    def __init__(self, connection=None):
+        super().__init__(connection)
+        self._next_id = None
+
+    # Преобразование строк
+    def _row(self, employee: AbstractEmployee) -> tuple:
+        emp_type = employee.__class__.__name__
+        if self.EMPLOYEE_TYPES.get(emp_type) is not employee.__class__:
+            raise TypeError(f"Тип сотрудника {emp_type} не поддерживается репозиторием")
+        return (
+            employee.id,
+            employee.name,
+            employee.department,
+            employee.base_salary,
+            emp_type,
+            employee.bonus if emp_type == "Manager" else None,
+            employee.seniority if emp_type == "Developer" else None,
+            employee.commission_rate if emp_type == "Salesperson" else None,
+            employee.sales if emp_type == "Salesperson" else None,
+        )
+
+    @staticmethod
+    def _skill_rows(employees: List[AbstractEmployee]) -> List[tuple]:
+        return [
+            (employee.id, position, skill)
+            for employee in employees
+            if isinstance(employee, Developer)
+            for position, skill in enumerate(employee.skills)
+        ]
+
+    def _build(self, row: tuple, skills: Dict[int, List[str]]) -> AbstractEmployee:
+        emp_id, name, department, base_salary, emp_type = row[:5]
+        bonus, seniority, commission_rate, sales = row[5:]
+        if emp_type == "Manager":
+            employee = Manager(emp_id, name, department, base_salary)
+            employee.bonus = bonus
+        elif emp_type == "Developer":
+            employee = Developer(
+                emp_id, name, department, base_salary, skills.get(emp_id, []), seniority
+            )
+        elif emp_type == "Salesperson":
+            employee = Salesperson(
+                emp_id, name, department, base_salary, commission_rate
+            )
+            if sales:
+                employee.update_sales(sales)
+        else:
+            employee = Employee(emp_id, name, department, base_salary)
+        return employee
+
+    @staticmethod
+    def _load_skills(
+        connection: sqlite3.Connection, employee_ids: Optional[List[int]] = None
+    ) -> Dict[int, List[str]]:
+        query = "SELECT employee_id, skill FROM employee_skills"
+        params: tuple = ()
+        if employee_ids is not None:
+            query += f" WHERE employee_id IN ({', '.join('?' * len(employee_ids))})"
+            params = tuple(employee_ids)
+        skills: Dict[int, List[str]] = {}
+        query += " ORDER BY employee_id, position"
+        for employee_id, skill in connection.execute(query, params):
+            skills.setdefault(employee_id, []).append(skill)
+        return skills
+
+    def _assign_ids(
+        self, connection: sqlite3.Connection, employees: List[AbstractEmployee]
+    ) -> None:
+        # Вызывается внутри транзакции записи, поэтому ID не пересекаются
+        if self._next_id is None:
+            query = "SELECT MAX(id) FROM employees"
+            max_id = connection.execute(query).fetchone()[0]
+            self._next_id = (max_id or 0) + 1
+        for employee in employees:
+            if employee.id == 0:
+                employee.id = self._next_id
+                self._next_id += 1
+            elif employee.id >= self._next_id:
+                self._next_id = employee.id + 1
+
+    def _write_rows(
+        self,
+        connection: sqlite3.Connection,
+        statement: str,
+        employees: List[AbstractEmployee],
+        replace_skills: bool,
+    ) -> int:
+        """Записать строки сотрудников и их навыки, вернуть число строк"""
+        # Навыки пишутся раньше строк сотрудников: триггеры поискового
+        # индекса (CompanySearchIndex) читают их при записи сотрудника
+        if replace_skills:
+            connection.executemany(
+                "DELETE FROM employee_skills WHERE employee_id = ?",
+                [(employee.id,) for employee in employees],
+            )
+        connection.executemany(
+            "INSERT INTO employee_skills (employee_id, position, skill) "
+            "VALUES (?, ?, ?)",
+            self._skill_rows(employees),
+        )
+        return connection.executemany(statement, map(self._row, employees)).rowcount
+
+    def _write(
+        self, statement: str, employees: List[AbstractEmployee], replace_skills: bool
+    ) -> None:
+        with self._writing() as connection:
+            self._assign_ids(connection, employees)
+            self._write_rows(connection, statement, employees, replace_skills)
+
+    def save_changes(
+        self,
+        new: List[AbstractEmployee],
+        dirty: List[AbstractEmployee],
+        removed: List[AbstractEmployee],
+    ) -> None:
+        """
+        Записать изменения UnitOfWork одной транзакцией
+
+        Каждая группа записывается пакетом executemany; при ошибке
+        транзакция откатывается, а новым сотрудникам возвращаются
+        прежние ID.
+
+        Raises:
+            LookupError: Измененного сотрудника уже нет в базе
+        """
+        old_ids = [employee.id for employee in new]
+        try:
+            with self._writing() as connection:
+                self._assign_ids(connection, new)
+                self._write_rows(connection, self._INSERT, new, replace_skills=False)
+                updated = self._write_rows(
+                    connection, self._UPDATE, dirty, replace_skills=True
+                )
+                if updated != len(dirty):
+                    query = "SELECT 1 FROM employees WHERE id = ?"
+                    missing = [
+                        employee.id
+                        for employee in dirty
+                        if connection.execute(query, (employee.id,)).fetchone() is None
+                    ]
+                    raise LookupError(f"Сотрудники с ID {missing} не найдены в базе")
+                removed_ids = [(employee.id,) for employee in removed]
+                connection.executemany(
+                    "DELETE FROM employees WHERE id = ?", removed_ids
+                )
+                connection.executemany(
+                    "DELETE FROM employee_skills WHERE employee_id = ?", removed_ids
+                )
+        except Exception:
+            for employee, old_id in zip(new, old_ids):
+                employee.id = old_id
+            self._next_id = None
+            raise
+
+    # Интерфейс EmployeeRepository
+    def add(self, employee: AbstractEmployee):
+        self.add_many([employee])
+
+    def add_many(self, employees: List[AbstractEmployee]) -> int:
+        """Добавить сотрудников одной транзакцией (ID 0 назначаются автоматически)"""
+        employees = list(employees)
+        self._write(self._INSERT, employees, replace_skills=False)
+        return len(employees)
+
+    def upsert_many(self, employees: List[AbstractEmployee]) -> int:
+        """Добавить или обновить сотрудников одной транзакцией"""
+        employees = list(employees)
+        self._write(self._UPSERT, employees, replace_skills=True)
+        return len(employees)
+
+    def get(self, employee_id: int) -> Optional[AbstractEmployee]:
+        with self._reading() as connection:
+            query = self._SELECT + " WHERE id = ?"
+            row = connection.execute(query, (employee_id,)).fetchone()
+            if row is None:
+                return None
+            skills = {}
+            if row[4] == "Developer":
+                skills = self._load_skills(connection, [employee_id])
+        return self._build(row, skills)
+
+    def _select(
+        self,
+        where: Optional[str] = None,
+        params: tuple = (),
+        limit: Optional[int] = None,
+    ) -> List[AbstractEmployee]:
+        tail = f" WHERE {where}" if where else ""
+        tail += " ORDER BY id"
+        if limit is not None:
+            tail += " LIMIT ?"
+            params = params + (limit,)
+        skills_query = "SELECT employee_id, skill FROM employee_skills"
+        skills_params: tuple = ()
+        if where or limit is not None:
+            # Навыки только выбранных строк - тем же условием в подзапросе
+            skills_query += f" WHERE employee_id IN (SELECT id FROM employees{tail})"
+            skills_params = params
+        skills: Dict[int, List[str]] = {}
+        with self._reading() as connection:
+            skills_query += " ORDER BY employee_id, position"
+            for employee_id, skill in connection.execute(skills_query, skills_params):
+                skills.setdefault(employee_id, []).append(skill)
+            rows = connection.execute(self._SELECT + tail, params).fetchall()
+        return [self._build(row, skills) for row in rows]
+
+    def get_all(self) -> List[AbstractEmployee]:
+        return self._select()
+
+    def get_many(self, employee_ids) -> Dict[int, AbstractEmployee]:
+        """Сотрудники по списку ID (запросами IN не длиннее MAX_IN_PARAMS)"""
+        employee_ids = list(dict.fromkeys(employee_ids))
+        found: Dict[int, AbstractEmployee] = {}
+        for start in range(0, len(employee_ids), self.MAX_IN_PARAMS):
+            chunk = tuple(employee_ids[start : start + self.MAX_IN_PARAMS])
+            where = f"id IN ({', '.join('?' * len(chunk))})"
+            for employee in self._select(where, chunk):
+                found[employee.id] = employee
+        return found
+
+    def iter_department(self, department: str, page_size: int = 500):
+        """Сотрудники отдела страницами по page_size (по возрастанию ID)"""
+        if page_size < 1:
+            raise ValueError("Размер страницы должен быть положительным")
+        last_id = -1
+        while True:
+            page = self._select(
+                "department = ? AND id > ?", (department, last_id), page_size
+            )
+            yield from page
+            if len(page) < page_size:
+                return
+            last_id = page[-1].id
+
+    def count_department(self, department: str) -> int:
+        with self._reading() as connection:
+            query = "SELECT COUNT(*) FROM employees WHERE department = ?"
+            return connection.execute(query, (department,)).fetchone()[0]
+
+    def update(self, employee: AbstractEmployee):
+        # Проверка и запись - в одной транзакции на одном подключении;
+        # BEGIN IMMEDIATE берет блокировку записи до проверки
+        with self._writing() as connection:
+            if not connection.in_transaction:
+                connection.execute("BEGIN IMMEDIATE")
+            query = "SELECT 1 FROM employees WHERE id = ?"
+            if connection.execute(query, (employee.id,)).fetchone() is None:
+                return False
+            self._write_rows(connection, self._UPDATE, [employee], replace_skills=True)
+        return True
+
+    def delete(self, employee_id: int) -> bool:
+        with self._writing() as connection:
+            deleted = connection.execute(
+                "DELETE FROM employees WHERE id = ?", (employee_id,)
+            ).rowcount
+            connection.execute(
+                "DELETE FROM employee_skills WHERE employee_id = ?", (employee_id,)
+            )
+        return deleted > 0
+
+    @staticmethod
+    def _condition(specification) -> Tuple[str, tuple, bool]:
+        """Условие WHERE, параметры и признак того, что оно точное"""
+        condition = specification.to_sql()
+        if condition is not None:
+            return condition[0], condition[1], True
+        filters = specification.sql_filters()
+        where = " AND ".join(f"({clause})" for clause, _ in filters)
+        params = tuple(param for _, clause_params in filters for param in clause_params)
+        return where, params, False
+
+    def find_by_specification(self, specification) -> List[AbstractEmployee]:
+        where, params, exact = self._condition(specification)
+        employees = self._select(where, params)
+        if exact:
+            return employees
+        return [emp for emp in employees if specification.is_satisfied_by(emp)]
+
+    def explain(self, specification) -> List[str]:
+        """План запроса SQLite для спецификации (какие индексы используются)"""
+        where, params, _ = self._condition(specification)
+        query = f"EXPLAIN QUERY PLAN {self._SELECT} WHERE {where or 1}"
+        with self._reading() as connection:
+            return [row[-1] for row in connection.execute(query, params)]
+
+    def count(self) -> int:
+        with self._reading() as connection:
+            return connection.execute("SELECT COUNT(*) FROM employees").fetchone()[0]
+
+    # Зарплатные сводки агрегатами в базе
+    def payroll_by_group(self) -> List[Tuple[str, str, int, float]]:
+        """
+        Число сотрудников и сумма зарплат по отделам и типам
+
+        Один запрос GROUP BY department, type по покрывающему индексу
+        idx_employees_payroll; объекты сотрудников не создаются.
+
+        Returns:
+            List[Tuple[str, str, int, float]]: (отдел, тип, число, сумма)
+        """
+        query = (
+            f"SELECT department, type, COUNT(*), SUM({EMPLOYEE_SALARY_SQL}) "
+            "FROM employees GROUP BY department, type"
+        )
+        with self._reading() as connection:
+            return connection.execute(query).fetchall()
+
+    def payroll_summary(self) -> Dict[str, float]:
+        """Итог в формате CompanyFacade.calculate_payroll"""
+        groups = self.payroll_by_group()
+        total = sum(group[3] for group in groups)
+        count = sum(group[2] for group in groups)
+        return {
+            "total": total,
+            "count": count,
+            "average": total / count if count > 0 else 0,
+        }
+
+    def get_department_stats(self, names: Optional[Dict[str, str]] = None):
+        """Статистика по отделам в формате Company.get_department_stats"""
+        return _department_stats_from_groups(self.payroll_by_group(), names)
+
+
+# 4.5. Lazy Load: прокси сотрудников, проекты и отделы из базы
+PROJECT_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS projects (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        status TEXT NOT NULL,
+        description TEXT NOT NULL DEFAULT ''
+    );
+    CREATE TABLE IF NOT EXISTS project_team (
+        project_id INTEGER NOT NULL,
+        position INTEGER NOT NULL,
+        employee_id INTEGER NOT NULL,
+        PRIMARY KEY (project_id, position)
+    ) WITHOUT ROWID;
+"""
+
+
+class EmployeeProxy:
+    """Ленивая ссылка на сотрудника (Virtual Proxy)
+
+    ID известен сразу, строка сотрудника читается при первом обращении к
+    любому другому атрибуту - вместе со всеми еще не загруженными
+    ссылками того же загрузчика.
+    """
+
+    __slots__ = ("_employee_id", "_loader")
+
+    def __init__(self, employee_id: int, loader: "EmployeeBatchLoader"):
+        object.__setattr__(self, "_employee_id", employee_id)
+        object.__setattr__(self, "_loader", loader)
+
+    @property
+    def id(self) -> int:
+        return self._employee_id
+
+    @property
+    def loaded(self) -> bool:
+        return self._loader.is_loaded(self._employee_id)
+
+    def resolve(self) -> AbstractEmployee:
+        """Настоящий объект сотрудника"""
+        return self._loader.resolve(self._employee_id)
+
+    def __getattr__(self, name):
+        return getattr(self.resolve(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self.resolve(), name, value)
+
+    def __repr__(self):
+        state = "loaded" if self.loaded else "pending"
+        return f"EmployeeProxy(id={self._employee_id}, {state})"
+
+
+class EmployeeBatchLoader:
+    """Загрузчик сотрудников для EmployeeProxy
+
+    Ссылки на еще не загруженных сотрудников копятся в очереди; первое
+    обращение к любой из них загружает всю очередь запросами IN (...).
+    На каждый ID создается одна ссылка и один объект сотрудника.
+    """
+
+    def __init__(self, repository: "SqliteEmployeeRepository"):
+        self._repository = repository
+        self._proxies: Dict[int, EmployeeProxy] = {}
+        self._loaded: Dict[int, AbstractEmployee] = {}
+        # Упорядоченное множество ID, ожидающих загрузки
+        self._pending: Dict[int, None] = {}
+        self.queries = 0
+
+    def proxy(self, employee_id: int) -> EmployeeProxy:
+        proxy = self._proxies.get(employee_id)
+        if proxy is None:
+            proxy = self._proxies[employee_id] = EmployeeProxy(employee_id, self)
+            if employee_id not in self._loaded:
+                self._pending[employee_id] = None
+        return proxy
+
+    def is_loaded(self, employee_id: int) -> bool:
+        return employee_id in self._loaded
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def load_pending(self) -> None:
+        """Загрузить всех ожидающих сотрудников"""
+        employee_ids = list(self._pending)
+        self._pending.clear()
+        if employee_ids:
+            batch = self._repository.MAX_IN_PARAMS
+            self.queries += -(-len(employee_ids) // batch)
+            self._loaded.update(self._repository.get_many(employee_ids))
+
+    def resolve(self, employee_id: int) -> AbstractEmployee:
+        employee = self._loaded.get(employee_id)
+        if employee is None:
+            self._pending[employee_id] = None
+            self.load_pending()
+            employee = self._loaded.get(employee_id)
+            if employee is None:
+                raise LookupError(f"Сотрудник с ID {employee_id} не найден")
+        return employee
+
+
+class SqliteProjectRepository(_SqliteRepository):
+    """Проекты в SQLite с ленивой загрузкой команд
+
+    В базе хранятся только ID участников команды. Загруженный проект
+    получает в команде EmployeeProxy, поэтому строки сотрудников читаются
+    лишь при обращении к ним - пакетом для всех загруженных проектов.
+    """
+
+    SCHEMA = PROJECT_SCHEMA
+
+    def __init__(self, connection=None, loader: Optional[EmployeeBatchLoader] = None):
+        """
+        Args:
+            connection: sqlite3.Connection или ConnectionPool
+            loader: Загрузчик сотрудников (по умолчанию над той же базой)
+        """
+        super().__init__(connection)
+        if loader is None:
+            loader = EmployeeBatchLoader(
+                SqliteEmployeeRepository(self._pool or self._connection)
+            )
+        self.loader = loader
+
+    def add(self, project: Project) -> None:
+        """Добавить или перезаписать проект вместе с составом команды"""
+        team = [
+            (project.id, position, member.id)
+            for position, member in enumerate(project.get_team())
+        ]
+        with self._writing() as connection:
+            connection.execute(
+                "INSERT INTO projects (id, name, status, description) "
+                "VALUES (?, ?, ?, ?) ON CONFLICT(id) DO UPDATE SET "
+                "name = excluded.name, status = excluded.status, "
+                "description = excluded.description",
+                (project.id, project.name, project.status, project.description),
+            )
+            connection.execute(
+                "DELETE FROM project_team WHERE project_id = ?", (project.id,)
+            )
+            connection.executemany(
+                "INSERT INTO project_team (project_id, position, employee_id) "
+                "VALUES (?, ?, ?)",
+                team,
+            )
+
+    def _load(self, where: str = "", params: tuple = ()) -> List[Project]:
+        with self._reading() as connection:
+            rows = connection.execute(
+                f"SELECT id, name, status, description FROM projects{where} "
+                "ORDER BY id",
+                params,
+            ).fetchall()
+            team_rows = connection.execute(
+                "SELECT project_id, employee_id FROM project_team "
+                f"WHERE project_id IN (SELECT id FROM projects{where}) "
+                "ORDER BY project_id, position",
+                params,
+            ).fetchall()
+        projects = {}
+        for project_id, name, status, description in rows:
+            projects[project_id] = Project(project_id, name, status, description)
+        for project_id, employee_id in team_rows:
+            projects[project_id].add_team_member(self.loader.proxy(employee_id))
+        return list(projects.values())
+
+    def get(self, project_id: int) -> Optional[Project]:
+        projects = self._load(" WHERE id = ?", (project_id,))
+        return projects[0] if projects else None
+
+    def get_all(self) -> List[Project]:
+        return self._load()
+
+    def delete(self, project_id: int) -> bool:
+        with self._writing() as connection:
+            connection.execute(
+                "DELETE FROM project_team WHERE project_id = ?", (project_id,)
+            )
+            deleted = connection.execute(
+                "DELETE FROM projects WHERE id = ?", (project_id,)
+            ).rowcount
+        return deleted > 0
+
+
+class LazyDepartment(Department):
+    """Отдел, сотрудники которого хранятся в SqliteEmployeeRepository
+
+    Итерация читает сотрудников страницами по page_size, не загружая
+    весь отдел; сотрудники отдела - строки с department, равным коду.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        code: str,
+        repository: SqliteEmployeeRepository,
+        page_size: int = 500,
+    ):
+        super().__init__(name, code)
+        self._repository = repository
+        self.page_size = page_size
+
+    def add_employee(self, employee):
+        if not isinstance(employee, AbstractEmployee):
+            raise TypeError("Можно добавлять только объекты AbstractEmployee")
+        employee.department = self.code
+        self._repository.add(employee)
+
+    def get_employees(self):
+        return list(self)
+
+    def __iter__(self):
+        return self._repository.iter_department(self.code, self.page_size)
+
+    def __len__(self):
+        return self._repository.count_department(self.code)
+
+
+# 4.6. Асинхронный фасад репозитория
+class AsyncEmployeeRepository:
+    """Асинхронный доступ к SqliteEmployeeRepository для asyncio
+
+    Запросы выполняются в отдельном пуле потоков из max_workers потоков и
+    не блокируют цикл событий. Репозиторий должен работать через
+    ConnectionPool (у каждого потока - свое подключение). max_pending
+    ограничивает число запросов в работе и в очереди: следующие вызовы
+    ждут освобождения места.
+
+    Вызовы get, сделанные в одной итерации цикла (или в течение
+    batch_window секунд), объединяются в один запрос IN (...); одинаковые
+    ID в одной пачке получают один и тот же объект.
+    """
+
+    def __init__(
+        self,
+        repository: SqliteEmployeeRepository,
+        max_workers: int = 4,
+        max_pending: Optional[int] = None,
+        batch_window: float = 0.0,
+    ):
+        """
+        Args:
+            repository: Репозиторий над ConnectionPool
+            max_workers: Число потоков для запросов
+            max_pending: Максимум запросов в работе и в очереди (None - без ограничения)
+            batch_window: Сколько секунд копить get перед запросом
+        """
+        if max_workers < 1:
+            raise ValueError("Число потоков должно быть положительным")
+        if max_pending is not None and max_pending < 1:
+            raise ValueError("Ограничение очереди должно быть положительным")
+        self._repository = repository
+        self.max_workers = max_workers
+        self.batch_window = batch_window
+        self._executor = ThreadPoolExecutor(
+            max_workers, thread_name_prefix="employee-db"
+        )
+        self._limit = asyncio.Semaphore(max_pending) if max_pending else None
+        self._lookups: Dict[int, List[asyncio.Future]] = {}
+        self._flush_scheduled = False
+        # Метрики (счетчики меняются и в потоках пула)
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._queued = 0
+        self._running = 0
+        self._peak_queued = 0
+        self._calls = 0
+        self._wait_time = 0.0
+        self._lookup_calls = 0
+        self._lookup_batches = 0
+
+    async def __aenter__(self) -> "AsyncEmployeeRepository":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Дождаться выполняющихся запросов и остановить пул потоков"""
+        self._executor.shutdown(wait=True)
+
+    # Выполнение в пуле
+    async def _run(self, func, *args):
+        if self._limit is None:
+            return await self._submit(func, *args)
+        # Ожидающие места в max_pending (счетчик меняется только в цикле событий)
+        self._waiting += 1
+        try:
+            await self._limit.acquire()
+        finally:
+            self._waiting -= 1
+        try:
+            return await self._submit(func, *args)
+        finally:
+            self._limit.release()
+
+    def _submit(self, func, *args) -> asyncio.Future:
+        enqueued = time.monotonic()
+        with self._lock:
+            self._calls += 1
+            self._queued += 1
+            self._peak_queued = max(self._peak_queued, self._queued)
+
+        def call():
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+                self._wait_time += time.monotonic() - enqueued
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self._running -= 1
+
+        return asyncio.get_running_loop().run_in_executor(self._executor, call)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Глубина очереди и загрузка пула (для подбора max_workers)
+
+        waiting - вызовы, ждущие места в max_pending; queued - запросы в
+        очереди пула потоков; running - выполняющиеся запросы.
+        """
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "waiting": self._waiting,
+                "queued": self._queued,
+                "running": self._running,
+                "peak_queued": self._peak_queued,
+                "calls": self._calls,
+                "avg_queue_wait": self._wait_time / self._calls if self._calls else 0.0,
+                "pending_lookups": sum(len(items) for items in self._lookups.values()),
+                "lookup_calls": self._lookup_calls,
+                "lookup_batches": self._lookup_batches,
+            }
+
+    # Точечные запросы пачками
+    async def get(self, employee_id: int) -> Optional[AbstractEmployee]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._lookups.setdefault(employee_id, []).append(future)
+        self._lookup_calls += 1
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            if self.batch_window > 0:
+                loop.call_later(self.batch_window, self._flush_lookups)
+            else:
+                loop.call_soon(self._flush_lookups)
+        return await future
+
+    def _flush_lookups(self) -> None:
+        self._flush_scheduled = False
+        lookups, self._lookups = self._lookups, {}
+        self._lookup_batches += 1
+        task = asyncio.ensure_future(
+            self._run(self._repository.get_many, list(lookups))
+        )
+        task.add_done_callback(lambda done: self._resolve_lookups(lookups, done))
+
+    @staticmethod
+    def _resolve_lookups(lookups: Dict[int, List[asyncio.Future]], task) -> None:
+        error = asyncio.CancelledError() if task.cancelled() else task.exception()
+        found = {} if error is not None else task.result()
+        for employee_id, waiters in lookups.items():
+            for waiter in waiters:
+                if waiter.done():
+                    continue
+                if error is not None:
+                    waiter.set_exception(error)
+                else:
+                    waiter.set_result(found.get(employee_id))
+
+    # Остальные операции репозитория
+    async def get_many(self, employee_ids) -> Dict[int, AbstractEmployee]:
+        return await self._run(self._repository.get_many, list(employee_ids))
+
+    async def get_all(self) -> List[AbstractEmployee]:
+        return await self._run(self._repository.get_all)
+
+    async def add(self, employee: AbstractEmployee) -> None:
+        await self._run(self._repository.add, employee)
+
+    async def add_many(self, employees: List[AbstractEmployee]) -> int:
+        return await self._run(self._repository.add_many, list(employees))
+
+    async def upsert_many(self, employees: List[AbstractEmployee]) -> int:
+        return await self._run(self._repository.upsert_many, list(employees))
+
+    async def update(self, employee: AbstractEmployee) -> bool:
+        return await self._run(self._repository.update, employee)
+
+    async def delete(self, employee_id: int) -> bool:
+        return await self._run(self._repository.delete, employee_id)
+
+    async def find_by_specification(self, specification) -> List[AbstractEmployee]:
+        return await self._run(self._repository.find_by_specification, specification)
+
+    async def count(self) -> int:
+        return await self._run(self._repository.count)
+
+    async def payroll_summary(self) -> Dict[str, float]:
+        return await self._run(self._repository.payroll_summary)
+
+
+# 4.7. Кэширующий репозиторий (Decorator поверх любого репозитория)
+class CachingEmployeeRepository:
+    """Кэш чтения перед репозиторием сотрудников
+
+    get сначала ищет сотрудника в LRU-кэше ограниченного размера (с
+    необязательным временем жизни записей), при промахе читает его из
+    репозитория и запоминает. Отсутствующие ID тоже запоминаются, если
+    negative_cache включен. Запись (add, update, delete и т.д.) идет в
+    репозиторий, после чего затронутые ID удаляются из кэша. Остальные
+    методы репозитория передаются ему без изменений.
+
+    Кэш хранит те же объекты, что вернул репозиторий: изменения объекта
+    без update видны следующим get.
+    """
+
+    # Отметка "сотрудника нет" в кэше
+    _MISSING = object()
+
+    def __init__(
+        self,
+        repository,
+        max_size: int = 1024,
+        ttl: Optional[float] = None,
+        negative_cache: bool = True,
+        clock=time.monotonic,
+    ):
+        """
+        Args:
+            repository: Репозиторий с интерфейсом EmployeeRepository
+            max_size: Максимум записей в кэше
+            ttl: Время жизни записи в секундах (None - без ограничения)
+            negative_cache: Запоминать отсутствующие ID
+            clock: Источник времени для ttl
+        """
+        if max_size < 1:
+            raise ValueError("Размер кэша должен быть положительным")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("Время жизни записи должно быть положительным")
+        self._repository = repository
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_cache = negative_cache
+        self._clock = clock
+        self._cache: "OrderedDict[int, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Растет при каждой инвалидации: прочитанное до нее в кэш не попадает
+        self._generation = 0
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __getattr__(self, name):
+        return getattr(self._repository, name)
+
+    # Работа с кэшем
+    def _lookup(self, employee_id: int):
+        """Значение из кэша или None, если записи нет (с учетом ttl)"""
+        entry = self._cache.get(employee_id)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and self._clock() >= expires_at:
+            del self._cache[employee_id]
+            self.expirations += 1
+            return None
+        self._cache.move_to_end(employee_id)
+        if value is self._MISSING:
+            self.negative_hits += 1
+        else:
+            self.hits += 1
+        return value
+
+    def _store(self, employee_id: int, value, generation: int) -> None:
+        if generation != self._generation:
+            return
+        if value is self._MISSING and not self.negative_cache:
+            return
+        expires_at = None if self.ttl is None else self._clock() + self.ttl
+        self._cache[employee_id] = (value, expires_at)
+        self._cache.move_to_end(employee_id)
+        if len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, employee_ids=None) -> None:
+        """Удалить из кэша указанные ID (без аргумента - все)"""
+        with self._lock:
+            self._generation += 1
+            if employee_ids is None:
+                self._cache.clear()
+            else:
+                for employee_id in employee_ids:
+                    self._cache.pop(employee_id, None)
+
+    def cache_info(self) -> Dict[str, Any]:
+        """Статистика кэша"""
+        with self._lock:
+            served = self.hits + self.negative_hits
+            lookups = served + self.misses
+            return {
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "misses": self.misses,
+                "hit_rate": served / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "size": len(self._cache),
+                "max_size": self.max_size,
+            }
+
+    # Чтение
+    def get(self, employee_id: int) -> Optional[AbstractEmployee]:
+        with self._lock:
+            value = self._lookup(employee_id)
+            if value is not None:
+                return None if value is self._MISSING else value
+            self.misses += 1
+            generation = self._generation
+        employee = self._repository.get(employee_id)
+        with self._lock:
+            self._store(
+                employee_id, self._MISSING if employee is None else employee, generation
+            )
+        return employee
+
+    def get_many(self, employee_ids) -> Dict[int, AbstractEmployee]:
+        """Сотрудники по списку ID: промахи читаются одним запросом репозитория"""
+        found: Dict[int, AbstractEmployee] = {}
+        missing = []
+        with self._lock:
+            for employee_id in dict.fromkeys(employee_ids):
+                value = self._lookup(employee_id)
+                if value is None:
+                    self.misses += 1
+                    missing.append(employee_id)
+                elif value is not self._MISSING:
+                    found[employee_id] = value
+            generation = self._generation
+        if missing:
+            if hasattr(self._repository, "get_many"):
+                loaded = self._repository.get_many(missing)
+            else:
+                loaded = {}
+                for employee_id in missing:
+                    employee = self._repository.get(employee_id)
+                    if employee is not None:
+                        loaded[employee_id] = employee
+            with self._lock:
+                for employee_id in missing:
+                    self._store(
+                        employee_id, loaded.get(employee_id, self._MISSING), generation
+                    )
+            found.update(loaded)
+        return found
+
+    # Запись с инвалидацией
+    def add(self, employee: AbstractEmployee):
+        try:
+            return self._repository.add(employee)
+        finally:
+            self.invalidate([employee.id])
+
+    def add_many(self, employees: List[AbstractEmployee]) -> int:
+        employees = list(employees)
+        try:
+            return self._repository.add_many(employees)
+        finally:
+            self.invalidate(employee.id for employee in employees)
+
+    def upsert_many(self, employees: List[AbstractEmployee]) -> int:
+        employees = list(employees)
+        try:
+            return self._repository.upsert_many(employees)
+        finally:
+            self.invalidate(employee.id for employee in employees)
+
+    def update(self, employee: AbstractEmployee):
+        try:
+            return self._repository.update(employee)
+        finally:
+            self.invalidate([employee.id])
+
+    def delete(self, employee_id: int) -> bool:
+        try:
+            return self._repository.delete(employee_id)
+        finally:
+            self.invalidate([employee_id])
+
+    def save_changes(self, new, dirty, removed) -> None:
+        """Запись изменений UnitOfWork с инвалидацией затронутых ID"""
+        try:
+            if hasattr(self._repository, "save_changes"):
+                self._repository.save_changes(new, dirty, removed)
+            else:
+                for employee in new:
+                    self._repository.add(employee)
+                for employee in dirty:
+                    self._repository.update(employee)
+                for employee in removed:
+                    self._repository.delete(employee.id)
+        finally:
+            self.invalidate(employee.id for employee in [*new, *dirty, *removed])
+
+
+# 4.8. Полнотекстовый поиск по сотрудникам и проектам (SQLite FTS5)
+_FTS_OPTIONS = "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'"
+_SKILLS_SQL = (
+    "(SELECT group_concat(skill, ' ') FROM (SELECT skill FROM employee_skills "
+    "WHERE employee_id = {0} ORDER BY position))"
+)
+
+SEARCH_SCHEMA = f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS employee_search
+        USING fts5(name, skills, {_FTS_OPTIONS});
+    CREATE VIRTUAL TABLE IF NOT EXISTS project_search
+        USING fts5(name, description, {_FTS_OPTIONS});
+
+    CREATE TRIGGER IF NOT EXISTS employees_search_insert
+    AFTER INSERT ON employees BEGIN
+        INSERT INTO employee_search (rowid, name, skills)
+        VALUES (new.id, new.name, coalesce({_SKILLS_SQL.format("new.id")}, ''));
+    END;
+    CREATE TRIGGER IF NOT EXISTS employees_search_update
+    AFTER UPDATE ON employees BEGIN
+        UPDATE employee_search
+        SET name = new.name, skills = coalesce({_SKILLS_SQL.format("new.id")}, '')
+        WHERE rowid = new.id;
+    END;
+    CREATE TRIGGER IF NOT EXISTS employees_search_delete
+    AFTER DELETE ON employees BEGIN
+        DELETE FROM employee_search WHERE rowid = old.id;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS projects_search_insert
+    AFTER INSERT ON projects BEGIN
+        INSERT INTO project_search (rowid, name, description)
+        VALUES (new.id, new.name, new.description);
+    END;
+    CREATE TRIGGER IF NOT EXISTS projects_search_update
+    AFTER UPDATE OF name, description ON projects BEGIN
+        UPDATE project_search SET name = new.name, description = new.description
+        WHERE rowid = new.id;
+    END;
+    CREATE TRIGGER IF NOT EXISTS projects_search_delete
+    AFTER DELETE ON projects BEGIN
+        DELETE FROM project_search WHERE rowid = old.id;
+    END;
+"""
+
+
+class CompanySearchIndex(_SqliteRepository):
+    """Полнотекстовый индекс по сотрудникам и проектам
+
+    Имена и навыки сотрудников хранятся в таблице FTS5 employee_search,
+    названия и описания проектов - в project_search; rowid совпадает с ID
+    сотрудника или проекта. Триггеры на employees и projects обновляют
+    индекс в той же транзакции, в которой SqliteEmployeeRepository и
+    SqliteProjectRepository меняют данные. Навыки попадают в индекс при
+    записи строки сотрудника (репозиторий пишет их раньше), так что на
+    сотрудника приходится одна запись в FTS5, а не по одной на навык.
+
+    Триггеры появляются вместе с индексом: если в базе уже были данные,
+    после создания индекса нужно один раз вызвать rebuild(). Компанию в
+    памяти индекс принимает через rebuild(company).
+
+    Поиск возвращает результаты по убыванию релевантности (bm25) с
+    фрагментом текста, в котором найденные слова выделены скобками.
+    """
+
+    SCHEMA = EMPLOYEE_SCHEMA + PROJECT_SCHEMA + SEARCH_SCHEMA
+    HIGHLIGHT = ("[", "]")
+
+    def rebuild(self, company=None) -> Dict[str, int]:
+        """Пересобрать индекс целиком
+
+        Args:
+            company: Компания в памяти; по умолчанию индекс собирается из
+                таблиц employees, employee_skills и projects
+
+        Returns:
+            Количество проиндексированных сотрудников и проектов
+        """
+        with self._writing() as connection:
+            connection.execute("DELETE FROM employee_search")
+            connection.execute("DELETE FROM project_search")
+            if company is None:
+                connection.execute(
+                    "INSERT INTO employee_search (rowid, name, skills) "
+                    f"SELECT id, name, coalesce({_SKILLS_SQL.format('id')}, '') "
+                    "FROM employees"
+                )
+                connection.execute(
+                    "INSERT INTO project_search (rowid, name, description) "
+                    "SELECT id, name, description FROM projects"
+                )
+            else:
+                connection.executemany(
+                    "INSERT INTO employee_search (rowid, name, skills) "
+                    "VALUES (?, ?, ?)",
+                    map(self._employee_row, company.get_all_employees()),
+                )
+                connection.executemany(
+                    "INSERT INTO project_search (rowid, name, description) "
+                    "VALUES (?, ?, ?)",
+                    map(self._project_row, getattr(company, "get_projects", list)()),
+                )
+            for table in ("employee_search", "project_search"):
+                connection.execute(f"INSERT INTO {table} ({table}) VALUES ('optimize')")
+            return {
+                "employees": self._count(connection, "employee_search"),
+                "projects": self._count(connection, "project_search"),
+            }
+
+    @staticmethod
+    def _count(connection, table: str) -> int:
+        return connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    @staticmethod
+    def _employee_row(employee) -> tuple:
+        skills = getattr(employee, "skills", None) or getattr(
+            employee, "tech_stack", None
+        )
+        return employee.id, employee.name, " ".join(skills or [])
+
+    @staticmethod
+    def _project_row(project) -> tuple:
+        project_id = getattr(project, "project_id", None)
+        if project_id is None:
+            project_id = project.id
+        return project_id, project.name, getattr(project, "description", "")
+
+    def index_employee(self, employee) -> None:
+        """Добавить или обновить сотрудника, которого нет в таблицах базы"""
+        with self._writing() as connection:
+            connection.execute(
+                "DELETE FROM employee_search WHERE rowid = ?", (employee.id,)
+            )
+            connection.execute(
+                "INSERT INTO employee_search (rowid, name, skills) VALUES (?, ?, ?)",
+                self._employee_row(employee),
+            )
+
+    def remove_employee(self, employee_id: int) -> bool:
+        with self._writing() as connection:
+            return connection.execute(
+                "DELETE FROM employee_search WHERE rowid = ?", (employee_id,)
+            ).rowcount > 0
+
+    def index_project(self, project) -> None:
+        """Добавить или обновить проект, которого нет в таблицах базы"""
+        row = self._project_row(project)
+        with self._writing() as connection:
+            connection.execute("DELETE FROM project_search WHERE rowid = ?", row[:1])
+            connection.execute(
+                "INSERT INTO project_search (rowid, name, description) "
+                "VALUES (?, ?, ?)",
+                row,
+            )
+
+    def remove_project(self, project_id: int) -> bool:
+        with self._writing() as connection:
+            return connection.execute(
+                "DELETE FROM project_search WHERE rowid = ?", (project_id,)
+            ).rowcount > 0
+
+    @staticmethod
+    def _match_query(query: str, prefix: bool) -> Optional[str]:
+        """Перевести текст запроса в выражение MATCH
+
+        Каждое слово берется в кавычки, поэтому синтаксис FTS5 в запросе
+        не интерпретируется; слова объединяются через AND. Слово со
+        звездочкой в конце (или любое слово при prefix=True) ищется по
+        префиксу.
+        """
+        terms = []
+        for word, star in re.findall(r"(\w+)(\*?)", query):
+            terms.append(f'"{word}"' + ("*" if prefix or star else ""))
+        return " ".join(terms) or None
+
+    def _search(self, table, columns, query, limit, prefix) -> List[Dict[str, Any]]:
+        match = self._match_query(query, prefix)
+        if match is None:
+            return []
+        opening, closing = self.HIGHLIGHT
+        with self._reading() as connection:
+            rows = connection.execute(
+                f"SELECT rowid, {', '.join(columns)}, "
+                f"snippet({table}, -1, ?, ?, '…', 8), rank FROM {table} "
+                f"WHERE {table} MATCH ? ORDER BY rank LIMIT ?",
+                (opening, closing, match, limit),
+            ).fetchall()
+        keys = ("id", *columns, "snippet", "rank")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def search_employees(
+        self, query: str, limit: int = 20, prefix: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Найти сотрудников по имени и навыкам
+
+        Returns:
+            Словари id, name, skills, snippet, rank; лучшие - первыми
+        """
+        return self._search(
+            "employee_search", ("name", "skills"), query, limit, prefix
+        )
+
+    def search_projects(
+        self, query: str, limit: int = 20, prefix: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Найти проекты по названию и описанию
+
+        Returns:
+            Словари id, name, description, snippet, rank; лучшие - первыми
+        """
+        return self._search(
+            "project_search", ("name", "description"), query, limit, prefix
+        )
+
+    def search(
+        self, query: str, limit: int = 20, prefix: bool = False
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Найти и сотрудников, и проекты"""
+        return {
+            "employees": self.search_employees(query, limit, prefix),
+            "projects": self.search_projects(query, limit, prefix),
+        }
+
 
 # ==================== ЧАСТЬ 5: ТЕСТИРОВАНИЕ И ДЕМОНСТРАЦИЯ ====================
 
@@ -1173,8 +2967,11 @@ def demonstrate_patterns():
     uow.register_dirty(salesperson)
 
     print("   Перед коммитом: изменения зарегистрированы")
-    uow.commit()
-    print("   После коммита: изменения применены")
+    counts = uow.commit()
+    print(
+        f"   После коммита: {counts['new']} новых, {counts['dirty']} измененных, "
+        f"{counts['removed']} удаленных"
+    )
 
     # 13. Specification
     print("\n13. SPECIFICATION (Фильтрация сотрудников):")
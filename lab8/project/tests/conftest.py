@@ -24,6 +24,7 @@ from source_code import (
     DatabaseConnection,
     EmployeeBuilder
 )
+from source_code import part4
 
 
 
@@ -125,6 +126,33 @@ def test_company_with_employees():
     return company
 
 
+@pytest.fixture
+def sample_company():
+    """Фикстура: компания part4 с сотрудниками всех типов и проектами
+
+    DEV: Developer 1, Manager 2, Employee 4; SALES: Salesperson 3;
+    EMPTY без сотрудников. Проект 10 (active) с командой [1],
+    проект 11 (planning) без команды.
+    """
+    company = part4.Company("TechCorp")
+    dev = part4.Department("Разработка", "DEV")
+    sales = part4.Department("Продажи", "SALES")
+    company.add_department(dev)
+    company.add_department(sales)
+    company.add_department(part4.Department("Пустой", "EMPTY"))
+    dev.add_employee(
+        part4.Developer(1, "Алиса", "DEV", 5000, ["Python", "SQL"], "middle")
+    )
+    dev.add_employee(part4.Manager(2, "Bob", "DEV", 6000, 1000))
+    sales.add_employee(part4.Salesperson(3, "Carol", "SALES", 4000, 0.1, 20000))
+    dev.add_employee(part4.Employee(4, "Eve", "DEV", 3000))
+    project = part4.Project(10, "AI", "Описание", "2030-12-31", "active")
+    company.add_project(project)
+    project.add_team_member(dev.find_employee_by_id(1))
+    company.add_project(part4.Project(11, "Empty", "Без команды", "2031-01-15"))
+    return company
+
+
 # ============================================================================
 # ФИКСТУРЫ ЧАСТЬ 5: ПАТТЕРНЫ
 # ============================================================================
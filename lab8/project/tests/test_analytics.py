@@ -0,0 +1,125 @@
+# tests/test_analytics.py
+"""
+Тесты для инкрементальной аналитики
+
+Тестирует:
+- Поток событий ChangeEvent от отделов, проектов и сотрудников
+- Совпадение инкрементальных агрегатов с полным пересчетом
+- Получение только изменившихся агрегатов
+"""
+
+import pytest
+from source_code.part4 import ChangeEvent, Developer
+from source_code.analytics import IncrementalAnalytics
+
+
+class RecordingObserver:
+    """Наблюдатель, запоминающий все события"""
+
+    def __init__(self):
+        self.events = []
+
+    def update(self, subject, event):
+        self.events.append(event)
+
+
+class TestChangeEvents:
+    """Тесты потока событий"""
+
+    def test_company_observer_receives_all_kinds(self, sample_company):
+        """Test: Наблюдатель компании получает события всех уровней"""
+        company = sample_company
+        observer = RecordingObserver()
+        company.add_observer(observer)
+
+        dev = company.find_department_by_code("DEV")
+        dev.add_employee(Developer(5, "Dan", "DEV", 3000, [], "junior"))
+        company.find_employee_by_id(2).bonus = 2000
+        project = company.find_project_by_id(10)
+        project.add_team_member(company.find_employee_by_id(5))
+        project.change_status("completed")
+
+        kinds = [event.kind for event in observer.events]
+        assert kinds == [
+            ChangeEvent.EMPLOYEE_ADDED,
+            ChangeEvent.SALARY_CHANGED,
+            ChangeEvent.TEAM_MEMBER_ADDED,
+            ChangeEvent.STATUS_CHANGED,
+        ]
+        salary_event = observer.events[1]
+        assert salary_event.payload["old_salary"] == 7000
+        assert salary_event.payload["new_salary"] == 8000
+
+    def test_removed_employee_is_detached(self, sample_company):
+        """Test: Удаленный сотрудник больше не шлет событий"""
+        company = sample_company
+        observer = RecordingObserver()
+        company.add_observer(observer)
+
+        manager = company.find_employee_by_id(2)
+        company.find_department_by_code("DEV").remove_employee(2)
+        manager.bonus = 5000
+
+        assert [event.kind for event in observer.events] == [
+            ChangeEvent.EMPLOYEE_REMOVED
+        ]
+
+
+class TestIncrementalAnalytics:
+    """Тесты инкрементальных агрегатов"""
+
+    def test_initial_stats_match_full_recalculation(self, sample_company):
+        """Test: Начальные агрегаты совпадают с Company"""
+        company = sample_company
+        analytics = IncrementalAnalytics(company)
+
+        assert analytics.get_department_stats() == company.get_department_stats()
+        assert (
+            analytics.get_project_budget_analysis()
+            == company.get_project_budget_analysis()
+        )
+
+    def test_stats_follow_changes(self, sample_company):
+        """Test: Агрегаты следуют за изменениями"""
+        company = sample_company
+        analytics = IncrementalAnalytics(company)
+
+        dev = company.find_department_by_code("DEV")
+        sales = company.find_department_by_code("SALES")
+        dev.add_employee(Developer(5, "Dan", "DEV", 3000, [], "junior"))
+        company.find_employee_by_id(1).seniority_level = "senior"
+        company.find_employee_by_id(3).update_sales(10000)
+        project = company.find_project_by_id(10)
+        project.add_team_member(company.find_employee_by_id(3))
+        project.remove_team_member(1)
+        project.change_status("planning")
+        dev.transfer_employee(5, sales)
+
+        assert analytics.get_department_stats() == company.get_department_stats()
+        assert (
+            analytics.get_project_budget_analysis()
+            == company.get_project_budget_analysis()
+        )
+
+    def test_drain_changes_returns_only_touched(self, sample_company):
+        """Test: Возвращаются только затронутые отделы и проекты"""
+        company = sample_company
+        analytics = IncrementalAnalytics(company)
+        analytics.drain_changes()
+
+        company.find_employee_by_id(3).sales_volume = 30000
+        departments, projects = analytics.drain_changes()
+
+        assert list(departments) == ["SALES"]
+        assert departments["SALES"]["total_salary"] == 7000
+        assert projects == {}
+        assert analytics.drain_changes() == ({}, {})
+
+    def test_close_stops_updates(self, sample_company):
+        """Test: После close события не применяются"""
+        company = sample_company
+        analytics = IncrementalAnalytics(company)
+        analytics.close()
+
+        company.find_employee_by_id(2).bonus = 0
+        assert analytics.events_applied == 0
@@ -0,0 +1,97 @@
+# tests/test_archive.py
+"""
+Тесты для сжатого архива компании
+
+Тестирует:
+- Сохранение и полную загрузку архива
+- Чтение одного отдела и проекта без распаковки остальных кадров
+- Кодеки zlib и lzma, параллельное сжатие
+- Обработку ошибок
+"""
+
+import pytest
+from source_code.part4 import (
+    Department,
+    Manager,
+    Developer,
+    DepartmentNotFoundError,
+    ProjectNotFoundError,
+)
+from source_code.archive import CompanyArchive, save_archive
+
+
+@pytest.fixture
+def company(sample_company):
+    """Фикстура: общая компания и пять отделов по 21 сотруднику"""
+    for index in range(1, 6):
+        dept = Department(f"Отдел {index}", f"D{index}")
+        sample_company.add_department(dept)
+        for offset in range(20):
+            emp_id = index * 100 + offset + 1
+            dept.add_employee(
+                Developer(emp_id, f"Dev{emp_id}", f"D{index}", 5000, ["Python"], "middle")
+            )
+        dept.add_employee(Manager(index * 100 + 99, f"Lead{index}", f"D{index}", 7000, 500))
+    sample_company.find_project_by_id(10).add_team_member(
+        sample_company.find_employee_by_id(201)
+    )
+    return sample_company
+
+
+class TestCompanyArchive:
+    """Тесты архива"""
+
+    @pytest.mark.parametrize("codec", ["zlib", "lzma"])
+    def test_roundtrip(self, tmp_path, codec, company):
+        """Test: Полная загрузка совпадает с исходной компанией"""
+        filename = str(tmp_path / f"company.{codec}")
+        save_archive(company, filename, codec=codec)
+
+        archive = CompanyArchive(filename)
+        loaded = archive.load()
+
+        assert archive.codec == codec
+        assert loaded.to_dict() == company.to_dict()
+        assert [emp.id for emp in loaded.find_project_by_id(10).get_team()] == [1, 201]
+
+    def test_read_single_department(self, tmp_path, monkeypatch, company):
+        """Test: Чтение отдела распаковывает только его кадр"""
+        filename = str(tmp_path / "company.arc")
+        save_archive(company, filename)
+        archive = CompanyArchive(filename)
+
+        frames = []
+        original = archive._read_frame
+        monkeypatch.setattr(
+            archive, "_read_frame", lambda entry: frames.append(entry) or original(entry)
+        )
+        dept = archive.read_department("D3")
+
+        assert dept.name == "Отдел 3"
+        assert len(dept) == 21
+        assert len(frames) == 1
+        assert archive.department_info("D3")["employees"] == 21
+        assert archive.read_project(10)["team"] == [1, 201]
+
+    def test_parallel_compression_is_deterministic(self, tmp_path, company):
+        """Test: Результат не зависит от числа потоков сжатия"""
+        save_archive(company, str(tmp_path / "one.arc"), workers=1)
+        save_archive(company, str(tmp_path / "many.arc"), workers=4)
+
+        assert (tmp_path / "one.arc").read_bytes() == (tmp_path / "many.arc").read_bytes()
+
+    def test_errors(self, tmp_path, company):
+        """Test: Неизвестные отдел, проект, кодек и формат файла"""
+        filename = str(tmp_path / "company.arc")
+        save_archive(company, filename)
+        archive = CompanyArchive(filename)
+
+        with pytest.raises(DepartmentNotFoundError):
+            archive.read_department("NOPE")
+        with pytest.raises(ProjectNotFoundError):
+            archive.read_project(99)
+        with pytest.raises(ValueError):
+            save_archive(company, filename, codec="zip")
+        (tmp_path / "bad.arc").write_bytes(b"not an archive")
+        with pytest.raises(ValueError):
+            CompanyArchive(str(tmp_path / "bad.arc"))
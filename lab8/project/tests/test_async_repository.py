@@ -0,0 +1,150 @@
+# tests/test_async_repository.py
+"""
+Тесты для асинхронного фасада репозитория
+
+Тестирует:
+- Выполнение запросов в пуле потоков без блокировки цикла событий
+- Объединение одновременных get в один запрос IN
+- Ограничение очереди и метрики
+"""
+
+import asyncio
+import threading
+import pytest
+from source_code.sourcecode import (
+    AsyncEmployeeRepository,
+    ConnectionPool,
+    DepartmentSpecification,
+    Developer,
+    Employee,
+    SqliteEmployeeRepository,
+)
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """Фикстура: репозиторий над пулом с 20 сотрудниками"""
+    pool = ConnectionPool(str(tmp_path / "async.db"), max_connections=4)
+    repository = SqliteEmployeeRepository(pool)
+    repository.add_many(
+        [Employee(0, f"E{i}", "IT" if i % 2 else "HR", 1000 + i) for i in range(20)]
+    )
+    yield repository
+    pool.close()
+
+
+def test_operations_run_in_worker_threads(repository):
+    """Test: Операции выполняются в потоках пула, а не в цикле событий"""
+    threads = []
+    original = repository.count
+
+    def count():
+        threads.append(threading.current_thread().name)
+        return original()
+
+    repository.count = count
+
+    async def scenario():
+        async with AsyncEmployeeRepository(repository, max_workers=2) as repo:
+            added = await repo.add_many(
+                [Developer(0, "Dev", "IT", 5000, ["Python"], "senior")]
+            )
+            found = await repo.find_by_specification(DepartmentSpecification("HR"))
+            return added, await repo.count(), found
+
+    added, total, found = asyncio.run(scenario())
+    assert added == 1
+    assert total == 21
+    assert len(found) == 10
+    assert threads[0].startswith("employee-db")
+
+
+def test_concurrent_gets_are_batched(repository):
+    """Test: Одновременные get объединяются в один запрос"""
+    calls = []
+    original = repository.get_many
+
+    def get_many(employee_ids):
+        calls.append(list(employee_ids))
+        return original(employee_ids)
+
+    repository.get_many = get_many
+
+    async def scenario():
+        async with AsyncEmployeeRepository(repository) as repo:
+            result = await asyncio.gather(*(repo.get(i) for i in (3, 5, 5, 99)))
+            return result, repo.metrics()
+
+    (first, second, third, missing), metrics = asyncio.run(scenario())
+    assert calls == [[3, 5, 99]]
+    assert first.name == "E2" and second.name == "E4"
+    assert second is third
+    assert missing is None
+    assert metrics["lookup_calls"] == 4
+    assert metrics["lookup_batches"] == 1
+
+
+def test_batch_window_collects_sequential_gets(repository):
+    """Test: В окне batch_window собираются get из разных итераций цикла"""
+    calls = []
+    original = repository.get_many
+    repository.get_many = lambda ids: calls.append(list(ids)) or original(ids)
+
+    async def scenario():
+        async with AsyncEmployeeRepository(repository, batch_window=0.05) as repo:
+            first = asyncio.ensure_future(repo.get(1))
+            await asyncio.sleep(0)
+            second = asyncio.ensure_future(repo.get(2))
+            return [emp.id for emp in await asyncio.gather(first, second)]
+
+    assert asyncio.run(scenario()) == [1, 2]
+    assert calls == [[1, 2]]
+
+
+def test_errors_reach_all_waiters(repository):
+    """Test: Ошибка пакетного запроса передается всем ожидающим"""
+    def broken(employee_ids):
+        raise RuntimeError("база недоступна")
+
+    repository.get_many = broken
+
+    async def scenario():
+        async with AsyncEmployeeRepository(repository) as repo:
+            return await asyncio.gather(
+                repo.get(1), repo.get(2), return_exceptions=True
+            )
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_queue_depth_metrics_and_limit(repository):
+    """Test: Метрики показывают очередь, max_pending ограничивает ее"""
+    release = threading.Event()
+    original = repository.count
+
+    def slow_count():
+        release.wait(5)
+        return original()
+
+    repository.count = slow_count
+
+    async def scenario():
+        repo = AsyncEmployeeRepository(repository, max_workers=1, max_pending=2)
+        async with repo:
+            tasks = [asyncio.ensure_future(repo.count()) for _ in range(4)]
+            await asyncio.sleep(0.05)
+            during = repo.metrics()
+            release.set()
+            results = await asyncio.gather(*tasks)
+            return during, repo.metrics(), results
+
+    during, after, results = asyncio.run(scenario())
+    assert results == [20] * 4
+    # Один запрос выполняется, один ждет в пуле, два - перед max_pending
+    assert during["running"] == 1
+    assert during["queued"] == 1
+    assert during["waiting"] == 2
+    assert after["peak_queued"] <= 2
+    assert after["calls"] == 4
+    assert after["queued"] == 0 and after["running"] == 0
@@ -0,0 +1,156 @@
+# tests/test_caching_repository.py
+"""
+Тесты для кэширующего репозитория
+
+Тестирует:
+- LRU-кэш с вытеснением и временем жизни записей
+- Кэширование отсутствующих ID
+- Инвалидацию при записи
+- Работу поверх разных репозиториев
+"""
+
+import sqlite3
+import pytest
+from source_code.sourcecode import (
+    CachingEmployeeRepository,
+    DepartmentSpecification,
+    Employee,
+    EmployeeRepository,
+    SqliteEmployeeRepository,
+    UnitOfWork,
+)
+
+
+class CountingRepository(EmployeeRepository):
+    """Репозиторий в памяти, считающий обращения get"""
+
+    def __init__(self):
+        super().__init__()
+        self.gets = 0
+
+    def get(self, employee_id):
+        self.gets += 1
+        return super().get(employee_id)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def backing():
+    """Фикстура: репозиторий с пятью сотрудниками"""
+    repository = CountingRepository()
+    for i in range(5):
+        repository.add(Employee(0, f"E{i}", "IT", 1000 + i))
+    return repository
+
+
+def test_hits_and_lru_eviction(backing):
+    """Test: Повторный get берется из кэша, старые записи вытесняются"""
+    cache = CachingEmployeeRepository(backing, max_size=2)
+    first = cache.get(1)
+    assert cache.get(1) is first
+    assert backing.gets == 1
+
+    cache.get(2)
+    cache.get(1)
+    cache.get(3)  # вытесняет 2 - дольше всех без обращений
+    cache.get(1)
+    assert backing.gets == 3
+    cache.get(2)
+    assert backing.gets == 4
+
+    info = cache.cache_info()
+    assert info["hits"] == 3 and info["misses"] == 4
+    assert info["evictions"] == 2
+    assert info["size"] == 2
+    assert info["hit_rate"] == pytest.approx(3 / 7)
+
+
+def test_ttl_and_negative_cache(backing):
+    """Test: Записи истекают по ttl, отсутствующие ID тоже кэшируются"""
+    clock = FakeClock()
+    cache = CachingEmployeeRepository(backing, ttl=10, clock=clock)
+    assert cache.get(99) is None
+    assert cache.get(99) is None
+    assert backing.gets == 1
+    assert cache.cache_info()["negative_hits"] == 1
+
+    cache.get(1)
+    clock.now = 10
+    cache.get(1)
+    assert backing.gets == 3
+    assert cache.cache_info()["expirations"] == 1
+
+    plain = CachingEmployeeRepository(backing, negative_cache=False)
+    plain.get(99)
+    plain.get(99)
+    assert backing.gets == 5
+
+
+def test_writes_invalidate(backing):
+    """Test: add, update и delete удаляют затронутые ID из кэша"""
+    cache = CachingEmployeeRepository(backing)
+    assert cache.get(6) is None
+    cache.add(Employee(6, "New", "HR", 500))
+    assert cache.get(6).name == "New"
+
+    replacement = Employee(1, "Renamed", "IT", 1000)
+    cache.get(1)
+    assert cache.update(replacement)
+    assert cache.get(1) is replacement
+
+    cache.get(2)
+    assert cache.delete(2)
+    assert cache.get(2) is None
+
+    found = cache.find_by_specification(DepartmentSpecification("HR"))
+    assert [emp.name for emp in found] == ["New"]
+
+
+def test_sqlite_backend_and_get_many(tmp_path):
+    """Test: Над SQLite промахи get_many читаются одним запросом"""
+    connection = sqlite3.connect(str(tmp_path / "cache.db"))
+    repository = SqliteEmployeeRepository(connection)
+    repository.add_many([Employee(0, f"E{i}", "IT", 1000) for i in range(10)])
+    cache = CachingEmployeeRepository(repository)
+
+    cache.get(1)
+    statements = []
+    connection.set_trace_callback(statements.append)
+    found = cache.get_many([1, 2, 3, 42])
+    assert cache.get(2) is found[2]
+    assert cache.get(42) is None
+    connection.set_trace_callback(None)
+
+    assert sorted(found) == [1, 2, 3]
+    assert len([sql for sql in statements if sql.startswith("SELECT id, name")]) == 1
+    assert cache.count() == 10
+    connection.close()
+
+
+def test_unit_of_work_through_cache(tmp_path):
+    """Test: Изменения UnitOfWork через кэш сбрасывают кэш"""
+    connection = sqlite3.connect(str(tmp_path / "uow.db"))
+    repository = SqliteEmployeeRepository(connection)
+    repository.add_many([Employee(0, "Anna", "HR", 3000)])
+    cache = CachingEmployeeRepository(repository)
+
+    stale = cache.get(1)
+    uow = UnitOfWork(cache)
+    anna = uow.get(1)
+    assert anna is stale
+    anna.base_salary = 3500
+    uow.register_dirty(anna)
+    uow.register_new(Employee(0, "Boris", "IT", 4000))
+    uow.commit()
+
+    assert cache.cache_info()["size"] == 0
+    assert cache.get(1).base_salary == 3500
+    assert cache.get(2).name == "Boris"
+    connection.close()
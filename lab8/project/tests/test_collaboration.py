@@ -0,0 +1,92 @@
+# tests/test_collaboration.py
+"""
+Тесты для графа совместной работы
+
+Тестирует:
+- Веса ребер по числу общих проектов
+- Инкрементальное обновление по событиям команд
+- Компоненты связности, центральность и окрестности
+- Ключевых связующих сотрудников
+"""
+
+import pytest
+from source_code.part4 import Project, Developer
+from source_code.collaboration import CollaborationGraph
+
+
+@pytest.fixture
+def company(sample_company):
+    """Фикстура: общая компания с шестью сотрудниками и тремя проектами
+
+    Команды: 10 = {1, 2, 3}, 11 = {1, 2}, 12 = {3, 4}; сотрудники 5 и 6
+    не участвуют в проектах.
+    """
+    dev = sample_company.find_department_by_code("DEV")
+    for emp_id in (5, 6):
+        dev.add_employee(Developer(emp_id, f"Dev{emp_id}", "DEV", 5000, [], "middle"))
+    sample_company.add_project(Project(12, "P12", "Описание", "2030-12-31"))
+    teams = {10: [2, 3], 11: [1, 2], 12: [3, 4]}
+    for project_id, members in teams.items():
+        project = sample_company.find_project_by_id(project_id)
+        for emp_id in members:
+            project.add_team_member(sample_company.find_employee_by_id(emp_id))
+    return sample_company
+
+
+class TestCollaborationGraph:
+    """Тесты графа совместной работы"""
+
+    def test_edge_weights_count_shared_projects(self, company):
+        """Test: Вес ребра равен числу общих проектов"""
+        graph = CollaborationGraph(company)
+
+        assert graph.weight(1, 2) == 2
+        assert graph.weight(1, 3) == 1
+        assert graph.weight(1, 4) == 0
+        assert graph.node_count == 6
+        assert graph.edge_count == 4
+        assert sorted(graph.isolated()) == [5, 6]
+
+    def test_graph_follows_team_changes(self, company):
+        """Test: Граф обновляется по событиям команд"""
+        graph = CollaborationGraph(company)
+
+        company.find_project_by_id(11).remove_team_member(2)
+        company.find_project_by_id(12).add_team_member(company.find_employee_by_id(5))
+        company.find_project_by_id(12).remove_team_member(4)
+
+        assert graph.weight(1, 2) == 1
+        assert graph.weight(3, 5) == 1
+        assert graph.neighbors(4) == {}
+
+        fresh = CollaborationGraph(company)
+        for emp_id in range(1, 7):
+            assert graph.neighbors(emp_id) == fresh.neighbors(emp_id)
+
+    def test_components_and_centrality(self, company):
+        """Test: Компоненты связности и центральность по степени"""
+        graph = CollaborationGraph(company)
+
+        components = graph.connected_components()
+        assert components[0] == {1, 2, 3, 4}
+        assert sorted(map(sorted, components[1:])) == [[5], [6]]
+        assert graph.degree_centrality()[3] == pytest.approx(3 / 5)
+        assert graph.top_connected(1) == [3]
+
+    def test_k_hop_neighborhood(self, company):
+        """Test: Окрестность из k шагов"""
+        graph = CollaborationGraph(company)
+
+        assert graph.neighborhood(4, 1) == {3: 1}
+        assert graph.neighborhood(4, 2) == {3: 1, 1: 2, 2: 2}
+        with pytest.raises(KeyError):
+            graph.neighborhood(99)
+
+    def test_connectors_and_removal_impact(self, company):
+        """Test: Связующие сотрудники и последствия их ухода"""
+        graph = CollaborationGraph(company)
+
+        assert graph.articulation_points() == {3}
+        parts = graph.removal_impact(3)
+        assert sorted(map(sorted, parts)) == [[1, 2], [4]]
+        assert graph.removal_impact(1) == [{2, 3, 4}]
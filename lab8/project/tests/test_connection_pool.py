@@ -0,0 +1,153 @@
+# tests/test_connection_pool.py
+"""
+Тесты для пула подключений SQLite
+
+Тестирует:
+- Режим WAL и настройки подключений
+- Подключения по потокам и ожидание свободного подключения
+- Метрики пула
+- Репозиторий поверх пула при параллельном чтении
+- Совместимость DatabaseConnection
+"""
+
+import os
+import threading
+import pytest
+from source_code.sourcecode import (
+    ConnectionPool,
+    DatabaseConnection,
+    Developer,
+    Employee,
+    SqliteEmployeeRepository,
+)
+
+
+@pytest.fixture
+def pool(tmp_path):
+    """Фикстура: пул над файлом базы во временном каталоге"""
+    pool = ConnectionPool(str(tmp_path / "company.db"), max_connections=4, timeout=0.2)
+    yield pool
+    pool.close()
+
+
+def test_connections_use_wal_and_settings(pool):
+    """Test: Подключения открываются в WAL с заданным кэшем"""
+    with pool.connection() as connection:
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert connection.execute("PRAGMA cache_size").fetchone()[0] == -16384
+        tables = {row[0] for row in connection.execute("SELECT name FROM sqlite_master")}
+    assert "employees" in tables
+
+
+def test_connection_per_thread(pool):
+    """Test: Поток получает свое подключение, повторный acquire - то же"""
+    with pool.connection() as first:
+        with pool.connection() as nested:
+            assert nested is first
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(pool.thread_connection()))
+        thread.start()
+        thread.join()
+    assert other[0] is not first
+    assert pool.metrics()["created"] == 2
+
+
+def test_acquire_timeout_when_exhausted(tmp_path):
+    """Test: При исчерпании пула acquire ждет и завершается по таймауту"""
+    pool = ConnectionPool(str(tmp_path / "small.db"), max_connections=1, timeout=0.05)
+    errors = []
+
+    def worker():
+        try:
+            pool.acquire()
+        except TimeoutError as error:
+            errors.append(error)
+
+    with pool.connection():
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+    metrics = pool.metrics()
+    pool.close()
+    assert len(errors) == 1
+    assert metrics["waits"] == 1 and metrics["timeouts"] == 1
+    assert metrics["in_use"] == 0 and metrics["idle"] == 1
+
+
+def test_repository_over_pool_with_readers(pool):
+    """Test: Репозиторий пишет через пул, потоки читают параллельно"""
+    repository = SqliteEmployeeRepository(pool)
+    repository.add_many(
+        [Employee(0, f"E{i}", "IT", 1000 + i) for i in range(50)]
+        + [Developer(0, "Dev", "IT", 5000, ["Python"], "senior")]
+    )
+    counts = []
+
+    def reader():
+        counts.append(repository.count())
+        counts.append(len(repository.get_all()))
+
+    threads = [threading.Thread(target=reader) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counts == [51] * 8
+    assert repository.get(51).skills == ["Python"]
+    metrics = pool.metrics()
+    assert metrics["in_use"] == 0
+    assert 1 <= metrics["peak_in_use"] <= 4
+
+
+def test_database_connection_compatibility(tmp_path):
+    """Test: DatabaseConnection остается Singleton поверх пула"""
+    options = DatabaseConnection._options
+    DatabaseConnection.configure(database=str(tmp_path / "singleton.db"))
+    try:
+        db = DatabaseConnection()
+        assert db is DatabaseConnection()
+        connection = db.get_connection()
+        assert connection is db.get_connection()
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert isinstance(db.pool, ConnectionPool)
+    finally:
+        DatabaseConnection().close_connection()
+        DatabaseConnection._options = options
+    assert (tmp_path / "singleton.db").exists()
+
+
+def test_finished_threads_return_connections(tmp_path):
+    """Test: Подключения завершившихся потоков возвращаются в пул"""
+    options = DatabaseConnection._options
+    database = str(tmp_path / "threads.db")
+    DatabaseConnection.configure(database=database)
+    db = DatabaseConnection()
+    db.pool.timeout = 0.2
+    try:
+        for _ in range(db.pool.max_connections * 2):
+            thread = threading.Thread(target=db.get_connection)
+            thread.start()
+            thread.join()
+        assert db.pool.metrics()["in_use"] == 0
+        assert db.pool.metrics()["created"] == 1
+    finally:
+        db.close_connection()
+        DatabaseConnection._options = options
+    # Файл базы остается после закрытия пула
+    assert os.path.exists(database)
+
+
+def test_database_path_required():
+    """Test: Без пути к базе пул не создается"""
+    options = DatabaseConnection._options
+    DatabaseConnection._options = {}
+    try:
+        DatabaseConnection().close_connection()
+        with pytest.raises(RuntimeError):
+            DatabaseConnection().get_connection()
+        with pytest.raises(TypeError):
+            ConnectionPool()
+    finally:
+        DatabaseConnection._options = options
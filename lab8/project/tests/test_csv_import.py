@@ -0,0 +1,147 @@
+# tests/test_csv_import.py
+"""
+Тесты для импорта сотрудников и проектов из CSV
+
+Тестирует:
+- Повторный импорт файла export_employees_csv
+- Необязательные колонки параметров сотрудников
+- Сбор ошибок строк без исключений
+- Импорт проектов с командами
+"""
+
+import csv
+import pytest
+from source_code.part4 import (
+    Company,
+    Department,
+    Employee,
+    Manager,
+    Developer,
+    Salesperson,
+)
+
+
+def write_csv(path, header, rows):
+    """Вспомогательная функция: записать CSV файл"""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+    return str(path)
+
+
+EMPLOYEE_HEADER = [
+    "ID", "Имя", "Отдел", "Должность", "Базовая зарплата",
+    "Бонус", "Уровень", "Стек технологий", "Ставка комиссии", "Объем продаж",
+]
+
+
+class TestEmployeeImport:
+    """Тесты импорта сотрудников"""
+
+    def test_reimport_of_exported_file(self, tmp_path):
+        """Test: Экспортированный файл импортируется с теми же зарплатами"""
+        company = Company("TechCorp")
+        dev = Department("DEV", "DEV")
+        company.add_department(dev)
+        dev.add_employee(Employee(1, "Eve", "DEV", 3000))
+        dev.add_employee(Manager(2, "Bob", "DEV", 6000, 1500))
+        dev.add_employee(Developer(3, "Alice", "DEV", 5000, ["Python"], "senior"))
+        filename = str(tmp_path / "employees.csv")
+        company.export_employees_csv(filename)
+
+        imported = Company("Copy")
+        result = imported.import_employees_csv(filename)
+
+        assert result == {"imported": 3, "errors": []}
+        assert imported.calculate_total_monthly_cost() == company.calculate_total_monthly_cost()
+        assert imported.find_employee_by_id(3).seniority_level == "senior"
+
+    def test_type_specific_columns(self, tmp_path):
+        """Test: Параметры типов берутся из дополнительных колонок"""
+        filename = write_csv(tmp_path / "employees.csv", EMPLOYEE_HEADER, [
+            [1, "Alice", "DEV", "Developer", 5000, "", "middle", "Python; SQL", "", ""],
+            [2, "Carol", "SALES", "salesperson", 4000, "", "", "", 0.1, 20000],
+        ])
+        company = Company("TechCorp")
+        company.add_department(Department("Разработка", "DEV"))
+
+        result = company.import_employees_csv(filename)
+
+        assert result["imported"] == 2
+        alice = company.find_employee_by_id(1)
+        assert isinstance(alice, Developer)
+        assert alice.tech_stack == ["Python", "SQL"]
+        carol = company.find_employee_by_id(2)
+        assert isinstance(carol, Salesperson)
+        assert carol.calculate_salary() == 6000
+        assert company.find_department_by_code("SALES") is not None
+
+    def test_row_errors_are_collected(self, tmp_path):
+        """Test: Ошибочные строки пропускаются и попадают в отчет"""
+        filename = write_csv(tmp_path / "employees.csv", EMPLOYEE_HEADER, [
+            [1, "Alice", "DEV", "Employee", 5000, "", "", "", "", ""],
+            [1, "Dup", "DEV", "Employee", 5000, "", "", "", "", ""],
+            ["x", "Bad id", "DEV", "Employee", 5000, "", "", "", "", ""],
+            [3, "Bad type", "DEV", "Intern", 5000, "", "", "", "", ""],
+            [4, "No level", "DEV", "Developer", 5000, "", "", "", "", ""],
+            [5, "Bad rate", "DEV", "Salesperson", 5000, "", "", "", 2, 100],
+            [6, "Other dept", "HR", "Employee", 5000, "", "", "", "", ""],
+            [7, "Bad bonus", "DEV", "Manager", 5000, -100, "", "", "", ""],
+        ])
+        company = Company("TechCorp")
+        company.add_department(Department("Разработка", "DEV"))
+
+        result = company.import_employees_csv(filename, create_departments=False)
+
+        assert result["imported"] == 1
+        assert [line for line, _ in result["errors"]] == [3, 4, 5, 6, 7, 8, 9]
+        assert "уже существует" in result["errors"][0][1]
+        assert "Бонус" in result["errors"][-1][1]
+
+        # Бонус из итоговой зарплаты тоже не может быть отрицательным
+        filename = write_csv(
+            tmp_path / "totals.csv",
+            ["ID", "Имя", "Отдел", "Должность", "Базовая зарплата", "Итоговая зарплата"],
+            [[8, "Low total", "DEV", "Manager", 5000, 4000]],
+        )
+        result = company.import_employees_csv(filename)
+        assert result["imported"] == 0
+        assert [line for line, _ in result["errors"]] == [2]
+
+    def test_missing_required_column_raises(self, tmp_path):
+        """Test: Файл без обязательных колонок отклоняется целиком"""
+        filename = write_csv(tmp_path / "employees.csv", ["ID", "Имя"], [[1, "Alice"]])
+
+        with pytest.raises(ValueError):
+            Company("TechCorp").import_employees_csv(filename)
+
+
+class TestProjectImport:
+    """Тесты импорта проектов"""
+
+    def test_import_projects_with_team(self, tmp_path):
+        """Test: Проекты импортируются с командой и ошибками участников"""
+        company = Company("TechCorp")
+        dev = Department("DEV", "DEV")
+        company.add_department(dev)
+        dev.add_employee(Employee(1, "Eve", "DEV", 3000))
+        dev.add_employee(Employee(2, "Bob", "DEV", 4000))
+        filename = write_csv(
+            tmp_path / "projects.csv",
+            ["ID", "Название", "Статус", "Дедлайн", "Описание", "Команда"],
+            [
+                [10, "AI", "active", "2030-12-31", "Описание", "1;2;99"],
+                [11, "Web", "", "2031-01-15", "", ""],
+                [12, "Bad", "unknown", "2031-01-15", "", ""],
+                [13, "Bad date", "active", "31.12.2030", "", ""],
+            ],
+        )
+
+        result = company.import_projects_csv(filename)
+
+        assert result["imported"] == 2
+        assert [line for line, _ in result["errors"]] == [2, 4, 5]
+        project = company.find_project_by_id(10)
+        assert [emp.id for emp in project.get_team()] == [1, 2]
+        assert company.find_project_by_id(11).status == "planning"
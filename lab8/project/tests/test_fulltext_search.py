@@ -0,0 +1,137 @@
+# tests/test_fulltext_search.py
+"""
+Тесты для полнотекстового поиска по сотрудникам и проектам
+
+Тестирует:
+- Ранжированный поиск, поиск по префиксу и фрагменты с подсветкой
+- Обновление индекса триггерами при добавлении, изменении и удалении
+- Пересборку индекса из таблиц и из компании в памяти
+"""
+
+import sqlite3
+import pytest
+from source_code.sourcecode import (
+    Company,
+    CompanySearchIndex,
+    Department,
+    Developer,
+    Employee,
+    Project,
+    SqliteEmployeeRepository,
+    SqliteProjectRepository,
+)
+
+
+@pytest.fixture
+def connection():
+    """Фикстура: база с индексом, сотрудниками и проектами"""
+    connection = sqlite3.connect(":memory:")
+    CompanySearchIndex(connection)
+    SqliteEmployeeRepository(connection).add_many(
+        [
+            Developer(0, "Alex Python", "DEV", 4000, ["Go"], "middle"),
+            Developer(0, "Bella", "DEV", 4000, ["Python", "Django"], "senior"),
+            Developer(0, "Carl", "DEV", 3000, ["PostgreSQL"], "junior"),
+            Employee(0, "Dina Pythonova", "HR", 3000),
+        ]
+    )
+    projects = SqliteProjectRepository(connection)
+    projects.add(Project(1, "Payroll", "active", "Расчет зарплат на Python"))
+    projects.add(Project(2, "Портал", "planning", "Портал для сотрудников"))
+    yield connection
+    connection.close()
+
+
+def _ids(results):
+    return [result["id"] for result in results]
+
+
+def test_ranked_search_with_snippets(connection):
+    """Test: Совпадение в имени и навыках находится, результаты ранжированы"""
+    index = CompanySearchIndex(connection)
+    found = index.search_employees("python")
+    assert sorted(_ids(found)) == [1, 2]
+    assert [r["rank"] for r in found] == sorted(r["rank"] for r in found)
+    bella = next(r for r in found if r["id"] == 2)
+    assert bella["skills"] == "Python Django"
+    assert "[Python]" in bella["snippet"]
+
+    projects = index.search_projects("зарплат*")
+    assert _ids(projects) == [1]
+    assert "[зарплат]" in projects[0]["snippet"]
+
+
+def test_prefix_queries_and_syntax_safety(connection):
+    """Test: Префиксный поиск и экранирование синтаксиса FTS5"""
+    index = CompanySearchIndex(connection)
+    assert _ids(index.search_employees("pyth")) == []
+    assert sorted(_ids(index.search_employees("pyth", prefix=True))) == [1, 2, 4]
+    assert _ids(index.search_employees("post*")) == [3]
+    assert _ids(index.search_employees("bella python")) == [2]
+    # Операторы и кавычки в запросе - обычный текст
+    assert index.search_employees('NOT "') == []
+    assert index.search_employees("") == []
+    assert _ids(index.search("портал")["projects"]) == [2]
+
+
+def test_triggers_update_index(connection):
+    """Test: Изменения через репозитории сразу видны в поиске"""
+    index = CompanySearchIndex(connection)
+    employees = SqliteEmployeeRepository(connection)
+    employees.add(Developer(0, "Eva", "DEV", 5000, ["Rust"], "senior"))
+    assert _ids(index.search_employees("rust")) == [5]
+
+    employees.update(
+        Developer(3, "Karl", "DEV", 3000, ["PostgreSQL", "Kotlin"], "junior")
+    )
+    assert _ids(index.search_employees("karl kotlin")) == [3]
+    assert index.search_employees("carl") == []
+
+    employees.delete(2)
+    assert _ids(index.search_employees("django")) == []
+
+    projects = SqliteProjectRepository(connection)
+    projects.add(Project(2, "Портал", "active", "Внутренний сайт"))
+    assert index.search_projects("сотрудников") == []
+    projects.delete(1)
+    assert index.search_projects("payroll") == []
+
+
+def test_rebuild_from_tables(tmp_path):
+    """Test: Индекс над существующей базой собирается из таблиц"""
+    path = str(tmp_path / "search.db")
+    connection = sqlite3.connect(path)
+    SqliteEmployeeRepository(connection).add_many(
+        [
+            Developer(0, f"Dev{i}", "DEV", 4000, ["SQL", f"S{i}"], "junior")
+            for i in range(50)
+        ]
+    )
+    index = CompanySearchIndex(connection)
+    assert index.search_employees("sql") == []
+    assert index.rebuild() == {"employees": 50, "projects": 0}
+    assert len(index.search_employees("sql", limit=100)) == 50
+    assert _ids(index.search_employees("s7")) == [8]
+    connection.close()
+
+
+def test_rebuild_from_company_and_manual_updates():
+    """Test: Пересборка из компании в памяти и ручное обновление записей"""
+    company = Company("Test")
+    company.add_department(Department("Разработка", "DEV"))
+    company.hire_employee(Developer(0, "Anna", "DEV", 4000, ["Python"], "senior"))
+    company.hire_employee(Employee(0, "Boris", "DEV", 3000))
+    company.add_project(Project(7, "CRM", "active", "Учет клиентов"))
+
+    index = CompanySearchIndex(sqlite3.connect(":memory:"))
+    assert index.rebuild(company) == {"employees": 2, "projects": 1}
+    assert _ids(index.search_employees("python")) == [1]
+    assert _ids(index.search_projects("клиентов")) == [7]
+
+    index.index_employee(Employee(2, "Boris Pythonov", "DEV", 3000))
+    assert _ids(index.search_employees("pythonov")) == [2]
+    assert index.remove_employee(1)
+    assert not index.remove_employee(1)
+    index.index_project(Project(7, "CRM", "active", "Продажи"))
+    assert index.search_projects("клиентов") == []
+    assert index.remove_project(7)
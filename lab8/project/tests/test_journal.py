@@ -0,0 +1,108 @@
+# tests/test_journal.py
+"""
+Тесты для журнала изменений компании
+
+Тестирует:
+- Восстановление компании из контрольной точки и журнала
+- Групповой сброс записей на диск
+- Контрольные точки и очистку журнала
+- Обработку оборванной последней записи
+"""
+
+import os
+import pytest
+from source_code.part4 import Department, Project, Developer
+from source_code.journal import CompanyJournal
+
+
+def mutate(company):
+    """Вспомогательная функция: изменения всех журналируемых видов"""
+    dev = company.find_department_by_code("DEV")
+    sales = company.find_department_by_code("SALES")
+    dev.add_employee(Developer(5, "Dan", "DEV", 3000, [], "junior"))
+    project = company.find_project_by_id(10)
+    project.add_team_member(company.find_employee_by_id(5))
+    project.change_status("completed")
+    company.find_employee_by_id(1).seniority_level = "senior"
+    company.find_employee_by_id(3).update_sales(5000)
+    dev.transfer_employee(5, sales)
+    dev.remove_employee(2)
+    company.add_department(Department("Кадры", "HR"))
+    company.add_project(Project(12, "Web", "Описание", "2031-01-15"))
+    company.remove_project(12)
+
+
+class TestCompanyJournal:
+    """Тесты журнала"""
+
+    def test_recover_replays_all_changes(self, tmp_path, sample_company):
+        """Test: Контрольная точка и журнал восстанавливают состояние"""
+        company = sample_company
+        journal = CompanyJournal(str(tmp_path), checkpoint_every=1000)
+        journal.attach(company)
+        mutate(company)
+        journal.close()
+
+        recovered_journal = CompanyJournal(str(tmp_path))
+        recovered = recovered_journal.recover()
+
+        assert recovered.to_dict() == company.to_dict()
+        dan = recovered.find_employee_by_id(5)
+        assert dan.department == "Продажи"
+        assert dan.get_project_count() == 1
+        assert recovered_journal.seq == journal.seq
+        recovered_journal.close()
+
+    def test_group_commit(self, tmp_path, sample_company):
+        """Test: Записи сбрасываются на диск группами"""
+        company = sample_company
+        journal = CompanyJournal(str(tmp_path), group_size=4, sync_interval=3600)
+        journal.attach(company)
+        syncs = journal.syncs
+        dev = company.find_department_by_code("DEV")
+        for emp_id in range(100, 110):
+            dev.add_employee(Developer(emp_id, "Dev", "DEV", 1000, [], "junior"))
+
+        assert journal.syncs - syncs == 2
+        journal.commit()
+        assert journal.syncs - syncs == 3
+        journal.close()
+
+    def test_checkpoint_truncates_journal(self, tmp_path, sample_company):
+        """Test: Контрольная точка заменяет старую и очищает журнал"""
+        company = sample_company
+        journal = CompanyJournal(str(tmp_path), checkpoint_every=5)
+        journal.attach(company)
+        mutate(company)
+        journal.commit()
+
+        checkpoints = sorted(name for name in os.listdir(tmp_path) if name.startswith("checkpoint_"))
+        assert checkpoints == [f"checkpoint_{journal.seq}.json"]
+        assert os.path.getsize(tmp_path / CompanyJournal.JOURNAL_FILE) == 0
+        journal.close()
+
+        assert CompanyJournal(str(tmp_path)).recover().to_dict() == company.to_dict()
+
+    def test_torn_tail_is_ignored(self, tmp_path, sample_company):
+        """Test: Оборванная последняя запись отбрасывается"""
+        company = sample_company
+        journal = CompanyJournal(str(tmp_path))
+        journal.attach(company)
+        company.find_employee_by_id(2).bonus = 1500
+        journal.close()
+        with open(tmp_path / CompanyJournal.JOURNAL_FILE, "ab") as f:
+            f.write(b'{"op":"status","project_id":10,"sta')
+
+        recovered = CompanyJournal(str(tmp_path)).recover()
+
+        assert recovered.find_employee_by_id(2).bonus == 1500
+        assert recovered.find_project_by_id(10).status == "active"
+        assert (tmp_path / CompanyJournal.JOURNAL_FILE).read_bytes().endswith(b"\n")
+
+    def test_attach_to_existing_journal_raises(self, tmp_path, sample_company):
+        """Test: Нельзя начать второй журнал в том же каталоге"""
+        CompanyJournal(str(tmp_path)).attach(sample_company)
+
+        with pytest.raises(ValueError):
+            CompanyJournal(str(tmp_path)).attach(sample_company)
+        assert CompanyJournal(str(tmp_path / "empty")).recover() is None
@@ -0,0 +1,76 @@
+# tests/test_json_stream.py
+"""
+Тесты для потоковой загрузки компании из JSON
+
+Тестирует:
+- Разбор значений на границах блоков
+- Совпадение результата с Company.load_from_json
+- Восстановление команд проектов вторым проходом
+- Ошибки формата
+"""
+
+import io
+import json
+import pytest
+from source_code.part4 import Company
+from source_code.json_stream import JsonStreamReader, load_company_json
+
+
+class TestJsonStreamReader:
+    """Тесты потокового разбора"""
+
+    def test_values_split_across_chunks(self):
+        """Test: Числа и строки на границе блока читаются целиком"""
+        text = '{"a": 1234567, "b": [1.5, "длинная строка", null], "c": {}}'
+        reader = JsonStreamReader(io.StringIO(text), chunk_size=3)
+        result = {}
+        for key in reader.iter_object():
+            if key == "b":
+                result[key] = [reader.read_value() for _ in reader.iter_array()]
+            else:
+                result[key] = reader.read_value()
+
+        assert result == json.loads(text)
+
+    def test_malformed_input_raises(self):
+        """Test: Нарушенная структура вызывает ошибку"""
+        reader = JsonStreamReader(io.StringIO('{"a" 1}'), chunk_size=2)
+        with pytest.raises(ValueError):
+            list(reader.iter_object())
+
+
+class TestStreamingCompanyLoader:
+    """Тесты загрузки компании"""
+
+    @pytest.mark.parametrize("chunk_size", [5, 64, 1 << 16])
+    def test_matches_load_from_json(self, tmp_path, chunk_size, sample_company):
+        """Test: Результат совпадает с обычной загрузкой"""
+        filename = str(tmp_path / "company.json")
+        sample_company.find_project_by_id(10).add_team_member(
+            sample_company.find_employee_by_id(3)
+        )
+        sample_company.save_to_json(filename)
+
+        streamed = load_company_json(filename, chunk_size)
+        loaded = Company.load_from_json(filename)
+
+        assert streamed.to_dict() == loaded.to_dict()
+        team = streamed.find_project_by_id(10).get_team()
+        assert [emp.id for emp in team] == [1, 3]
+        assert streamed.find_employee_by_id(1).get_project_count() == 1
+
+    def test_key_order_does_not_matter(self, tmp_path, sample_company):
+        """Test: Проекты и название могут идти раньше отделов"""
+        data = sample_company.to_dict()
+        for dept in data["departments"]:
+            dept["employees"], dept["name"] = dept.pop("employees"), dept.pop("name")
+        reordered = {
+            "projects": data["projects"],
+            "departments": data["departments"],
+            "name": data["name"],
+        }
+        filename = tmp_path / "company.json"
+        filename.write_text(json.dumps(reordered, ensure_ascii=False), encoding="utf-8")
+
+        streamed = load_company_json(str(filename), chunk_size=7)
+        assert streamed.to_dict() == sample_company.to_dict()
@@ -0,0 +1,99 @@
+# tests/test_lazy_company.py
+"""
+Тесты для ленивого представления компании
+
+Тестирует:
+- Агрегаты, посчитанные по колонкам снимка
+- Создание объектов сотрудников по требованию
+- Ограниченный LRU-кэш созданных объектов
+"""
+
+import pytest
+from source_code.part4 import (
+    Company,
+    Department,
+    Project,
+    Employee,
+    Manager,
+    Developer,
+    Salesperson,
+)
+from source_code.snapshot import save_snapshot
+from source_code.lazy_company import LazyCompany
+
+
+@pytest.fixture
+def company():
+    """Компания с сотрудниками всех типов и проектами"""
+    company = Company("TechCorp")
+    dev = Department("Разработка", "DEV")
+    sales = Department("Продажи", "SALES")
+    company.add_department(dev)
+    company.add_department(sales)
+    dev.add_employee(Developer(1, "Алиса", "DEV", 5000, ["Python"], "senior"))
+    dev.add_employee(Manager(2, "Bob", "DEV", 6000, 1000))
+    dev.add_employee(Employee(3, "Eve", "DEV", 3000))
+    sales.add_employee(Salesperson(4, "Carol", "SALES", 4000, 0.1, 20000))
+    active = Project(10, "AI", "Описание", "2020-01-31", "active")
+    company.add_project(active)
+    active.add_team_member(dev.find_employee_by_id(1))
+    active.add_team_member(sales.find_employee_by_id(4))
+    company.add_project(Project(11, "Empty", "Без команды", "2031-01-15"))
+    return company
+
+
+@pytest.fixture
+def snapshot_file(tmp_path, company):
+    filename = str(tmp_path / "company.snap")
+    save_snapshot(company, filename)
+    return filename
+
+
+class TestLazyCompany:
+    """Тесты ленивой компании"""
+
+    def test_aggregates_match_company(self, company, snapshot_file):
+        """Test: Агрегаты по колонкам совпадают с полной моделью"""
+        with LazyCompany(snapshot_file) as lazy:
+            assert lazy.name == "TechCorp"
+            assert len(lazy) == 4
+            assert lazy.calculate_total_monthly_cost() == company.calculate_total_monthly_cost()
+            assert lazy.get_department_stats() == company.get_department_stats()
+            assert (
+                lazy.get_project_budget_analysis("2024-06-01")
+                == company.get_project_budget_analysis("2024-06-01")
+            )
+            # Агрегаты не создают объектов сотрудников
+            assert lazy.cache_info()["size"] == 0
+
+    def test_find_materializes_single_employee(self, snapshot_file):
+        """Test: Поиск по ID создает только найденного сотрудника"""
+        with LazyCompany(snapshot_file) as lazy:
+            carol = lazy.find_employee_by_id(4)
+
+            assert isinstance(carol, Salesperson)
+            assert carol.calculate_salary() == 6000
+            assert lazy.find_employee_by_id(4) is carol
+            assert lazy.find_employee_by_id(99) is None
+            assert lazy.cache_info() == {"hits": 1, "misses": 1, "size": 1, "max_size": 1024}
+
+    def test_iteration_and_indexing(self, company, snapshot_file):
+        """Test: Итерация и индексация по сотрудникам"""
+        with LazyCompany(snapshot_file) as lazy:
+            assert [emp.id for emp in lazy] == [emp.id for emp in company.get_all_employees()]
+            assert lazy[-1].name == "Carol"
+            with pytest.raises(IndexError):
+                lazy[4]
+
+    def test_cache_is_bounded(self, snapshot_file):
+        """Test: Кэш вытесняет давно использованные объекты"""
+        with LazyCompany(snapshot_file, cache_size=2) as lazy:
+            first = lazy[0]
+            lazy[1]
+            lazy[0]
+            lazy[2]
+
+            assert lazy.cache_info()["size"] == 2
+            assert lazy[0] is first
+            assert lazy.find_employee_by_id(2) is not None
+            assert lazy.cache_info()["misses"] == 4
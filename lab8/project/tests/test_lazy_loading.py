@@ -0,0 +1,144 @@
+# tests/test_lazy_loading.py
+"""
+Тесты для ленивой загрузки сотрудников из SQLite
+
+Тестирует:
+- Прокси сотрудников и пакетную загрузку через IN (...)
+- Проекты с ленивыми командами
+- Постраничную итерацию по отделу
+"""
+
+import sqlite3
+import pytest
+from source_code.sourcecode import (
+    Employee,
+    Developer,
+    Project,
+    EmployeeProxy,
+    EmployeeBatchLoader,
+    LazyDepartment,
+    SqliteEmployeeRepository,
+    SqliteProjectRepository,
+)
+
+
+@pytest.fixture
+def connection():
+    """Фикстура: база с 30 сотрудниками отделов DEV и QA"""
+    connection = sqlite3.connect(":memory:")
+    repository = SqliteEmployeeRepository(connection)
+    repository.add_many(
+        [
+            Developer(0, f"Dev{i}", "DEV", 4000 + i, ["Python"], "middle")
+            for i in range(20)
+        ]
+        + [Employee(0, f"QA{i}", "QA", 3000) for i in range(10)]
+    )
+    yield connection
+    connection.close()
+
+
+def _selects(connection, action):
+    statements = []
+    connection.set_trace_callback(statements.append)
+    try:
+        result = action()
+    finally:
+        connection.set_trace_callback(None)
+    return result, [sql for sql in statements if sql.startswith("SELECT")]
+
+
+def test_proxy_loads_pending_in_one_batch(connection):
+    """Test: Первое обращение загружает все ожидающие ссылки одним IN"""
+    loader = EmployeeBatchLoader(SqliteEmployeeRepository(connection))
+    proxies = [loader.proxy(employee_id) for employee_id in (3, 7, 25)]
+    assert loader.proxy(7) is proxies[1]
+    assert [proxy.id for proxy in proxies] == [3, 7, 25]
+    assert not any(proxy.loaded for proxy in proxies)
+
+    name, selects = _selects(connection, lambda: proxies[0].name)
+    assert name == "Dev2"
+    assert all(proxy.loaded for proxy in proxies)
+    assert loader.queries == 1
+    assert len(selects) == 2
+    assert all("IN (3, 7, 25)" in sql for sql in selects)
+
+    _, selects = _selects(connection, lambda: [p.calculate_salary() for p in proxies])
+    assert selects == []
+    assert proxies[1].resolve() is proxies[1].resolve()
+
+
+def test_proxy_delegates_and_reports_missing(connection):
+    """Test: Прокси передает запись атрибутов, отсутствующий ID - ошибка"""
+    loader = EmployeeBatchLoader(SqliteEmployeeRepository(connection))
+    proxy = loader.proxy(21)
+    proxy.base_salary = 3500
+    assert proxy.resolve().base_salary == 3500
+    assert isinstance(proxy.resolve(), Employee)
+    assert "EmployeeProxy(id=21, loaded)" == repr(proxy)
+
+    missing = loader.proxy(999)
+    with pytest.raises(LookupError):
+        missing.name
+
+
+def test_project_team_is_lazy(connection):
+    """Test: Загрузка проектов не читает строки сотрудников"""
+    projects = SqliteProjectRepository(connection)
+    employees = SqliteEmployeeRepository(connection)
+    for project_id, member_ids in ((1, [1, 2, 21]), (2, [2, 5])):
+        project = Project(project_id, f"P{project_id}", "active")
+        for employee_id in member_ids:
+            project.add_team_member(employees.get(employee_id))
+        projects.add(project)
+
+    loaded, selects = _selects(connection, projects.get_all)
+    assert not any("FROM employees" in sql for sql in selects)
+    assert [project.status for project in loaded] == ["active", "active"]
+    team = loaded[0].get_team()
+    assert all(isinstance(member, EmployeeProxy) for member in team)
+    assert [member.id for member in team] == [1, 2, 21]
+    # Один общий сотрудник - одна ссылка
+    assert loaded[1].get_team()[0] is team[1]
+
+    total, selects = _selects(
+        connection, lambda: sum(member.calculate_salary() for member in team)
+    )
+    assert total == 4000 * 1.5 + 4001 * 1.5 + 3000
+    assert projects.loader.queries == 1
+    assert loaded[1].get_team()[1].loaded
+
+
+def test_lazy_department_pages(connection):
+    """Test: Отдел читается страницами, а не целиком"""
+    department = LazyDepartment(
+        "Разработка", "DEV", SqliteEmployeeRepository(connection), page_size=8
+    )
+    assert len(department) == 20
+
+    names, selects = _selects(connection, lambda: [emp.name for emp in department])
+    assert names == [f"Dev{i}" for i in range(20)]
+    page_queries = [sql for sql in selects if sql.startswith("SELECT id, name")]
+    assert len(page_queries) == 3
+    assert all("LIMIT" in sql for sql in page_queries)
+    assert all(emp.skills == ["Python"] for emp in department)
+
+    iterator = iter(department)
+    _, selects = _selects(connection, lambda: next(iterator))
+    assert len([sql for sql in selects if sql.startswith("SELECT id, name")]) == 1
+
+
+def test_lazy_department_add_and_get_many(connection):
+    """Test: Новые сотрудники отдела пишутся в базу, get_many разбит на пачки"""
+    repository = SqliteEmployeeRepository(connection)
+    department = LazyDepartment("Тестирование", "QA", repository)
+    newcomer = Employee(0, "Eva", "HR", 2500)
+    department.add_employee(newcomer)
+    assert newcomer.department == "QA"
+    assert len(department) == 11
+    assert department.get_employees()[-1].name == "Eva"
+
+    repository.MAX_IN_PARAMS = 4
+    found, selects = _selects(connection, lambda: repository.get_many(range(1, 12)))
+    assert sorted(found) == list(range(1, 12))
+    assert len([sql for sql in selects if sql.startswith("SELECT id, name")]) == 3
@@ -0,0 +1,108 @@
+# tests/test_parallel_loader.py
+"""
+Тесты для параллельной загрузки файлов
+
+Тестирует:
+- Объединение нескольких файлов компаний и отделов
+- Совпадение с последовательной загрузкой
+- Проверку уникальности ID между файлами
+- Ошибки проверки данных в процессах
+"""
+
+import json
+import pytest
+from source_code.part4 import (
+    Company,
+    Department,
+    Project,
+    Manager,
+    Developer,
+    Salesperson,
+    DuplicateIdError,
+)
+from source_code.parallel_loader import ParallelCompanyLoader, load_company_files
+
+
+def make_company(name, code, first_id, project_id):
+    """Вспомогательная функция: дочерняя компания с проектом"""
+    company = Company(name)
+    department = Department(f"Отдел {code}", code)
+    company.add_department(department)
+    department.add_employee(Developer(first_id, "Dev", code, 5000, ["Python"], "senior"))
+    department.add_employee(Manager(first_id + 1, "Lead", code, 6000, 500))
+    department.add_employee(Salesperson(first_id + 2, "Sales", code, 3000, 0.1, 10000))
+    project = Project(project_id, f"Проект {code}", "Описание", "2030-06-30", "active")
+    company.add_project(project)
+    project.add_team_member(department[0])
+    project.add_team_member(department[1])
+    return company
+
+
+@pytest.fixture
+def files(tmp_path):
+    """Фикстура: три файла компаний и один файл отдела"""
+    names = []
+    for index, code in enumerate(["A", "B", "C"]):
+        filename = str(tmp_path / f"company_{code}.json")
+        make_company(f"Дочка {code}", code, index * 10 + 1, 100 + index).save_to_json(filename)
+        names.append(filename)
+    department = Department("Кадры", "HR")
+    department.add_employee(Manager(50, "HR Lead", "HR", 4000, 100))
+    filename = str(tmp_path / "department_hr.json")
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump(department.to_dict(), f, ensure_ascii=False)
+    names.append(filename)
+    return names
+
+
+class TestParallelCompanyLoader:
+    """Тесты параллельной загрузки"""
+
+    def test_load_in_processes(self, files):
+        """Test: Все файлы объединяются в одну компанию"""
+        company = load_company_files(files, "Холдинг", workers=2)
+
+        assert company.name == "Холдинг"
+        assert [dept.code for dept in company.get_departments()] == ["A", "B", "C", "HR"]
+        assert len(company.get_all_employees()) == 10
+        assert company.find_project_by_id(101).get_team_size() == 2
+        assert company.find_employee_by_id(11).get_project_count() == 1
+
+    def test_matches_sequential_load(self, files):
+        """Test: Результат совпадает с разбором в текущем процессе"""
+        parallel = ParallelCompanyLoader(workers=2).load(files)
+        sequential = ParallelCompanyLoader(workers=0).load(files)
+
+        assert parallel.to_dict() == sequential.to_dict()
+        assert parallel.name == "Дочка A"
+        original = Company.load_from_json(files[1])
+        assert parallel.find_department_by_code("B").to_dict() == (
+            original.find_department_by_code("B").to_dict()
+        )
+
+    def test_duplicate_employee_across_files(self, files, tmp_path):
+        """Test: Повтор ID сотрудника в разных файлах - ошибка"""
+        filename = str(tmp_path / "company_D.json")
+        make_company("Дочка D", "D", 11, 200).save_to_json(filename)
+
+        with pytest.raises(DuplicateIdError, match="ID 11"):
+            load_company_files(files + [filename], workers=2)
+
+    def test_duplicate_project_across_files(self, files, tmp_path):
+        """Test: Повтор ID проекта в разных файлах - ошибка"""
+        filename = str(tmp_path / "company_D.json")
+        make_company("Дочка D", "D", 60, 100).save_to_json(filename)
+
+        with pytest.raises(DuplicateIdError, match="Проект с ID 100"):
+            load_company_files(files + [filename], workers=0)
+
+    def test_invalid_file_reports_name(self, files, tmp_path):
+        """Test: Ошибка проверки указывает на файл"""
+        filename = str(tmp_path / "broken.json")
+        data = make_company("Дочка E", "E", 70, 300).to_dict()
+        data["departments"][0]["employees"][0]["seniority_level"] = "guru"
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+
+        with pytest.raises(ValueError, match="broken.json"):
+            load_company_files(files + [filename], workers=2)
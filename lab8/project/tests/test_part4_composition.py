@@ -10,6 +10,7 @@
 """
 
 import pytest
+from datetime import date, datetime
 from source_code import (
     Employee,
     Manager,
@@ -50,6 +51,25 @@ class TestProjectManagement:
         
         assert proj.calculate_team_salary() == 11000
     
+    def test_project_deadline_as_of(self):
+        """Test: Сроки проекта считаются от переданного момента"""
+        proj = Project(1, "Test", "Development", "2024-12-31", "active")
+
+        assert proj.days_until_deadline(date(2024, 12, 21)) == 10
+        # Момент после полуночи - до дедлайна на день меньше
+        assert proj.days_until_deadline(datetime(2024, 12, 21, 9, 30)) == 9
+        assert not proj.is_overdue("2024-12-31")
+        assert proj.is_overdue(datetime(2024, 12, 31, 0, 1))
+
+    def test_company_budget_analysis_as_of(self):
+        """Test: Анализ просрочки использует один момент as_of"""
+        company = Company("TechCorp")
+        company.add_project(Project(1, "Old", "Описание", "2024-01-31", "active"))
+        company.add_project(Project(2, "New", "Описание", "2024-06-30", "planning"))
+
+        assert company.get_project_budget_analysis("2024-03-01")["overdue_projects"] == 1
+        assert company.get_project_budget_analysis("2024-01-01")["overdue_projects"] == 0
+
     def test_project_status_change(self):
         """Test: Изменение статуса проекта"""
         proj = Project(1, "Test", "Development", "2024-12-31")
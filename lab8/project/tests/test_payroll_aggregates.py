@@ -0,0 +1,121 @@
+# tests/test_payroll_aggregates.py
+"""
+Тесты для зарплатных сводок агрегатами SQLite
+
+Тестирует:
+- Группы GROUP BY department, type
+- Совпадение сводок с расчетом по объектам
+- Покрывающий индекс и отсутствие создания объектов
+- CompanyFacade с репозиторием и без него
+"""
+
+import sqlite3
+import pytest
+from source_code.sourcecode import (
+    Company,
+    CompanyFacade,
+    Department,
+    Employee,
+    Manager,
+    Developer,
+    Salesperson,
+    SqliteEmployeeRepository,
+    EMPLOYEE_SALARY_SQL,
+)
+
+
+def _staff():
+    manager = Manager(1, "Anna", "DEV", 7000)
+    manager.bonus = 1500
+    salesperson = Salesperson(5, "Boris", "SALES", 3000, 0.05)
+    salesperson.update_sales(20000)
+    return [
+        manager,
+        Developer(2, "Alex", "DEV", 4000, ["Python"], "senior"),
+        Developer(3, "Bella", "DEV", 3000, ["Go"], "junior"),
+        Employee(4, "Carl", "SALES", 2500),
+        salesperson,
+        Developer(6, "Dina", "SALES", 3500, ["SQL"], "middle"),
+    ]
+
+
+@pytest.fixture
+def company():
+    """Фикстура: компания с отделами DEV и SALES"""
+    company = Company("Test")
+    company.add_department(Department("Разработка", "DEV"))
+    company.add_department(Department("Продажи", "SALES"))
+    for employee in _staff():
+        company.hire_employee(employee)
+    return company
+
+
+@pytest.fixture
+def repository():
+    """Фикстура: те же сотрудники в SQLite"""
+    connection = sqlite3.connect(":memory:")
+    repository = SqliteEmployeeRepository(connection)
+    repository.add_many(_staff())
+    yield repository
+    connection.close()
+
+
+def test_payroll_by_group(repository):
+    """Test: Суммы по отделам и типам считаются формулами зарплат"""
+    groups = {
+        (dept, emp_type): (count, total)
+        for dept, emp_type, count, total in repository.payroll_by_group()
+    }
+    assert groups == {
+        ("DEV", "Manager"): (1, 8500.0),
+        ("DEV", "Developer"): (2, 11000.0),
+        ("SALES", "Employee"): (1, 2500.0),
+        ("SALES", "Salesperson"): (1, 4000.0),
+        ("SALES", "Developer"): (1, 5250.0),
+    }
+
+
+def test_summary_matches_objects(company, repository):
+    """Test: Сводка из базы совпадает с расчетом по объектам"""
+    expected = CompanyFacade(company).calculate_payroll()
+    summary = CompanyFacade(company, repository).calculate_payroll()
+    assert summary["count"] == expected["count"] == 6
+    assert summary["total"] == pytest.approx(expected["total"])
+    assert summary["average"] == pytest.approx(expected["average"])
+
+
+def test_department_stats_match_objects(company, repository):
+    """Test: Статистика отделов одинакова в базе и в памяти"""
+    in_memory = CompanyFacade(company).get_department_stats()
+    in_database = CompanyFacade(company, repository).get_department_stats()
+    assert in_database == in_memory
+    assert in_database["DEV"]["name"] == "Разработка"
+    assert in_database["SALES"]["employee_types"] == {
+        "Employee": 1,
+        "Salesperson": 1,
+        "Developer": 1,
+    }
+    assert in_database["SALES"]["avg_salary"] == pytest.approx(11750 / 3)
+
+
+def test_aggregates_use_covering_index(repository):
+    """Test: Сводка читает только покрывающий индекс"""
+    connection = repository._connection
+    query = (
+        f"EXPLAIN QUERY PLAN SELECT department, type, COUNT(*), "
+        f"SUM({EMPLOYEE_SALARY_SQL}) FROM employees GROUP BY department, type"
+    )
+    plan = " ".join(row[-1] for row in connection.execute(query))
+    assert "idx_employees_payroll" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_no_employee_objects_created(repository, monkeypatch):
+    """Test: Сводки не создают объекты сотрудников"""
+    def fail(*args, **kwargs):
+        raise AssertionError("объект сотрудника создан")
+
+    monkeypatch.setattr(SqliteEmployeeRepository, "_build", fail)
+    assert repository.payroll_summary()["count"] == 6
+    assert repository.get_department_stats()["DEV"]["employee_count"] == 3
+    assert CompanyFacade(Company("Empty")).calculate_payroll()["average"] == 0
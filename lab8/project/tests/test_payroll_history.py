@@ -0,0 +1,76 @@
+# tests/test_payroll_history.py
+"""
+Тесты для хранилища истории выплат
+
+Тестирует:
+- Запись колоночных срезов по запускам
+- Запросы итогов и динамики по отделу и типу
+- Историю зарплаты отдельного сотрудника
+"""
+
+import pytest
+from source_code.part4 import (
+    Company,
+    Department,
+    Manager,
+    Developer,
+    DuplicateIdError,
+)
+from source_code.payroll_history import PayrollHistoryStore
+
+
+@pytest.fixture
+def company():
+    """Фикстура: компания с двумя отделами"""
+    company = Company("TechCorp")
+    dev = Department("Разработка", "DEV")
+    mgmt = Department("Менеджмент", "MGMT")
+    company.add_department(dev)
+    company.add_department(mgmt)
+    dev.add_employee(Developer(1, "Alice", "DEV", 5000, ["Python"], "middle"))
+    dev.add_employee(Developer(2, "Bob", "DEV", 4000, [], "junior"))
+    mgmt.add_employee(Manager(3, "Carol", "MGMT", 6000, 1000))
+    return company
+
+
+class TestPayrollHistoryStore:
+    """Тесты хранилища истории выплат"""
+
+    def test_department_and_type_totals(self, tmp_path, company):
+        """Test: Итоги по отделу и типу за диапазон"""
+        store = PayrollHistoryStore(str(tmp_path))
+        store.append_run(company, "2024-01-31")
+        company.find_employee_by_id(2).seniority_level = "middle"
+        store.append_run(company, "2024-02-29")
+
+        assert store.totals("DEV") == [("2024-01-31", 11500), ("2024-02-29", 13500)]
+        assert store.total_payroll(emp_type="Manager") == 14000
+        assert store.total_payroll("DEV", start="2024-02-01") == 13500
+        assert store.trend("DEV")[1]["change"] == 2000
+
+    def test_employee_history(self, tmp_path, company):
+        """Test: История зарплаты сотрудника"""
+        store = PayrollHistoryStore(str(tmp_path))
+        store.append_run(company, "2024-01-31")
+        company.find_employee_by_id(3).bonus = 3000
+        store.append_run(company, "2024-02-29")
+
+        assert store.employee_history(3) == [("2024-01-31", 7000), ("2024-02-29", 9000)]
+        assert store.employee_history(999) == []
+
+    def test_reopen_and_load_run(self, tmp_path, company):
+        """Test: Индекс и срезы читаются после переоткрытия"""
+        PayrollHistoryStore(str(tmp_path)).append_run(company, "2024-01-31")
+
+        store = PayrollHistoryStore(str(tmp_path))
+        rows = store.load_run("2024-01-31")
+
+        assert store.runs() == ["2024-01-31"]
+        assert rows[2] == {"id": 3, "department": "MGMT", "type": "Manager", "salary": 7000}
+
+    def test_duplicate_run(self, tmp_path, company):
+        """Test: Повторный запуск за ту же дату запрещен"""
+        store = PayrollHistoryStore(str(tmp_path))
+        store.append_run(company, "2024-01-31")
+        with pytest.raises(DuplicateIdError):
+            store.append_run(company, "2024-01-31")
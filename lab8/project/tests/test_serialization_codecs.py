@@ -0,0 +1,117 @@
+# tests/test_serialization_codecs.py
+"""
+Тесты для кодеков сериализации сотрудников
+
+Тестирует:
+- Формат to_dict, создаваемый кодеками
+- Совпадение состояния декодированных объектов с конструктором
+- Диспетчеризацию EmployeeFactory.from_dict по реестру
+- Сохранение и загрузку компании через JSON
+"""
+
+import pytest
+from source_code.part4 import (
+    AbstractEmployee,
+    Company,
+    Department,
+    Developer,
+    Employee,
+    EmployeeFactory,
+    Manager,
+    Project,
+    Salesperson,
+)
+
+
+def sample_employees():
+    """Вспомогательная функция: по сотруднику каждого типа"""
+    return [
+        Employee(1, "Ann", "IT", 3000),
+        Manager(2, "Bob", "IT", 5000, 1000),
+        Developer(3, "Carl", "IT", 4000, ["Python", "Go"], "senior"),
+        Salesperson(4, "Dina", "Sales", 2000, 0.1, 30000),
+    ]
+
+
+@pytest.fixture
+def codec_registry():
+    """Фикстура: классы, объявленные в тесте, удаляются из реестра кодеков"""
+    registered = dict(AbstractEmployee._codecs)
+    yield
+    AbstractEmployee._codecs.clear()
+    AbstractEmployee._codecs.update(registered)
+    assert "Intern" not in AbstractEmployee._codecs
+
+
+class TestEmployeeCodecs:
+    """Тесты кодеков"""
+
+    def test_to_dict_format(self):
+        """Test: Кодек выдает прежний словарь с тем же порядком ключей"""
+        developer = sample_employees()[2]
+        project = Project(7, "AI", "Описание", "2030-01-01")
+        project.add_team_member(developer)
+
+        data = developer.to_dict()
+
+        assert list(data) == [
+            "type", "id", "name", "department", "base_salary",
+            "assigned_project_ids", "tech_stack", "seniority_level",
+        ]
+        assert data["assigned_project_ids"] == [7]
+        assert data["tech_stack"] == ["Python", "Go"]
+        data["tech_stack"].append("Rust")
+        assert developer.tech_stack == ["Python", "Go"]
+
+    def test_decoded_state_matches_constructor(self):
+        """Test: Декодированный объект не отличается от созданного конструктором"""
+        for employee in sample_employees():
+            restored = EmployeeFactory.from_dict(employee.to_dict())
+
+            assert type(restored) is type(employee)
+            assert vars(restored) == vars(employee)
+            assert restored.calculate_salary() == employee.calculate_salary()
+
+    def test_registry_and_constructor_fallback(self, codec_registry):
+        """Test: Подкласс с собственным __init__ создается через конструктор"""
+
+        class Intern(Employee):
+            def __init__(self, id, name, department, base_salary):
+                super().__init__(id, name, department, base_salary)
+                self.mentor = None
+
+        intern = Intern(5, "Eve", "IT", 1000)
+        restored = EmployeeFactory.from_dict(intern.to_dict())
+
+        assert AbstractEmployee._codecs["Intern"] is Intern._codec
+        assert not Intern._codec.direct
+        assert isinstance(restored, Intern)
+        assert restored.mentor is None
+        with pytest.raises(ValueError):
+            EmployeeFactory.from_dict({"type": "Unknown", "id": 1})
+        with pytest.raises(NotImplementedError):
+            AbstractEmployee.from_dict({"type": "Employee"})
+
+    def test_company_json_round_trip(self, tmp_path):
+        """Test: Компания сохраняется и загружается с командами проектов"""
+        company = Company("TechCorp")
+        department = Department("Разработка", "DEV")
+        company.add_department(department)
+        for employee in sample_employees():
+            department.add_employee(employee)
+        project = Project(7, "AI", "Описание", "2030-01-01", "active")
+        company.add_project(project)
+        project.add_team_member(department[2])
+        project.add_team_member(department[3])
+
+        compact = tmp_path / "compact.json"
+        pretty = tmp_path / "pretty.json"
+        company.save_to_json(str(compact), indent=None)
+        company.save_to_json(str(pretty))
+
+        for filename in (compact, pretty):
+            loaded = Company.load_from_json(str(filename))
+            assert loaded.to_dict() == company.to_dict()
+            assert loaded.find_employee_by_id(4).get_project_count() == 1
+        assert compact.stat().st_size < pretty.stat().st_size
+        assert pretty.read_text(encoding="utf-8").startswith('{\n  "name"')
@@ -0,0 +1,127 @@
+# tests/test_shard_store.py
+"""
+Тесты для хранения компании по отделам
+
+Тестирует:
+- Сохранение и загрузку каталога компании
+- Перезапись только измененных отделов
+- Восстановление команд из разных отделов
+- Удаление файлов удаленных отделов
+"""
+
+import os
+import pytest
+from source_code.part4 import (
+    Company,
+    Department,
+    Project,
+    Manager,
+    Developer,
+    Salesperson,
+)
+from source_code.shard_store import ShardedCompanyStore
+
+
+@pytest.fixture
+def company():
+    """Фикстура: компания с тремя отделами и проектом из двух отделов"""
+    company = Company("TechCorp")
+    dev = Department("Разработка", "DEV")
+    sales = Department("Продажи", "SALES")
+    hr = Department("Кадры", "HR")
+    for dept in (dev, sales, hr):
+        company.add_department(dept)
+    dev.add_employee(Developer(1, "Alice", "DEV", 5000, ["Python"], "senior"))
+    dev.add_employee(Manager(2, "Bob", "DEV", 6000, 1000))
+    sales.add_employee(Salesperson(3, "Carol", "SALES", 4000, 0.1, 20000))
+    project = Project(10, "AI", "Описание", "2030-12-31", "active")
+    company.add_project(project)
+    project.add_team_member(dev.find_employee_by_id(1))
+    project.add_team_member(sales.find_employee_by_id(3))
+    return company
+
+
+def shard_mtimes(store):
+    """Вспомогательная функция: время изменения файлов отделов"""
+    return {
+        name: os.stat(os.path.join(store.directory, name)).st_mtime_ns
+        for name in store.department_files()
+    }
+
+
+class TestShardedCompanyStore:
+    """Тесты хранилища по отделам"""
+
+    def test_round_trip(self, company, tmp_path):
+        """Test: Загрузка каталога совпадает с исходной компанией"""
+        store = ShardedCompanyStore(str(tmp_path))
+        result = store.save(company)
+
+        assert sorted(result["departments"]) == ["DEV", "HR", "SALES"]
+        assert len(store.department_files()) == 3
+
+        loaded = ShardedCompanyStore(str(tmp_path), workers=2).load()
+        assert loaded.to_dict() == company.to_dict()
+        in_process = ShardedCompanyStore(str(tmp_path), workers=0).load()
+        assert in_process.to_dict() == loaded.to_dict()
+        carol = loaded.find_employee_by_id(3)
+        assert loaded.find_project_by_id(10).get_team_size() == 2
+        assert carol.get_project_count() == 1
+
+    def test_save_rewrites_only_dirty_departments(self, company, tmp_path):
+        """Test: Повторное сохранение пишет только измененные отделы"""
+        store = ShardedCompanyStore(str(tmp_path))
+        store.save(company)
+        company.find_employee_by_id(2).bonus = 2000
+
+        assert store.dirty_departments == {"DEV"}
+        assert not store.projects_dirty
+        result = store.save()
+
+        assert result == {"departments": ["DEV"], "projects": False}
+        assert store.save() == {"departments": [], "projects": False}
+        assert ShardedCompanyStore(str(tmp_path)).load().to_dict() == company.to_dict()
+
+    def test_transfer_and_team_changes(self, company, tmp_path):
+        """Test: Перевод помечает оба отдела, смена команды - проекты"""
+        store = ShardedCompanyStore(str(tmp_path))
+        store.save(company)
+        dev = company.find_department_by_code("DEV")
+        hr = company.find_department_by_code("HR")
+        dev.transfer_employee(2, hr)
+        company.find_project_by_id(10).remove_team_member(3)
+
+        assert store.dirty_departments == {"DEV", "HR", "SALES"}
+        assert store.projects_dirty
+        store.save()
+
+        assert ShardedCompanyStore(str(tmp_path)).load().to_dict() == company.to_dict()
+
+    def test_loaded_company_is_tracked(self, company, tmp_path):
+        """Test: Загруженная компания подключается к хранилищу"""
+        ShardedCompanyStore(str(tmp_path)).save(company)
+        store = ShardedCompanyStore(str(tmp_path))
+        loaded = store.load()
+        before = shard_mtimes(store)
+        loaded.find_department_by_code("SALES").add_employee(
+            Salesperson(4, "Dan", "SALES", 3000, 0.05, 1000)
+        )
+
+        assert store.save()["departments"] == ["SALES"]
+        after = shard_mtimes(store)
+        changed = [name for name in before if before[name] != after[name]]
+        assert len(changed) <= 1
+        assert ShardedCompanyStore(str(tmp_path)).load().find_employee_by_id(4).name == "Dan"
+
+    def test_removed_department_file_deleted(self, company, tmp_path):
+        """Test: Файл удаленного отдела удаляется после записи манифеста"""
+        store = ShardedCompanyStore(str(tmp_path))
+        store.save(company)
+        company.remove_department("HR")
+        store.save()
+
+        assert len(store.department_files()) == 2
+        shard_files = [name for name in os.listdir(tmp_path) if name.startswith("department_")]
+        assert sorted(shard_files) == sorted(store.department_files())
+        with pytest.raises(FileNotFoundError):
+            ShardedCompanyStore(str(tmp_path / "empty")).load()
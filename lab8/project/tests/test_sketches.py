@@ -0,0 +1,107 @@
+# tests/test_sketches.py
+"""
+Тесты для квантильных скетчей
+
+Тестирует:
+- Точность квантилей KLL в пределах заданной погрешности
+- Объединение скетчей и сериализацию
+- Скетчи зарплат по отделам и типам сотрудников
+"""
+
+import json
+import random
+
+import pytest
+from source_code.part4 import Company, Department, Manager, Developer
+from source_code.sketches import KLLSketch, SalarySketches
+
+
+def true_rank(values, value):
+    """Вспомогательная функция: точный ранг значения"""
+    return sum(1 for v in values if v <= value) / len(values)
+
+
+class TestKLLSketch:
+    """Тесты скетча KLL"""
+
+    def test_quantiles_within_error(self):
+        """Test: Квантили в пределах погрешности ранга"""
+        rng = random.Random(7)
+        values = [rng.lognormvariate(10, 0.5) for _ in range(20000)]
+        sketch = KLLSketch.for_error(0.01, seed=1)
+        sketch.extend(values)
+
+        for q in (0.5, 0.9, 0.99):
+            assert abs(true_rank(values, sketch.quantile(q)) - q) <= 0.01
+        assert sketch.quantile(0) == min(values)
+        assert sketch.quantile(1) == max(values)
+
+    def test_memory_is_bounded(self):
+        """Test: Размер скетча не растет с числом значений"""
+        sketch = KLLSketch(64, seed=1)
+        sketch.extend(range(100000))
+
+        stored = sum(len(c) for c in sketch.to_dict()["compactors"])
+        assert sketch.count == 100000
+        assert stored < 64 * 4
+
+    def test_merge_of_serialized_shards(self):
+        """Test: Объединение сериализованных скетчей шардов"""
+        shards = []
+        for shard in range(4):
+            sketch = KLLSketch(200, seed=shard)
+            sketch.extend(range(shard * 5000, (shard + 1) * 5000))
+            shards.append(json.dumps(sketch.to_dict()))
+
+        merged = KLLSketch(200)
+        for data in shards:
+            merged.merge(KLLSketch.from_dict(json.loads(data)))
+
+        assert merged.count == 20000
+        assert abs(merged.quantile(0.5) - 10000) <= 20000 * merged.rank_error
+
+    def test_merge_requires_same_k(self):
+        """Test: Объединение скетчей с разным k запрещено"""
+        with pytest.raises(ValueError):
+            KLLSketch(100).merge(KLLSketch(200))
+
+
+class TestSalarySketches:
+    """Тесты скетчей зарплат"""
+
+    def test_percentiles_by_department_and_type(self):
+        """Test: Перцентили по отделу и типу"""
+        company = Company("TechCorp")
+        dev = Department("Разработка", "DEV")
+        company.add_department(dev)
+        for i in range(1, 101):
+            dev.add_employee(Developer(i, f"Dev{i}", "DEV", 1000 * i, [], "junior"))
+        dev.add_employee(Manager(101, "Boss", "DEV", 50000, 0))
+
+        sketches = SalarySketches()
+        sketches.add_company(company)
+
+        assert sketches.percentiles("DEV", "Manager") == {
+            "p50": 50000,
+            "p90": 50000,
+            "p99": 50000,
+        }
+        assert sketches.percentiles(emp_type="Developer")["p50"] == 50000
+        assert sorted(sketches.keys()) == [("DEV", "Developer"), ("DEV", "Manager")]
+
+    def test_csv_and_roundtrip(self, tmp_path):
+        """Test: Загрузка из CSV-экспорта и сериализация"""
+        company = Company("TechCorp")
+        dev = Department("Разработка", "DEV")
+        company.add_department(dev)
+        dev.add_employee(Manager(1, "Boss", "DEV", 5000, 1000))
+        filename = str(tmp_path / "employees.csv")
+        company.export_employees_csv(filename)
+
+        sketches = SalarySketches()
+        assert sketches.add_csv(filename) == 1
+
+        restored = SalarySketches.from_dict(json.loads(json.dumps(sketches.to_dict())))
+        restored.merge(sketches)
+        assert restored.combined().count == 2
+        assert restored.percentiles(qs=[0.5]) == {"p50": 6000}
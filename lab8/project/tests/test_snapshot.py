@@ -0,0 +1,66 @@
+# tests/test_snapshot.py
+"""
+Тесты для бинарного снимка компании
+
+Тестирует:
+- Сохранение и загрузку без потери данных
+- Восстановление команд проектов
+- Доступ к колонкам снимка
+- Обработку некорректных файлов
+"""
+
+import pytest
+from source_code.part4 import Company
+from source_code.snapshot import SnapshotFile, save_snapshot, load_snapshot
+
+
+class TestSnapshot:
+    """Тесты бинарного снимка"""
+
+    def test_roundtrip_preserves_company(self, tmp_path, sample_company):
+        """Test: Загрузка снимка восстанавливает компанию"""
+        filename = str(tmp_path / "company.snap")
+        company = sample_company
+        company.find_employee_by_id(2).base_salary = 6000.5
+        company.find_project_by_id(10).add_team_member(company.find_employee_by_id(3))
+        save_snapshot(company, filename)
+
+        loaded = load_snapshot(filename)
+
+        assert loaded.to_dict() == company.to_dict()
+        assert loaded.calculate_total_monthly_cost() == pytest.approx(
+            company.calculate_total_monthly_cost()
+        )
+        team = loaded.find_project_by_id(10).get_team()
+        assert [emp.id for emp in team] == [1, 3]
+        assert loaded.find_employee_by_id(3).get_project_count() == 1
+
+    def test_columns_are_readable_without_objects(self, tmp_path, sample_company):
+        """Test: Колонки читаются напрямую из файла"""
+        filename = str(tmp_path / "company.snap")
+        save_snapshot(sample_company, filename)
+
+        with SnapshotFile(filename) as snapshot:
+            assert snapshot.employee_count == 4
+            assert snapshot.column("emp_id").tolist() == [1, 2, 4, 3]
+            assert sum(snapshot.column("base_salary")) == 18000
+            assert snapshot.column("dept_offsets").tolist() == [0, 3, 4, 4]
+            assert snapshot.build_employee(3).name == "Carol"
+
+    def test_empty_company(self, tmp_path):
+        """Test: Снимок пустой компании"""
+        filename = str(tmp_path / "empty.snap")
+        save_snapshot(Company("Empty"), filename)
+
+        assert load_snapshot(filename).to_dict() == Company("Empty").to_dict()
+
+    def test_invalid_file_raises(self, tmp_path, sample_company):
+        """Test: Файл другого формата отклоняется"""
+        filename = tmp_path / "company.json"
+        sample_company.save_to_json(str(filename))
+
+        with pytest.raises(ValueError):
+            load_snapshot(str(filename))
+        (tmp_path / "empty.snap").write_bytes(b"")
+        with pytest.raises(ValueError):
+            load_snapshot(str(tmp_path / "empty.snap"))
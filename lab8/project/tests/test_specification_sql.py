@@ -0,0 +1,126 @@
+# tests/test_specification_sql.py
+"""
+Тесты для выполнения спецификаций в SQL
+
+Тестирует:
+- Совпадение результатов SQL и проверки в Python
+- Использование индексов зарплаты, отдела и навыков
+- Дофильтрацию пользовательских спецификаций в Python
+"""
+
+import sqlite3
+import pytest
+from source_code.sourcecode import (
+    Employee,
+    Manager,
+    Developer,
+    Salesperson,
+    Specification,
+    SalarySpecification,
+    DepartmentSpecification,
+    SkillSpecification,
+    SqliteEmployeeRepository,
+)
+
+
+class NameStartsWithSpecification(Specification):
+    """Спецификация без SQL: проверяется только в Python"""
+
+    def __init__(self, prefix):
+        self._prefix = prefix
+
+    def is_satisfied_by(self, employee):
+        return employee.name.startswith(self._prefix)
+
+
+@pytest.fixture
+def repository():
+    """Фикстура: репозиторий с сотрудниками всех типов"""
+    connection = sqlite3.connect(":memory:")
+    repository = SqliteEmployeeRepository(connection)
+    manager = Manager(0, "Anna", "IT", 7000)
+    manager.bonus = 2000
+    salesperson = Salesperson(0, "Boris", "Sales", 3000, 0.1)
+    salesperson.update_sales(40000)
+    repository.add_many(
+        [
+            manager,
+            Developer(0, "Alex", "IT", 4000, ["Python", "SQL"], "senior"),
+            Developer(0, "Bella", "IT", 4000, ["Go"], "middle"),
+            Developer(0, "Carl", "R&D", 3000, ["Python"], "junior"),
+            salesperson,
+            Employee(0, "Dina", "HR", 5000),
+        ]
+    )
+    yield repository
+    connection.close()
+
+
+def _names(employees):
+    return sorted(emp.name for emp in employees)
+
+
+def test_sql_matches_python_filtering(repository):
+    """Test: SQL возвращает тех же сотрудников, что и is_satisfied_by"""
+    specs = [
+        SalarySpecification(6000),
+        SalarySpecification(7000),
+        DepartmentSpecification("IT"),
+        SkillSpecification("Python"),
+        DepartmentSpecification("IT") & SalarySpecification(7000),
+        DepartmentSpecification("HR") | SkillSpecification("Go"),
+        (DepartmentSpecification("IT") | DepartmentSpecification("R&D"))
+        & SkillSpecification("Python"),
+    ]
+    everyone = repository.get_all()
+    for spec in specs:
+        assert spec.to_sql() is not None
+        expected = [emp.name for emp in everyone if spec.is_satisfied_by(emp)]
+        assert _names(repository.find_by_specification(spec)) == sorted(expected)
+
+
+def test_salary_formulas_in_sql(repository):
+    """Test: Зарплата в SQL считается по формулам calculate_salary"""
+    # Менеджер 9000, senior 8000, middle 6000, junior 3000, продажи 7000, HR 5000
+    spec = SalarySpecification(7000)
+    assert _names(repository.find_by_specification(spec)) == ["Alex", "Anna", "Boris"]
+
+
+def test_filters_use_indexes(repository):
+    """Test: Условия зарплаты, отдела и навыка идут по индексам"""
+    assert "idx_employees_salary" in " ".join(
+        repository.explain(SalarySpecification(5000))
+    )
+    # Отдел - первая колонка покрывающего индекса зарплатных сводок
+    assert "idx_employees_payroll (department=?)" in " ".join(
+        repository.explain(DepartmentSpecification("IT"))
+    )
+    assert "idx_employee_skills_skill" in " ".join(
+        repository.explain(SkillSpecification("Python"))
+    )
+
+
+def test_custom_specification_post_filtered(repository):
+    """Test: Пользовательская спецификация дофильтровывается в Python"""
+    spec = DepartmentSpecification("IT") & NameStartsWithSpecification("B")
+    assert spec.to_sql() is None
+    assert spec.sql_filters() == [("department = ?", ("IT",))]
+    assert "idx_employees_payroll (department=?)" in " ".join(
+        repository.explain(spec)
+    )
+    assert _names(repository.find_by_specification(spec)) == ["Bella"]
+
+    either = DepartmentSpecification("HR") | NameStartsWithSpecification("C")
+    assert either.sql_filters() == []
+    assert _names(repository.find_by_specification(either)) == ["Carl", "Dina"]
+
+
+def test_found_developers_keep_skills(repository):
+    """Test: У найденных разработчиков загружаются навыки"""
+    found = repository.find_by_specification(
+        SkillSpecification("SQL") | SkillSpecification("Go")
+    )
+    assert {emp.name: emp.skills for emp in found} == {
+        "Alex": ["Python", "SQL"],
+        "Bella": ["Go"],
+    }
@@ -0,0 +1,126 @@
+# tests/test_sqlite_repository.py
+"""
+Тесты для репозитория сотрудников в SQLite
+
+Тестирует:
+- Сохранение и чтение сотрудников всех типов
+- Пакетную вставку и upsert
+- Обновление и удаление
+- Индексы таблицы сотрудников
+"""
+
+import sqlite3
+import pytest
+from source_code.sourcecode import (
+    Employee,
+    Manager,
+    Developer,
+    Salesperson,
+    SqliteEmployeeRepository,
+    DepartmentSpecification,
+)
+
+
+@pytest.fixture
+def repository():
+    """Фикстура: репозиторий над отдельной базой в памяти"""
+    connection = sqlite3.connect(":memory:")
+    yield SqliteEmployeeRepository(connection)
+    connection.close()
+
+
+def make_staff():
+    """Вспомогательная функция: сотрудники всех типов"""
+    manager = Manager(1, "Bob", "DEV", 6000)
+    manager.bonus = 1500
+    salesperson = Salesperson(3, "Carol", "SALES", 3000, 0.1)
+    salesperson.update_sales(20000)
+    return [
+        manager,
+        Developer(2, "Alice", "DEV", 5000, ["Python", "SQL"], "senior"),
+        salesperson,
+        Employee(4, "Dan", "HR", 2500),
+    ]
+
+
+class TestSqliteEmployeeRepository:
+    """Тесты SQLite-репозитория"""
+
+    def test_round_trip_all_types(self, repository):
+        """Test: Поля подклассов сохраняются в колонках и восстанавливаются"""
+        staff = make_staff()
+        repository.add_many(staff)
+
+        loaded = repository.get_all()
+
+        assert [type(emp) for emp in loaded] == [type(emp) for emp in staff]
+        assert [emp.calculate_salary() for emp in loaded] == [
+            emp.calculate_salary() for emp in staff
+        ]
+        assert repository.get(2).skills == ["Python", "SQL"]
+        assert repository.get(1).bonus == 1500
+        assert repository.get(99) is None
+
+    def test_auto_id_and_duplicates(self, repository):
+        """Test: ID 0 назначается автоматически, повтор ID - ошибка"""
+        repository.add_many(make_staff())
+        new_employee = Employee(0, "Eve", "HR", 2000)
+        repository.add(new_employee)
+
+        assert new_employee.id == 5
+        assert repository.count() == 5
+        with pytest.raises(sqlite3.IntegrityError):
+            repository.add(Employee(1, "Copy", "HR", 1000))
+        assert repository.count() == 5
+
+    def test_upsert_and_update(self, repository):
+        """Test: upsert обновляет существующих и добавляет новых"""
+        repository.add_many(make_staff())
+        developer = Developer(2, "Alice", "OPS", 5500, ["Go"], "middle")
+
+        repository.upsert_many([developer, Employee(10, "Finn", "HR", 1800)])
+
+        loaded = repository.get(2)
+        assert (loaded.department, loaded.skills, loaded.seniority) == ("OPS", ["Go"], "middle")
+        assert repository.count() == 5
+        assert repository.update(Employee(4, "Dan", "QA", 2600))
+        assert repository.get(4).department == "QA"
+        assert not repository.update(Employee(42, "Nobody", "QA", 1))
+
+    def test_update_is_one_transaction(self, repository):
+        """Test: update проверяет и записывает сотрудника одной транзакцией"""
+        repository.add_many(make_staff())
+        statements = []
+        connection = repository._connection
+        connection.set_trace_callback(statements.append)
+        try:
+            assert repository.update(Employee(4, "Dan", "QA", 2600))
+        finally:
+            connection.set_trace_callback(None)
+        assert statements[0] == "BEGIN IMMEDIATE"
+        assert statements[1].startswith("SELECT 1 FROM employees")
+        assert statements[-1] == "COMMIT"
+        assert statements.count("COMMIT") == 1
+        assert "BEGIN " not in statements
+
+    def test_delete_and_specification(self, repository):
+        """Test: Удаление и фильтрация по спецификации"""
+        repository.add_many(make_staff())
+
+        assert repository.delete(2)
+        assert not repository.delete(2)
+        found = repository.find_by_specification(DepartmentSpecification("DEV"))
+        assert [emp.id for emp in found] == [1]
+        connection = repository._connection
+        assert connection.execute("SELECT COUNT(*) FROM employee_skills").fetchone()[0] == 0
+
+    def test_indexes_exist(self, repository):
+        """Test: Индексы по отделу и типу созданы"""
+        indexes = {
+            row[0]
+            for row in repository._connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+
+        assert {"idx_employees_payroll", "idx_employees_type"} <= indexes
@@ -0,0 +1,127 @@
+# tests/test_sqlite_snapshot.py
+"""
+Тесты для снимка компании в SQLite
+
+Тестирует:
+- Загрузку компании в базу в памяти для SQL-запросов
+- Сохранение в файл и загрузку через backup API без потери данных
+- Восстановление команд проектов
+- Обработку некорректных файлов
+"""
+
+import sqlite3
+import pytest
+from source_code.part4 import Company, Department, Employee, Developer
+
+
+class TestSqliteSnapshot:
+    """Тесты снимка компании в SQLite"""
+
+    def test_in_memory_database_for_queries(self, sample_company):
+        """Test: Копия компании в памяти доступна для SQL-запросов"""
+        connection = sample_company.to_sqlite_connection()
+        try:
+            rows = connection.execute(
+                "SELECT department, type, COUNT(*) FROM employees "
+                "GROUP BY department, type ORDER BY department, type"
+            ).fetchall()
+            skilled = connection.execute(
+                "SELECT e.name FROM employees e JOIN developer_skills s "
+                "ON s.employee_position = e.position WHERE s.skill = 'SQL'"
+            ).fetchall()
+            plan = " ".join(
+                row[-1]
+                for row in connection.execute(
+                    "EXPLAIN QUERY PLAN SELECT * FROM developer_skills "
+                    "WHERE skill = 'SQL'"
+                )
+            )
+        finally:
+            connection.close()
+
+        assert rows == [
+            ("DEV", "Developer", 1),
+            ("DEV", "Employee", 1),
+            ("DEV", "Manager", 1),
+            ("SALES", "Salesperson", 1),
+        ]
+        assert skilled == [("Алиса",)]
+        assert "idx_developer_skills_skill" in plan
+
+    def test_file_roundtrip_preserves_company(self, tmp_path, sample_company):
+        """Test: Сохранение в файл и загрузка восстанавливают компанию"""
+        filename = str(tmp_path / "company.db")
+        company = sample_company
+        company.find_employee_by_id(2).base_salary = 6000.5
+        company.find_department_by_code("SALES").add_employee(
+            Developer(5, "Dan", "SALES", 3500, [], "junior")
+        )
+        company.to_sqlite(filename)
+
+        loaded = Company.from_sqlite(filename)
+
+        assert loaded.to_dict() == company.to_dict()
+        assert loaded.calculate_total_monthly_cost() == pytest.approx(
+            company.calculate_total_monthly_cost()
+        )
+        assert [dept.code for dept in loaded.get_departments()] == [
+            "DEV",
+            "SALES",
+            "EMPTY",
+        ]
+        developer = loaded.find_employee_by_id(1)
+        assert isinstance(developer, Developer)
+        assert developer.tech_stack == ["Python", "SQL"]
+        assert loaded.find_employee_by_id(5).tech_stack == []
+
+    def test_project_teams_restored(self, tmp_path, sample_company):
+        """Test: Команды проектов связаны с загруженными сотрудниками"""
+        filename = str(tmp_path / "company.db")
+        sample_company.find_project_by_id(10).add_team_member(
+            sample_company.find_employee_by_id(3)
+        )
+        sample_company.to_sqlite(filename)
+
+        loaded = Company.from_sqlite(filename)
+
+        team = loaded.find_project_by_id(10).get_team()
+        assert [emp.id for emp in team] == [1, 3]
+        assert team[0] is loaded.find_employee_by_id(1)
+        assert team[0].get_project_count() == 1
+        assert loaded.find_project_by_id(11).get_team_size() == 0
+        assert loaded.find_project_by_id(10).status == "active"
+
+    def test_overwrite_and_file_database_is_queryable(self, tmp_path, sample_company):
+        """Test: Повторное сохранение перезаписывает файл целиком"""
+        filename = str(tmp_path / "company.db")
+        sample_company.to_sqlite(filename)
+        smaller = Company("Small")
+        smaller.add_department(Department("Один", "ONE"))
+        smaller.get_departments()[0].add_employee(Employee(7, "Zoe", "ONE", 100))
+        smaller.to_sqlite(filename)
+
+        connection = sqlite3.connect(filename)
+        try:
+            count = connection.execute("SELECT COUNT(*) FROM employees").fetchone()
+            name = connection.execute("SELECT name FROM company").fetchone()
+        finally:
+            connection.close()
+        assert count == (1,)
+        assert name == ("Small",)
+        assert Company.from_sqlite(filename).to_dict() == smaller.to_dict()
+
+    def test_invalid_files(self, tmp_path):
+        """Test: Отсутствующий файл и пустая база дают понятные ошибки"""
+        with pytest.raises(FileNotFoundError):
+            Company.from_sqlite(str(tmp_path / "missing.db"))
+
+        empty = str(tmp_path / "empty.db")
+        sqlite3.connect(empty).close()
+        with pytest.raises(sqlite3.OperationalError):
+            Company.from_sqlite(empty)
+
+        connection = Company("Empty").to_sqlite_connection()
+        connection.execute("DELETE FROM company")
+        with pytest.raises(ValueError):
+            Company.from_sqlite_connection(connection)
+        connection.close()
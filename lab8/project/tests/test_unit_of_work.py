@@ -0,0 +1,144 @@
+# tests/test_unit_of_work.py
+"""
+Тесты для Unit of Work с картой идентичности
+
+Тестирует:
+- Карту идентичности
+- Запись новых, измененных и удаленных объектов одной транзакцией
+- Откат изменений в памяти и в базе
+"""
+
+import sqlite3
+import pytest
+from source_code.sourcecode import (
+    Employee,
+    Manager,
+    Developer,
+    EmployeeRepository,
+    SqliteEmployeeRepository,
+    UnitOfWork,
+)
+
+
+@pytest.fixture
+def repository():
+    """Фикстура: репозиторий с тремя сотрудниками"""
+    connection = sqlite3.connect(":memory:")
+    repository = SqliteEmployeeRepository(connection)
+    repository.add_many(
+        [
+            Employee(0, "Anna", "HR", 3000),
+            Developer(0, "Alex", "IT", 4000, ["Python"], "middle"),
+            Manager(0, "Boris", "IT", 6000),
+        ]
+    )
+    yield repository
+    connection.close()
+
+
+def test_identity_map_returns_same_object(repository):
+    """Test: Повторное чтение возвращает тот же объект"""
+    uow = UnitOfWork(repository)
+    first = uow.get(2)
+    assert first is uow.get(2)
+    assert first.skills == ["Python"]
+    assert uow.get(99) is None
+    assert not uow.has_changes
+
+
+def test_commit_flushes_in_one_transaction(repository):
+    """Test: Все изменения записываются одной транзакцией"""
+    connection = repository._connection
+    statements = []
+    connection.set_trace_callback(statements.append)
+
+    uow = UnitOfWork(repository)
+    anna = uow.get(1)
+    anna.base_salary = 3500
+    uow.register_dirty(anna)
+    uow.register_dirty(anna)
+    uow.register_removed(uow.get(3))
+    newcomer = Developer(0, "Dina", "IT", 5000, ["Go", "SQL"], "senior")
+    uow.register_new(newcomer)
+
+    assert uow.commit() == {"new": 1, "dirty": 1, "removed": 1}
+    connection.set_trace_callback(None)
+
+    assert sum(1 for sql in statements if sql == "BEGIN ") == 1
+    assert newcomer.id == 4
+    assert repository.get(1).base_salary == 3500
+    assert repository.get(3) is None
+    assert repository.get(4).skills == ["Go", "SQL"]
+    assert uow.get(4) is newcomer
+    assert not uow.has_changes
+
+
+def test_rollback_restores_objects(repository):
+    """Test: Откат возвращает состояние объектов и ничего не пишет"""
+    uow = UnitOfWork(repository)
+    alex = uow.get(2)
+    alex.name = "Alexander"
+    alex.base_salary = 9000
+    uow.register_dirty(alex)
+    uow.register_new(Employee(0, "Eva", "HR", 2000))
+    uow.register_removed(uow.get(1))
+
+    uow.rollback()
+
+    assert alex.name == "Alex" and alex.base_salary == 4000
+    assert uow.get(1) is not None
+    assert not uow.has_changes
+    assert repository.count() == 3
+    assert repository.get(2).name == "Alex"
+
+
+def test_failed_commit_rolls_back_database(repository):
+    """Test: Ошибка при записи откатывает транзакцию целиком"""
+    uow = UnitOfWork(repository)
+    anna = uow.get(1)
+    anna.base_salary = 4000
+    uow.register_dirty(anna)
+    newcomer = Employee(0, "Eva", "HR", 2000)
+    uow.register_new(newcomer)
+    # Сотрудник с занятым ID нарушит первичный ключ
+    uow.register_new(Employee(2, "Clone", "IT", 1000))
+
+    with pytest.raises(sqlite3.IntegrityError):
+        uow.commit()
+    assert newcomer.id == 0
+    assert repository.get(1).base_salary == 3000
+    assert repository.count() == 3
+
+    uow.rollback()
+    assert anna.base_salary == 3000
+
+
+def test_missing_dirty_employee_rolls_back(repository):
+    """Test: Измененный сотрудник, которого нет в базе, - ошибка без записи"""
+    with pytest.raises(LookupError, match="42"):
+        repository.save_changes(
+            [Employee(0, "Eva", "HR", 2000)],
+            [Developer(42, "Ghost", "IT", 1000, ["Py"], "junior")],
+            [],
+        )
+    connection = repository._connection
+    skills = connection.execute(
+        "SELECT * FROM employee_skills WHERE employee_id = 42"
+    ).fetchall()
+    assert skills == []
+    assert repository.count() == 3
+
+
+def test_context_manager_and_memory_repository():
+    """Test: with фиксирует изменения, работает и с EmployeeRepository"""
+    repository = EmployeeRepository()
+    with UnitOfWork(repository) as uow:
+        uow.register_new(Employee(0, "Anna", "HR", 3000))
+        uow.register_new(Employee(0, "Boris", "IT", 4000))
+    assert [emp.name for emp in repository.get_all()] == ["Anna", "Boris"]
+
+    with pytest.raises(RuntimeError):
+        with UnitOfWork(repository) as uow:
+            uow.register_new(Employee(0, "Eva", "HR", 2000))
+            raise RuntimeError("отмена")
+    assert len(repository.get_all()) == 2